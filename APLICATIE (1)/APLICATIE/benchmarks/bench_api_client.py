@@ -0,0 +1,68 @@
+"""
+Benchmark: cereri către API-ul extern, fără pool / cu pool / în paralel
+
+Rulează pe serverul stub local (tests/http_standin.py), cu o întârziere
+per cerere care simulează latența rețelei. Compară requests.get() pentru
+fiecare cerere (o conexiune nouă de fiecare dată), APIClient secvențial
+(conexiuni keep-alive) și APIClient.fetch_concurrent(), apoi comentariile
+a 100 de postări cerute per postare (N+1) față de fetch_comments_bulk().
+
+Rulare:
+    python benchmarks/bench_api_client.py [--calls 150] [--delay 0.005] [--workers 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.api_client import APIClient  # noqa: E402
+from tests.http_standin import StubAPI  # noqa: E402
+
+
+def bench(label: str, api: StubAPI, call) -> None:
+    requests_before, connections_before = api.requests, api.connections
+    start = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - start
+    calls = api.requests - requests_before
+    print(f"{label:<32} {elapsed * 1000:8.1f} ms  {elapsed / calls * 1e3:6.2f} ms/cerere  "
+          f"{api.connections - connections_before:4d} conexiuni")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=150)
+    parser.add_argument('--delay', type=float, default=0.005)
+    parser.add_argument('--workers', type=int, default=10)
+    args = parser.parse_args()
+
+    with StubAPI(delay=args.delay) as api:
+        paths = [f'/posts/{n % 100 + 1}/comments' for n in range(args.calls)]
+        print(f"{args.calls} cereri, întârziere server {args.delay * 1000:.1f} ms")
+
+        def unpooled():
+            for path in paths:
+                requests.get(api.url + path, timeout=10).json()
+
+        with APIClient(api.url, pool_size=args.workers) as client:
+            bench('requests.get', api, unpooled)
+            bench('APIClient secvențial', api, lambda: [client._get_json(path) for path in paths])
+            bench(f'fetch_concurrent ({args.workers} fire)', api,
+                  lambda: list(client.fetch_concurrent(paths)))
+
+            post_ids = range(1, 101)
+            print("comentariile a 100 de postări")
+            bench('fetch_comments (N+1)', api, lambda: [client.fetch_comments(n) for n in post_ids])
+            bench('fetch_comments_bulk', api, lambda: client.fetch_comments_bulk(post_ids))
+            client.multi_filter = api.multi_filter = False
+            bench('fetch_comments_bulk (per post)', api,
+                  lambda: client.fetch_comments_bulk(post_ids))
+
+
+if __name__ == '__main__':
+    main()
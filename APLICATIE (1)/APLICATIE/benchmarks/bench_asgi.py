@@ -0,0 +1,131 @@
+"""
+Benchmark: server sync (Werkzeug, thread per conexiune) vs async (uvicorn + ASGI)
+
+Fiecare client simulat pornește un joc și trimite ghiciri, cu o conexiune
+nouă per cerere. Serverele rulează în procese separate de generatorul de
+încărcare. Varianta async necesită uvicorn (pip install uvicorn).
+
+Rulare:
+    python benchmarks/bench_asgi.py [--connections 50 200 1000] [--requests 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'sync': (
+        "from werkzeug.serving import run_simple\n"
+        "from src.hangman_3d import create_app\n"
+        "run_simple('127.0.0.1', {port}, create_app('testing'), threaded=True)\n"
+    ),
+    'async': (
+        "import uvicorn\n"
+        "from src.hangman_3d.asgi import create_asgi_app\n"
+        "uvicorn.run(create_asgi_app('testing'), host='127.0.0.1', port={port},\n"
+        "            log_level='warning', backlog=4096)\n"
+    ),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind: str, port: int) -> subprocess.Popen:
+    process = subprocess.Popen([sys.executable, '-c', SERVERS[kind].format(port=port)],
+                               cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"Serverul {kind} nu a pornit")
+
+
+async def request(port: int, path: str, payload: dict, cookie: str = ''):
+    """O cerere POST pe o conexiune nouă; returnează (status, corp, cookie)"""
+    body = json.dumps(payload).encode()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        f"{'Cookie: ' + cookie + chr(13) + chr(10) if cookie else ''}\r\n".encode() + body
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    for line in head.split(b'\r\n'):
+        if line.lower().startswith(b'set-cookie:'):
+            cookie = line.split(b':', 1)[1].split(b';')[0].strip().decode()
+    return status, data, cookie
+
+
+async def client(port: int, guesses: int, latencies: list, errors: list) -> None:
+    """Un jucător: /start_game urmat de `guesses` ghiciri"""
+    try:
+        start = time.perf_counter()
+        _, _, cookie = await request(port, '/start_game', {})
+        latencies.append(time.perf_counter() - start)
+        for letter in 'ETAOINSHRDLU'[:guesses]:
+            start = time.perf_counter()
+            status, _, _ = await request(port, '/guess', {'letter': letter}, cookie)
+            latencies.append(time.perf_counter() - start)
+            if status >= 500:
+                errors.append(status)
+    except OSError as e:
+        errors.append(e)
+
+
+async def load(port: int, connections: int, guesses: int):
+    latencies: list = []
+    errors: list = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, guesses, latencies, errors) for _ in range(connections)))
+    return time.perf_counter() - start, sorted(latencies), errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--connections', type=int, nargs='+', default=[50, 200, 1000])
+    parser.add_argument('--requests', type=int, default=5, help='Ghiciri per client')
+    args = parser.parse_args()
+
+    kinds = ['sync', 'async']
+    try:
+        import uvicorn  # noqa: F401
+    except ImportError:
+        print("uvicorn nu este instalat: se măsoară doar serverul sync")
+        kinds = ['sync']
+
+    print(f"{'server':>6} {'clients':>8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for kind in kinds:
+        port = free_port()
+        process = start_server(kind, port)
+        try:
+            for connections in args.connections:
+                seconds, latencies, errors = asyncio.run(load(port, connections, args.requests))
+                p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+                p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0
+                print(f"{kind:>6} {connections:>8} {len(latencies) / seconds:>9.0f} "
+                      f"{p50:>8.1f} {p99:>8.1f} {len(errors):>7}")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
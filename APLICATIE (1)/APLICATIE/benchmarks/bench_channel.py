@@ -0,0 +1,86 @@
+"""
+Benchmark: costul unei ghiciri prin POST /guess vs un cadru pe canalul WebSocket
+
+Pornește aplicația ASGI sub uvicorn și măsoară latența per acțiune pentru
+jocuri complete. Necesită uvicorn și websockets (pip install uvicorn websockets).
+
+Rulare:
+    python benchmarks/bench_channel.py [--games 200]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_asgi import free_port, request, start_server  # noqa: E402
+
+LETTERS = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+
+async def http_game(port: int, latencies: list) -> None:
+    """Un joc complet cu o cerere HTTP per ghicire"""
+    _, body, cookie = await request(port, '/start_game', {})
+    for letter in LETTERS:
+        start = time.perf_counter()
+        _, body, _ = await request(port, '/guess', {'letter': letter}, cookie)
+        latencies.append(time.perf_counter() - start)
+        if json.loads(body).get('game_over'):
+            return
+
+
+async def websocket_game(port: int, latencies: list) -> None:
+    """Un joc complet cu un cadru per ghicire pe aceeași conexiune"""
+    import websockets
+
+    _, body, _ = await request(port, '/start_game', {})
+    game_id = json.loads(body)['game_id']
+    async with websockets.connect(f'ws://127.0.0.1:{port}/ws?game_id={game_id}') as ws:
+        await ws.recv()
+        for letter in LETTERS:
+            start = time.perf_counter()
+            await ws.send(json.dumps({'type': 'guess', 'letter': letter}))
+            frame = json.loads(await ws.recv())
+            latencies.append(time.perf_counter() - start)
+            if frame.get('game_over'):
+                return
+
+
+def report(name: str, latencies: list, seconds: float) -> None:
+    latencies.sort()
+    print(f"{name:>9} {len(latencies):>8} {len(latencies) / seconds:>9.0f} "
+          f"{statistics.median(latencies) * 1e3:>8.2f} "
+          f"{latencies[int(len(latencies) * 0.99) - 1] * 1e3:>8.2f}")
+
+
+async def run(port: int, games: int) -> None:
+    print(f"{'transport':>9} {'actions':>8} {'act/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, game in (('http', http_game), ('websocket', websocket_game)):
+        latencies: list = []
+        start = time.perf_counter()
+        for _ in range(games):
+            await game(port, latencies)
+        report(name, latencies, time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--games', type=int, default=200)
+    args = parser.parse_args()
+
+    port = free_port()
+    process = start_server('async', port)
+    try:
+        asyncio.run(run(port, args.games))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark: clasificarea vectorizată a unui milion de cuvinte
+
+Rulare:
+    python benchmarks/bench_classifier.py [--words 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.dictionary.classifier import classify, score_words  # noqa: E402
+
+LETTERS = 'EEEEEEAAAAARRRRIIIIOOOOTTTTNNNSSSLLCCUUDPMHGBFYWKVXZJQ'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--words', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(1)
+    words = [''.join(rnd.choice(LETTERS) for _ in range(rnd.randint(3, 16)))
+             for _ in range(args.words)]
+
+    start = time.perf_counter()
+    score_words(words)
+    print(f"score_words: {time.perf_counter() - start:.2f}s for {len(words)} words")
+
+    start = time.perf_counter()
+    buckets = classify(words)
+    summary = ", ".join(f"{d}={len(w)}" for d, w in buckets.items())
+    print(f"classify (normalize + dedupe + score + bucket): "
+          f"{time.perf_counter() - start:.2f}s ({summary})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: dicționar mare — timp de construire/încărcare, alegere aleatoare
+și memoria (RSS privat vs partajat) în procese worker create prin fork
+
+Rulare:
+    python benchmarks/bench_dictionary.py [--words 1000000] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.dictionary import WordDictionary, DIFFICULTIES  # noqa: E402
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def synthetic_words(count: int, seed: int = 1) -> dict:
+    """Cuvinte aleatoare, împărțite pe niveluri după lungime"""
+    rnd = random.Random(seed)
+    buckets = {difficulty: [] for difficulty in DIFFICULTIES}
+    for _ in range(count):
+        length = rnd.randint(3, 16)
+        word = ''.join(rnd.choice(LETTERS) for _ in range(length))
+        buckets[DIFFICULTIES[min(3, (length - 3) // 4)]].append(word)
+    return buckets
+
+
+def _rss_kib() -> dict:
+    """Memoria procesului curent din /proc/self/smaps_rollup (KiB)"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ('Rss:', 'Shared_Clean:', 'Shared_Dirty:', 'Private_Clean:', 'Private_Dirty:'):
+                values[parts[0].rstrip(':')] = int(parts[1])
+    return values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--words', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    words = synthetic_words(args.words)
+    path = os.path.join(tempfile.mkdtemp(), 'words.dict')
+
+    start = time.perf_counter()
+    size = WordDictionary.write(path, words)
+    print(f"build+write: {time.perf_counter() - start:.2f}s, {size / 2**20:.1f} MiB")
+
+    start = time.perf_counter()
+    dictionary = WordDictionary.load(path)
+    print(f"load (mmap): {(time.perf_counter() - start) * 1000:.2f} ms, {len(dictionary)} words")
+
+    rnd = random.Random(2)
+    start = time.perf_counter()
+    for _ in range(200_000):
+        dictionary.random_id('mediu', rnd)
+    per_pick = (time.perf_counter() - start) / 200_000
+    print(f"random_id: {per_pick * 1e9:.0f} ns/pick")
+
+    if not hasattr(os, 'fork') or not os.path.exists('/proc/self/smaps_rollup'):
+        return
+
+    # Fiecare worker citește tot dicționarul; paginile rămân partajate
+    children = []
+    for _ in range(args.workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            sum(dictionary.word_length(i) for i in range(0, len(dictionary), 7))
+            dictionary.index_of(dictionary[len(dictionary) // 2])
+            rss = _rss_kib()
+            os.write(write_fd, json.dumps(rss).encode())
+            os._exit(0)
+        os.close(write_fd)
+        children.append((pid, read_fd))
+
+    for pid, read_fd in children:
+        with os.fdopen(read_fd) as f:
+            rss = json.loads(f.read())
+        os.waitpid(pid, 0)
+        print(f"worker {pid}: rss={rss['Rss'] / 1024:.1f} MiB "
+              f"shared={(rss['Shared_Clean'] + rss['Shared_Dirty']) / 1024:.1f} MiB "
+              f"private={(rss['Private_Clean'] + rss['Private_Dirty']) / 1024:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: memorie ocupată per sesiune de joc
+
+Măsoară (cu tracemalloc) octeții alocați pentru N stări GameState vii,
+singure și înregistrate în MemorySessionStore.
+
+Rulare:
+    python benchmarks/bench_game_memory.py [--sizes 100000 1000000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.models import GameState  # noqa: E402
+from src.hangman_3d.sessions import MemorySessionStore  # noqa: E402
+
+DIFFICULTIES = ['usor', 'mediu', 'greu', 'expert']
+
+
+def _measure(build) -> int:
+    """Returnează octeții rămași alocați după apelul build()"""
+    gc.collect()
+    tracemalloc.start()
+    keep = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    gc.collect()
+    return current
+
+
+def games_only(count: int) -> int:
+    rnd = random.Random(1)
+    return _measure(lambda: [GameState(rnd.choice(DIFFICULTIES)) for _ in range(count)])
+
+
+def games_in_store(count: int) -> int:
+    rnd = random.Random(1)
+
+    def build():
+        store = MemorySessionStore(max_sessions=count)
+        for _ in range(count):
+            game = GameState(rnd.choice(DIFFICULTIES))
+            game.guess_letter(rnd.choice('AEIOU'))
+            store.create(game)
+        return store
+
+    return _measure(build)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'games':>10} {'GameState B/game':>18} {'in store B/game':>17} {'store total MiB':>16}")
+    for count in args.sizes:
+        state_bytes = games_only(count)
+        store_bytes = games_in_store(count)
+        print(f"{count:>10} {state_bytes / count:>18.1f} {store_bytes / count:>17.1f} "
+              f"{store_bytes / 2**20:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
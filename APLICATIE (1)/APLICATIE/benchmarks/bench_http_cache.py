@@ -0,0 +1,82 @@
+"""
+Benchmark: cache-ul HTTP al clientului API
+
+Pe serverul stub local (tests/http_standin.py), cu o întârziere per cerere,
+repetă aceleași cereri fără cache, cu cache gol, cu revalidare (304) și cu
+răspunsuri proaspete din cache. Măsoară separat costul citirii corpului:
+json.loads față de pickle.loads pentru forma parsată din cache.
+
+Rulare:
+    python benchmarks/bench_http_cache.py [--records 5000] [--delay 0.02]
+"""
+
+import argparse
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.api_client import APIClient  # noqa: E402
+from src.hangman_3d.http_cache import ResponseCache  # noqa: E402
+from tests.http_standin import StubAPI, make_dataset  # noqa: E402
+
+
+def per_call(function, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=5000)
+    parser.add_argument('--delay', type=float, default=0.02)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = make_dataset(posts=args.records, users=10, comments_per_post=1)
+    paths = [f'/posts?_limit={args.records}', '/users'] + [
+        f'/posts/{n}/comments' for n in range(1, 21)]
+
+    with StubAPI(data, delay=args.delay) as api, tempfile.TemporaryDirectory() as directory:
+        print(f"{len(paths)} cereri (una cu {args.records} postări), "
+              f"întârziere server {args.delay * 1000:.0f} ms")
+
+        def run(label, client, rounds=3):
+            requests_before = api.requests
+            elapsed = min(per_call(lambda: [client._get_json(path) for path in paths], 1)
+                          for _ in range(rounds))
+            print(f"{label:<22} {elapsed * 1000:8.1f} ms  "
+                  f"{(api.requests - requests_before) / rounds:5.0f} cereri/rulare")
+
+        with APIClient(api.url) as client:
+            run('fără cache', client)
+
+        path = os.path.join(directory, 'http.sqlite3')
+        with APIClient(api.url, cache=ResponseCache(path)) as client:
+            run('cache gol', client, rounds=1)
+            run('revalidare (304)', client)
+        with APIClient(api.url, cache=ResponseCache(path, default_ttl=3600)) as client:
+            run('proaspăt din cache', client)
+            cache = client.cache
+            print(f"cache: {len(cache)} intrări, {cache.size() / 1e3:.0f} kB")
+
+        body = json.dumps(data['posts']).encode()
+        parsed = pickle.dumps(data['posts'], protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = zlib.compress(body, 6)
+        print(f"corp {len(body) / 1e3:.0f} kB, comprimat {len(compressed) / 1e3:.0f} kB")
+        print(f"json.loads               {per_call(lambda: json.loads(body)) * 1e3:7.2f} ms")
+        print(f"decompress + json.loads  "
+              f"{per_call(lambda: json.loads(zlib.decompress(compressed))) * 1e3:7.2f} ms")
+        print(f"pickle.loads             {per_call(lambda: pickle.loads(parsed)) * 1e3:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
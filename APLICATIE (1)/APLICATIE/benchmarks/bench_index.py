@@ -0,0 +1,59 @@
+"""
+Benchmark: costul servirii paginii principale
+
+Compară randarea șablonului la fiecare cerere (comportamentul vechi) cu
+pagina precompilată și precomprimată, pentru un vizitator nou (200 gzip)
+și unul care revine (304).
+
+Rulare:
+    python benchmarks/bench_index.py [--requests 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import render_template  # noqa: E402
+
+from src.hangman_3d import create_app  # noqa: E402
+
+
+def measure(name: str, func, requests: int, size: int) -> None:
+    start = time.perf_counter()
+    for _ in range(requests):
+        func()
+    per_request = (time.perf_counter() - start) / requests * 1e6
+    print(f"{name:<28} {per_request:>9.1f} {size:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    # Ruta veche, pentru comparație: randare la fiecare cerere, fără compresie
+    app.add_url_rule('/old', 'old_index', lambda: render_template('index.html'))
+    client = app.test_client()
+    page = app.extensions['index_page']
+    etag = dict(page.respond('gzip')[2])['ETag']
+
+    print(f"{'scenario':<28} {'µs/req':>9} {'bytes':>9}")
+    measure('GET / render per request (old)', lambda: client.get('/old'),
+            args.requests, len(page.body))
+    measure('GET / identity', lambda: client.get('/'), args.requests, len(page.body))
+    measure('GET / gzip', lambda: client.get('/', headers={'Accept-Encoding': 'gzip'}),
+            args.requests, len(page.variants['gzip']))
+    if 'br' in page.variants:
+        measure('GET / br', lambda: client.get('/', headers={'Accept-Encoding': 'br'}),
+                args.requests, len(page.variants['br']))
+    measure('GET / If-None-Match (304)',
+            lambda: client.get('/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag}),
+            args.requests, 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: serializarea JSON a răspunsurilor de joc
+
+Compară json (biblioteca standard) cu json_provider (orjson) pe un răspuns
+/guess tipic, corpurile de eroare precalculate cu cele serializate la
+fiecare cerere și POST /guess prin Flask cu provider-ul implicit vs cel rapid.
+Fiecare /guess cronometrat este o ghicire reușită (200): literele se iau pe
+rând, iar la sfârșitul unui joc se pornește altul, în afara cronometrării.
+
+Rulare:
+    python benchmarks/bench_json.py [--repeat 200000]
+"""
+
+import argparse
+import json
+import os
+import string
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+from src.hangman_3d import create_app, json_provider  # noqa: E402
+from src.hangman_3d.models import GameState  # noqa: E402
+from src.hangman_3d.routes import actions  # noqa: E402
+
+
+def guess_payload() -> dict:
+    game = GameState('mediu')
+    game.guess_letter('E')
+    return game.guess_letter('A')
+
+
+def per_call(stmt, repeat: int) -> float:
+    """Microsecunde per apel (cel mai bun din 3 rulări)"""
+    return min(timeit.repeat(stmt, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def flask_guess(provider: bool, requests: int) -> float:
+    """Microsecunde per POST /guess reușit (cel mai bun din 3 rulări)"""
+    app = create_app('testing')
+    if not provider:
+        app.json = DefaultJSONProvider(app)
+    client = app.test_client()
+
+    def run() -> float:
+        elapsed = 0.0
+        game_id, letters = None, iter(())
+        for _ in range(requests):
+            letter = next(letters, None)
+            if letter is None:
+                game_id = client.post('/start_game', json={}).get_json()['game_id']
+                letters = iter(string.ascii_uppercase)
+                letter = next(letters)
+            start = time.perf_counter()
+            response = client.post('/guess', json={'game_id': game_id, 'letter': letter})
+            elapsed += time.perf_counter() - start
+            assert response.status_code == 200, response.get_json()
+            if response.get_json().get('game_over'):
+                letters = iter(())
+        return elapsed
+
+    return min(run() for _ in range(3)) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200000)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    payload = guess_payload()
+    error = dict(actions.NO_GAME)
+    print(f"{'caz':<34} {'us/apel':>9}")
+    rows = [
+        ('guess: json.dumps', lambda: json.dumps(payload).encode()),
+        ('guess: json_provider.dumps', lambda: json_provider.dumps(payload)),
+        ('eroare: serializată la cerere', lambda: json.dumps(error).encode()),
+        ('eroare: ConstantPayload', lambda: json_provider.dumps(actions.NO_GAME)),
+    ]
+    for name, stmt in rows:
+        print(f"{name:<34} {per_call(stmt, args.repeat):>9.3f}")
+    for name, provider in (('flask /guess: DefaultJSONProvider', False),
+                           ('flask /guess: FastJSONProvider', True)):
+        print(f"{name:<34} {flask_guess(provider, args.requests):>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
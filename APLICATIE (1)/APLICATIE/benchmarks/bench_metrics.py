@@ -0,0 +1,50 @@
+"""
+Benchmark: costul instrumentării per cerere
+
+Măsoară Metrics.observe() izolat și POST /guess prin Flask cu metricile
+activate vs dezactivate.
+
+Rulare:
+    python benchmarks/bench_metrics.py [--repeat 200000] [--requests 5000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d import create_app  # noqa: E402
+from src.hangman_3d.config import TestingConfig  # noqa: E402
+from src.hangman_3d.metrics import Metrics  # noqa: E402
+
+
+def per_call(stmt, repeat: int) -> float:
+    """Microsecunde per apel (cel mai bun din 3 rulări)"""
+    return min(timeit.repeat(stmt, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def flask_guess(enabled: bool, requests: int) -> float:
+    TestingConfig.METRICS_ENABLED = enabled
+    client = create_app('testing').test_client()
+    client.post('/start_game', json={})
+    return per_call(lambda: client.post('/guess', json={'letter': 'A'}), requests)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200000)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    metrics = Metrics()
+    print(f"{'caz':<28} {'us/apel':>9}")
+    print(f"{'Metrics.observe':<28} "
+          f"{per_call(lambda: metrics.observe('/guess', 'POST', 200, 0.0004), args.repeat):>9.2f}")
+    for name, enabled in (('flask /guess: fără metrici', False), ('flask /guess: cu metrici', True)):
+        print(f"{name:<28} {flask_guess(enabled, args.requests):>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
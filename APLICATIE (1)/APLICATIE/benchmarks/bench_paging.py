@@ -0,0 +1,66 @@
+"""
+Benchmark: colecții mari, încărcate integral față de parcurse pe pagini
+
+Pe serverul stub local (tests/http_standin.py) compară fetch_posts() cu
+toate înregistrările într-un singur răspuns și iter_posts(), cu și fără
+cererea în avans a paginii următoare. Memoria este vârful măsurat cu
+tracemalloc; consumatorul simulează prelucrarea fiecărei pagini.
+
+Rulare:
+    python benchmarks/bench_paging.py [--records 100000] [--page-size 1000]
+        [--delay 0.02] [--work 0.02]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.api_client import APIClient  # noqa: E402
+from tests.http_standin import StubAPI, make_dataset  # noqa: E402
+
+
+def bench(label: str, consume) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {count:8d} înregistrări  {elapsed * 1000:8.0f} ms  "
+          f"vârf {peak / 1e6:6.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--delay', type=float, default=0.02, help='latența serverului per cerere')
+    parser.add_argument('--work', type=float, default=0.02, help='prelucrarea unei pagini')
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = make_dataset(posts=args.records, users=1, comments_per_post=0)
+    with StubAPI(data, delay=args.delay) as api, APIClient(api.url) as client:
+        print(f"{args.records} postări, pagini de {args.page_size}, "
+              f"întârziere {args.delay * 1000:.0f} ms, prelucrare {args.work * 1000:.0f} ms/pagină")
+
+        def consume(records) -> int:
+            count = 0
+            for count, _ in enumerate(records, 1):
+                if count % args.page_size == 0:
+                    time.sleep(args.work)
+            return count
+
+        bench('fetch_posts (tot)', lambda: consume(client.fetch_posts(limit=args.records)))
+        bench('iter_posts fără prefetch', lambda: consume(
+            client.iter_posts(page_size=args.page_size, prefetch=False)))
+        bench('iter_posts', lambda: consume(client.iter_posts(page_size=args.page_size)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: costul verificării limitelor de rată per cerere
+
+Măsoară RateLimiter.admit()/leave() cu un singur fir și cu mai multe fire
+care lovesc aceleași segmente, pentru un număr mare de clienți distincți.
+
+Rulare:
+    python benchmarks/bench_ratelimit.py [--calls 200000] [--threads 8]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.config import Config  # noqa: E402
+from src.hangman_3d.ratelimit import RateLimiter  # noqa: E402
+
+
+def make_limiter() -> RateLimiter:
+    return RateLimiter(client_limit=(1e9, 1e9), route_limits=Config.RATE_LIMIT_ROUTES,
+                       max_concurrent=Config.MAX_CONCURRENT_REQUESTS,
+                       exempt=Config.RATE_LIMIT_EXEMPT, max_clients=Config.RATE_LIMIT_MAX_CLIENTS)
+
+
+def worker(limiter: RateLimiter, addresses: list) -> None:
+    for address in addresses:
+        if limiter.admit(address, '/guess') is None:
+            limiter.leave()
+
+
+def run(threads: int, calls: int, clients: int) -> float:
+    limiter = make_limiter()
+    per_thread = calls // threads
+    addresses = [[f'10.0.{(i + n * 7919) % clients}' for i in range(per_thread)]
+                 for n in range(threads)]
+    pool = [threading.Thread(target=worker, args=(limiter, addresses[n]))
+            for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return (time.perf_counter() - start) / (per_thread * threads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--clients', type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{'fire':>5} {'us/cerere':>10}")
+    for threads in (1, args.threads):
+        print(f"{threads:>5} {run(threads, args.calls, args.clients):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
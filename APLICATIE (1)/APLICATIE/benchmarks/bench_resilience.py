@@ -0,0 +1,57 @@
+"""
+Benchmark: latența de coadă a clientului API, cu și fără cereri dublate
+
+Serverul stub local (tests/http_standin.py) răspunde de obicei în --fast
+secunde, dar o fracție --slow-ratio din cereri întârzie --slow secunde
+(pauze GC, disc, vecini zgomotoși). Compară percentilele apelurilor și
+numărul de cereri trimise serverului cu hedging dezactivat și activat.
+
+Rulare:
+    python benchmarks/bench_resilience.py [--calls 400] [--fast 0.005]
+        [--slow 0.25] [--slow-ratio 0.03]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.api_client import APIClient  # noqa: E402
+from src.hangman_3d.utils.stats import percentile  # noqa: E402
+from tests.http_standin import StubAPI  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=400)
+    parser.add_argument('--fast', type=float, default=0.005)
+    parser.add_argument('--slow', type=float, default=0.25)
+    parser.add_argument('--slow-ratio', type=float, default=0.03)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.calls} apeluri, {args.slow_ratio:.0%} întârzie {args.slow * 1000:.0f} ms, "
+          f"restul {args.fast * 1000:.0f} ms")
+    for hedge in (False, True):
+        rng = random.Random(42)
+        with StubAPI(delay=lambda path: args.slow if rng.random() < args.slow_ratio else args.fast) as api, \
+                APIClient(api.url, hedge=hedge) as client:
+            latencies = []
+            for n in range(args.calls):
+                start = time.perf_counter()
+                client.fetch_comments(n % 100 + 1)
+                latencies.append(time.perf_counter() - start)
+            ordered = sorted(latencies)
+            [row] = client.latency_stats()
+            print(f"hedging {'activ' if hedge else 'inactiv':<8} "
+                  + "  ".join(f"p{p} {percentile(ordered, p) * 1000:6.1f} ms" for p in (50, 95, 99))
+                  + f"  max {ordered[-1] * 1000:6.1f} ms  cereri {api.requests}"
+                  + f"  dublate {row['hedged']} (câștigate {row['hedge_wins']})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: cereri/secundă pentru /guess pe măsură ce crește numărul de sesiuni
+
+Rulare:
+    python benchmarks/bench_sessions.py [--threads 8] [--duration 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Pagina nu se măsoară aici: fără Three.js inclus, pornește și cu CDN-ul
+os.environ.setdefault('ASSET_CDN_FALLBACK', '1')
+
+from src.hangman_3d import create_app  # noqa: E402
+from src.hangman_3d.models import GameState  # noqa: E402
+from src.hangman_3d.sessions import MemorySessionStore  # noqa: E402
+
+SESSION_COUNTS = [1, 100, 1000, 10000, 50000]
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def run(sessions: int, threads: int, duration: float) -> float:
+    """Rulează ghiciri concurente pe `sessions` jocuri și returnează cereri/s"""
+    app = create_app('production')
+    registry = MemorySessionStore(
+        max_sessions=sessions * 2,
+        stripes=app.config['GAME_SESSION_LOCK_STRIPES']
+    )
+    app.extensions['game_sessions'] = registry
+
+    game_ids = []
+    for _ in range(sessions):
+        game = GameState(random.choice(['usor', 'mediu', 'greu', 'expert']))
+        game.max_wrong = 1 << 30
+        game_ids.append(registry.create(game))
+
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def worker(index: int) -> None:
+        client = app.test_client()
+        rnd = random.Random(index)
+        done = 0
+        while not stop.is_set():
+            client.post('/guess', json={
+                'game_id': rnd.choice(game_ids),
+                'letter': rnd.choice(ALPHABET)
+            })
+            done += 1
+        counts[index] = done
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in workers:
+        thread.join()
+
+    return sum(counts) / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'sessions':>10} {'threads':>8} {'req/s':>12}")
+    for sessions in SESSION_COUNTS:
+        rps = run(sessions, args.threads, args.duration)
+        print(f"{sessions:>10} {args.threads:>8} {rps:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark: throughput-ul simulării self-play în funcție de numărul de procese
+
+Rulare:
+    python benchmarks/bench_simulation.py [--games 200000] [--strategy frequency]
+        [--workers 1 2 4 8] [--chunk-size 5000]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.simulation import STRATEGIES, run_simulation  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--games', type=int, default=200_000)
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default='frequency')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'seconds':>9} {'games/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        result = run_simulation(args.games, args.strategy, workers=workers,
+                                chunk_size=args.chunk_size)
+        baseline = baseline or result.games_per_second
+        print(f"{workers:>8} {result.seconds:>9.2f} {result.games_per_second:>10.0f} "
+              f"{result.games_per_second / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
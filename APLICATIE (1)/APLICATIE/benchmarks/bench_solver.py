@@ -0,0 +1,68 @@
+"""
+Benchmark: latența interogărilor solver-ului la 10k, 100k și 1M cuvinte
+
+Rulare:
+    python benchmarks/bench_solver.py [--sizes 10000 100000 1000000] [--queries 2000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.hangman_3d.dictionary import WordDictionary  # noqa: E402
+from src.hangman_3d.dictionary.solver import HangmanSolver  # noqa: E402
+
+LETTERS = 'EEEEEEAAAAARRRRIIIIOOOOTTTTNNNSSSLLCCUUDPMHGBFYWKVXZJQ'
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def random_state(word: str, rnd: random.Random):
+    """Stare de joc plauzibilă: câteva litere ghicite, câteva greșite"""
+    guessed = set(rnd.sample(sorted(set(word)), k=rnd.randint(0, len(set(word)) - 1)))
+    pattern = ''.join(c if c in guessed else '_' for c in word)
+    wrong = ''.join(rnd.sample([c for c in ALPHABET if c not in word], k=rnd.randint(0, 5)))
+    return pattern, wrong
+
+
+def run(size: int, queries: int) -> None:
+    rnd = random.Random(size)
+    words = {'mediu': [''.join(rnd.choice(LETTERS) for _ in range(rnd.randint(4, 14)))
+                       for _ in range(size)]}
+    dictionary = WordDictionary.from_words(words)
+
+    start = time.perf_counter()
+    solver = HangmanSolver(dictionary)
+    build = time.perf_counter() - start
+
+    states = [random_state(dictionary[rnd.randrange(len(dictionary))], rnd)
+              for _ in range(queries)]
+    latencies = []
+    for pattern, wrong in states:
+        start = time.perf_counter()
+        solver.suggest(pattern, wrong)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    print(f"{len(dictionary):>10} {build:>9.2f}s {p50:>10.1f} {p99:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'words':>10} {'build':>10} {'p50 µs':>10} {'p99 µs':>10}")
+    for size in args.sizes:
+        run(size, args.queries)
+
+
+if __name__ == '__main__':
+    main()
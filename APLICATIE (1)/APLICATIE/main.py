@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.hangman_3d import create_app, setup_logging, get_logger
+from src.hangman_3d.config import FLASK_ENV
 
 # Setup logging
 setup_logging(log_dir="logs")
@@ -17,6 +18,11 @@ logger = get_logger(__name__)
 if __name__ == '__main__':
     logger.info("Starting Hangman 3D application")
     
+    if FLASK_ENV == 'production':
+        # Server preforkat condus de ProductionConfig (SERVER_*)
+        from src.hangman_3d.server import serve
+        sys.exit(serve('production'))
+    
     # Pornește Flask app
     logger.info("Starting Flask development server")
     app = create_app()
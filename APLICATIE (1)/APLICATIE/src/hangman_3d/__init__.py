@@ -1,9 +1,40 @@
 """
 Hangman 3D - Joc interactiv cu rendering 3D
+
+Exporturile pachetului se încarcă la primul acces (PEP 562): importul unui
+submodul (models, dictionary, simulation) nu mai aduce Flask, iar
+subsistemul de date (requests, matplotlib) se încarcă doar când este folosit.
 """
 
-from .app import create_app
-from .logger import setup_logging, get_logger
+import importlib
 
 __version__ = "1.0.0"
+
+# Numele exportat -> submodulul care îl definește
+_LAZY_EXPORTS = {
+    "create_app": ".app",
+    "setup_logging": ".logger",
+    "get_logger": ".logger",
+    # Subsistemul de date și vizualizare
+    "DataPipeline": ".data_pipeline",
+    "APIClient": ".api_client",
+    "ResponseCache": ".http_cache",
+    "DataProcessor": ".data_processor",
+    "CSVExporter": ".csv_exporter",
+    "DataVisualizer": ".visualizer",
+}
+
 __all__ = ["create_app", "setup_logging", "get_logger"]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
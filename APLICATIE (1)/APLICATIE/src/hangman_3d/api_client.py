@@ -2,27 +2,304 @@
 Client pentru colectarea datelor din API-uri externe
 """
 
+import random
+import time
 import requests
-from typing import Dict, List, Any, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Iterator, List, Any, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
 
+from .http_cache import ResponseCache
+from .resilience import (
+    BudgetExceededError, CircuitBreaker, CircuitOpenError, LatencyTracker, endpoint_of
+)
+
 logger = logging.getLogger(__name__)
 
+# Înregistrări per pagină în iter_posts / iter_users
+PAGE_SIZE = 100
+
+# O cerere mai lentă decât această percentilă a endpoint-ului se dublează
+HEDGE_PERCENTILE = 95
+# Măsurători necesare înainte de prima dublare
+HEDGE_MIN_SAMPLES = 20
+# Cel mult această fracție din cererile unui endpoint se dublează (când
+# întreg serverul încetinește, dublarea ar dubla doar încărcarea)
+HEDGE_MAX_RATIO = 0.1
+# Pragul minim al dublării (secunde), ca răspunsurile foarte rapide să nu se dubleze
+MIN_HEDGE_DELAY = 0.005
+# Baza backoff-ului exponențial dintre reîncercări (secunde, jitter complet)
+RETRY_BACKOFF = 0.05
+
+# ID-uri de postări per cerere /comments?postId=..&postId=.. (limitează lungimea URL-ului)
+COMMENTS_BATCH_SIZE = 50
+
+
+class FetchResult(NamedTuple):
+    """Rezultatul unei cereri din fetch_concurrent"""
+    path: str
+    data: Any
+    error: Optional[Exception]
+
 
 class APIClient:
     """
     Client pentru interacțiunea cu API-uri externe
+    
+    Cererile trec printr-o sesiune requests comună, cu un pool de conexiuni
+    keep-alive (fără un nou handshake TCP/TLS per cerere); sesiunea poate fi
+    folosită din mai multe fire. Cu un ResponseCache, răspunsurile se
+    refolosesc în TTL-ul lor și apoi se revalidează cu cereri condiționate.
+    
+    Fiecare apel are un buget de latență (timeout-ul total, cu reîncercări),
+    se dublează când întârzie peste p95-ul endpoint-ului și trece printr-un
+    circuit breaker (vezi resilience.py).
     """
     
-    def __init__(self, base_url: str = "https://jsonplaceholder.typicode.com"):
+    def __init__(self, base_url: str = "https://jsonplaceholder.typicode.com",
+                 timeout: float = 10, pool_size: int = 10,
+                 max_workers: Optional[int] = None, cache: Optional[ResponseCache] = None,
+                 budgets: Optional[Mapping[str, float]] = None, max_retries: int = 2,
+                 hedge: bool = True, breaker: Optional[CircuitBreaker] = None):
         """
         Inițializează client-ul API
         
         Args:
             base_url: URL-ul bazei API
+            timeout: Bugetul implicit al unui apel, cu reîncercări (secunde)
+            pool_size: Conexiuni păstrate deschise către un host
+            max_workers: Cereri simultane în fetch_concurrent (implicit pool_size)
+            cache: Cache-ul pe disc al răspunsurilor (implicit niciunul)
+            budgets: Prefix de cale (de ex. "/comments") -> bugetul apelului
+            max_retries: Reîncercări după erori de rețea, timeout-uri și 5xx
+            hedge: Dublează cererile care întârzie peste p95
+            breaker: Circuit breaker-ul serverului (implicit unul nou)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_workers = max_workers or pool_size
+        self.cache = cache
+        # Prefixele cele mai lungi se verifică primele
+        self.budgets = sorted((budgets or {}).items(), key=lambda item: -len(item[0]))
+        self.max_retries = max_retries
+        self.hedge = hedge
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+        # Cererile dublate rulează în paralel cu originalele: două fire per apel
+        self._hedge_pool = ThreadPoolExecutor(max_workers=2 * self.max_workers + 2,
+                                              thread_name_prefix="api-hedge")
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Suportă serverul filtrul repetat postId=..&postId=..? (None = netestat)
+        self.multi_filter: Optional[bool] = None
+    
+    def __enter__(self) -> "APIClient":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Închide conexiunile din pool"""
+        self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+    
+    def latency_stats(self) -> List[Dict[str, Any]]:
+        """
+        Statisticile de latență per endpoint, pentru reglarea bugetelor
+        
+        Returns:
+            Câte un rând per endpoint: cereri, erori, cereri dublate și
+            câștigate de dublură, reîncercări, bugete depășite, apeluri
+            refuzate de circuit breaker și percentilele p50/p95/p99/max (ms)
+        """
+        return self.latency.summary()
+    
+    def _get_json(self, path: str) -> Any:
+        """GET pe o cale relativă la base_url"""
+        return self._get(f"{self.base_url}{path}")[0]
+    
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """
+        GET, prin cache dacă există unul
+        
+        Returns:
+            Corpul parsat și antetul Link parsat (ca Response.links)
+            
+        Raises:
+            requests.exceptions.RequestException: Eroare de rețea, cod HTTP
+                de eroare sau corp JSON invalid
+        """
+        if params:
+            url = requests.Request("GET", url, params=params).prepare().url
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else urlsplit(url).path
+        if self.cache is None:
+            response = self._send(url, path)
+            response.raise_for_status()
+            return response.json(), response.links
+        
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry, path):
+            return entry.data(), entry.links()
+        
+        headers = entry.validators() if entry is not None else None
+        response = self._send(url, path, headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(url, response.headers)
+            return entry.data(), entry.links()
+        response.raise_for_status()
+        data = response.json()
+        self.cache.put(url, response.headers, response.content, data)
+        return data, response.links
+    
+    def _budget(self, path: str) -> float:
+        for prefix, seconds in self.budgets:
+            if path.startswith(prefix):
+                return seconds
+        return self.timeout
+    
+    def _send(self, url: str, path: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        O cerere GET în bugetul endpoint-ului, cu reîncercări și dublare
+        
+        Erorile de rețea, timeout-urile și răspunsurile 5xx se reîncearcă
+        după un backoff aleator, dacă mai rămâne buget; răspunsurile 4xx
+        se întorc imediat.
+        
+        Raises:
+            CircuitOpenError: Circuitul este deschis
+            BudgetExceededError: Bugetul s-a epuizat fără un răspuns
+            requests.exceptions.RequestException: Ultima eroare de rețea
         """
-        self.base_url = base_url
-        self.timeout = 10
+        endpoint = endpoint_of(path)
+        self.latency.count(endpoint, "requests")
+        if not self.breaker.allow():
+            self.latency.count(endpoint, "rejected")
+            raise CircuitOpenError(f"Circuit open, not calling {url}")
+        
+        budget = self._budget(path)
+        deadline = time.monotonic() + budget
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self._attempt(url, headers, endpoint, deadline)
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+            except requests.exceptions.RequestException as e:
+                error = e
+            except BaseException:
+                # Orice altă excepție eșuează apelul; fără înregistrare, o
+                # probă semi-deschisă ar bloca circuitul pentru totdeauna
+                self.latency.count(endpoint, "errors")
+                self.breaker.record_failure()
+                raise
+            
+            backoff = random.uniform(0, RETRY_BACKOFF * 2 ** attempt)
+            if attempt >= self.max_retries or time.monotonic() + backoff >= deadline:
+                break
+            attempt += 1
+            self.latency.count(endpoint, "retries")
+            time.sleep(backoff)
+        
+        self.latency.count(endpoint, "errors")
+        self.breaker.record_failure()
+        if response is not None:
+            return response  # 5xx: apelantul ridică HTTPError cu raise_for_status
+        if time.monotonic() >= deadline:
+            self.latency.count(endpoint, "budget_exceeded")
+            raise BudgetExceededError(f"Latency budget of {budget}s exhausted for {url}") from error
+        raise error
+    
+    def _attempt(self, url: str, headers: Optional[Dict[str, str]], endpoint: str,
+                 deadline: float) -> requests.Response:
+        """
+        O încercare; dacă întârzie peste p95, pleacă și o cerere dublură
+        
+        Câștigă primul răspuns; cererea rămasă se termină în fundal (nu
+        poate fi întreruptă), iar conexiunea ei revine apoi în pool.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout(f"No budget left for {url}")
+        delay = self._hedge_delay(endpoint)
+        if delay is None or delay >= remaining:
+            return self._timed_get(url, headers, endpoint, remaining)
+        
+        first = self._hedge_pool.submit(self._timed_get, url, headers, endpoint, remaining)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+        
+        self.latency.count(endpoint, "hedged")
+        second = self._hedge_pool.submit(self._timed_get, url, headers, endpoint,
+                                         deadline - time.monotonic())
+        pending = {first, second}
+        error: Optional[Exception] = None
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                raise requests.exceptions.Timeout(f"No response from {url} within budget")
+            for future in done:
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException as e:
+                    error = e
+                    continue
+                if future is second:
+                    self.latency.count(endpoint, "hedge_wins")
+                return response
+        raise error
+    
+    def _hedge_delay(self, endpoint: str) -> Optional[float]:
+        """După cât timp se dublează o cerere (None = fără dublare)"""
+        if not self.hedge or self.latency.ratio(endpoint, "hedged") >= HEDGE_MAX_RATIO:
+            return None
+        p95 = self.latency.percentile(endpoint, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES)
+        return None if p95 is None else max(p95, MIN_HEDGE_DELAY)
+    
+    def _timed_get(self, url: str, headers: Optional[Dict[str, str]], endpoint: str,
+                   timeout: float) -> requests.Response:
+        start = time.perf_counter()
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if response.status_code < 500:
+            self.latency.observe(endpoint, time.perf_counter() - start)
+        return response
+    
+    def fetch_concurrent(self, paths: Iterable[str],
+                         max_workers: Optional[int] = None) -> Iterator[FetchResult]:
+        """
+        Execută mai multe cereri GET în paralel
+        
+        Args:
+            paths: Căi relative la base_url (pot include query string)
+            max_workers: Cereri simultane (implicit self.max_workers)
+            
+        Returns:
+            Iterator de FetchResult, în ordinea terminării cererilor; o
+            cerere eșuată are data=None și eroarea în error
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        try:
+            futures = {pool.submit(self._get_json, path): path for path in paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield FetchResult(path, future.result(), None)
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Error fetching {path}: {e}")
+                    yield FetchResult(path, None, e)
+        finally:
+            # Dacă apelantul se oprește devreme, cererile neîncepute se anulează
+            pool.shutdown(wait=False, cancel_futures=True)
     
     def fetch_posts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -35,13 +312,10 @@ class APIClient:
             Listă cu datele postărilor
         """
         try:
-            url = f"{self.base_url}/posts?_limit={limit}"
-            logger.info(f"Fetching data from {url}")
+            path = f"/posts?_limit={limit}"
+            logger.info(f"Fetching data from {self.base_url}{path}")
             
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(path)
             logger.info(f"Successfully fetched {len(data)} posts")
             return data
             
@@ -60,13 +334,10 @@ class APIClient:
             Listă cu datele utilizatorilor
         """
         try:
-            url = f"{self.base_url}/users?_limit={limit}"
-            logger.info(f"Fetching users from {url}")
-            
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            path = f"/users?_limit={limit}"
+            logger.info(f"Fetching users from {self.base_url}{path}")
             
-            data = response.json()
+            data = self._get_json(path)
             logger.info(f"Successfully fetched {len(data)} users")
             return data
             
@@ -85,16 +356,212 @@ class APIClient:
             Listă cu comentariile
         """
         try:
-            url = f"{self.base_url}/posts/{post_id}/comments"
-            logger.info(f"Fetching comments from {url}")
+            path = f"/posts/{post_id}/comments"
+            logger.info(f"Fetching comments from {self.base_url}{path}")
             
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(path)
             logger.info(f"Successfully fetched {len(data)} comments")
             return data
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching comments: {e}")
             return []
+    
+    def iter_posts(self, page_size: int = PAGE_SIZE, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Parcurge toate postările, pagină cu pagină
+        
+        Args:
+            page_size: Înregistrări per cerere
+            prefetch: Cere pagina următoare cât timp se consumă cea curentă
+            
+        Returns:
+            Iterator de postări
+            
+        Raises:
+            requests.exceptions.RequestException: O pagină nu a putut fi
+                citită (colecția parcursă până atunci este incompletă)
+        """
+        return self._iter_pages("/posts", page_size, prefetch)
+    
+    def iter_users(self, page_size: int = PAGE_SIZE, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Parcurge toți utilizatorii, pagină cu pagină
+        
+        Args:
+            page_size: Înregistrări per cerere
+            prefetch: Cere pagina următoare cât timp se consumă cea curentă
+            
+        Returns:
+            Iterator de utilizatori
+            
+        Raises:
+            requests.exceptions.RequestException: O pagină nu a putut fi
+                citită (colecția parcursă până atunci este incompletă)
+        """
+        return self._iter_pages("/users", page_size, prefetch)
+    
+    def _get_page(self, url: str, params: Optional[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        O pagină dintr-o colecție
+        
+        Returns:
+            Înregistrările paginii și URL-ul paginii următoare din antetul
+            Link (rel="next"), dacă serverul îl trimite
+        """
+        data, links = self._get(url, params)
+        return data, links.get("next", {}).get("url")
+    
+    def _iter_pages(self, path: str, page_size: int, prefetch: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Parcurge o colecție paginată
+        
+        Dacă serverul trimite antetul Link (json-server cu _page, sau API-uri
+        cu cursor), se urmează rel="next"; altfel se cere _page=N+1 până la
+        o pagină incompletă. În memorie sunt cel mult două pagini: cea
+        curentă și cea cerută în avans. O pagină eșuată întrerupe parcurgerea
+        cu eroarea ei, ca apelantul să nu ia o colecție trunchiată drept
+        completă.
+        """
+        url = f"{self.base_url}{path}"
+        logger.info(f"Iterating {url} in pages of {page_size}")
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        
+        def request(url: str, params: Optional[Dict[str, Any]]) -> Future:
+            if pool is not None:
+                return pool.submit(self._get_page, url, params)
+            future: Future = Future()
+            try:
+                future.set_result(self._get_page(url, params))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        
+        page_number = 1
+        pending = request(url, {"_page": page_number, "_limit": page_size})
+        previous_first = None
+        total = 0
+        try:
+            while pending is not None:
+                try:
+                    records, next_url = pending.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Error fetching page {page_number} of {url} "
+                                 f"after {total} records: {e}")
+                    raise
+                
+                if not records:
+                    break
+                if records[0] == previous_first:
+                    logger.warning(f"{url} ignores _page, stopping after page {page_number - 1}")
+                    break
+                
+                pending = None
+                if next_url is not None:
+                    pending = request(next_url, None)
+                elif len(records) == page_size:
+                    pending = request(url, {"_page": page_number + 1, "_limit": page_size})
+                elif len(records) > page_size:
+                    logger.warning(f"{url} ignores _limit, returned {len(records)} records at once")
+                
+                previous_first = records[0]
+                page_number += 1
+                total += len(records)
+                yield from records
+                # Pagina consumată poate fi eliberată înainte de a aștepta următoarea
+                del records
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        
+        logger.info(f"Iterated {total} records from {url}")
+    
+    def fetch_comments_bulk(self, post_ids: Iterable[int],
+                            batch_size: int = COMMENTS_BATCH_SIZE) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch-ează comentariile mai multor postări
+        
+        ID-urile duplicate se cer o singură dată. Se folosește filtrul
+        multiplu /comments?postId=1&postId=2 (o cerere per lot); dacă
+        serverul nu îl suportă, comentariile se cer per postare, în paralel
+        (cel mult max_workers cereri simultane).
+        
+        Filtrul multiplu este confirmat abia de un răspuns cu comentariile
+        mai multor postări. Până atunci, postările unui lot care lipsesc din
+        răspuns se cer și individual: un server care aplică doar prima (sau
+        ultima) valoare le-ar lăsa altfel fără comentarii. Dacă astfel se
+        găsesc comentarii, filtrul multiplu nu se mai folosește.
+        
+        Args:
+            post_ids: ID-urile postărilor
+            batch_size: Postări per cerere cu filtru multiplu
+            
+        Returns:
+            Dicționar post_id -> comentarii (listă goală la eroare)
+        """
+        ids = list(dict.fromkeys(post_ids))
+        comments: Dict[int, List[Dict[str, Any]]] = {post_id: [] for post_id in ids}
+        remaining = ids
+        unconfirmed: List[int] = []
+        
+        if self.multi_filter is not False:
+            batches = {}
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start:start + batch_size]
+                query = "&".join(f"postId={post_id}" for post_id in batch)
+                batches[f"/comments?{query}"] = batch
+            
+            failed: List[int] = []
+            answered: List[Tuple[List[int], Dict[int, List[Dict[str, Any]]]]] = []
+            for result in self.fetch_concurrent(batches):
+                batch = batches[result.path]
+                grouped = self._group_by_post(result.data, batch) if result.error is None else None
+                if grouped is None:
+                    failed.extend(batch)
+                    continue
+                if len(grouped) > 1:
+                    self.multi_filter = True
+                comments.update(grouped)
+                answered.append((batch, grouped))
+            
+            if not self.multi_filter:
+                if failed and not answered:
+                    # Nicio cerere cu filtru multiplu nu a reușit: serverul nu îl suportă
+                    logger.info("Multi-value postId filter not supported, fetching comments per post")
+                    self.multi_filter = False
+                for batch, grouped in answered:
+                    if len(batch) > 1:
+                        unconfirmed.extend(post_id for post_id in batch if post_id not in grouped)
+            remaining = failed + unconfirmed
+        
+        if remaining:
+            paths = {f"/posts/{post_id}/comments": post_id for post_id in remaining}
+            for result in self.fetch_concurrent(paths):
+                if result.error is None:
+                    comments[paths[result.path]] = result.data
+            if any(comments[post_id] for post_id in unconfirmed):
+                logger.info("Multi-value postId filter only partially applied, fetching comments per post")
+                self.multi_filter = False
+        
+        logger.info(f"Fetched comments for {len(ids)} posts")
+        return comments
+    
+    @staticmethod
+    def _group_by_post(data: Any, batch: List[int]) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """
+        Grupează comentariile unui lot după postId
+        
+        Returns:
+            None dacă răspunsul conține postări din afara lotului (serverul
+            a ignorat filtrul)
+        """
+        if not isinstance(data, list):
+            return None
+        wanted = {str(post_id): post_id for post_id in batch}
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for comment in data:
+            post_id = wanted.get(str(comment.get("postId")))
+            if post_id is None:
+                return None
+            grouped.setdefault(post_id, []).append(comment)
+        return grouped
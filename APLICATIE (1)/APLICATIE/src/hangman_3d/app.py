@@ -2,14 +2,47 @@
 Factory pentru crearea aplicației Flask
 """
 
-from typing import Optional
-from flask import Flask
+from typing import Any, Dict, Optional, Tuple
+from flask import Flask, render_template
 from .config import config, FLASK_ENV
-from .routes import game_bp
+from .routes import game_bp, assets_bp
+from .assets import CDN_FALLBACKS, AssetManifest, CompressedResource, StaticFiles
+from .json_provider import ConstantPayload, FastJSONProvider
+from .metrics import init_metrics, register_gauges
+from .ratelimit import init_rate_limiting
+from .sessions import create_session_store
+from .dictionary import load_dictionary
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Corpuri constante, serializate o singură dată
+NOT_FOUND = ConstantPayload({"error": "Nu a fost găsit"})
+SERVER_ERROR = ConstantPayload({"error": "Eroare server"})
+DATA_STATUS = ConstantPayload({"status": "ready", "version": "1.0.0"})
+
+
+def run_pipeline() -> Tuple[Dict[str, Any], int]:
+    """
+    Rulează pipeline-ul de colectare și prelucrare de date (blocant)
+
+    Returns:
+        Corpul răspunsului și codul HTTP
+    """
+    try:
+        from .data_pipeline import DataPipeline
+        with DataPipeline(output_dir="output") as pipeline:
+            results = pipeline.run_full_pipeline()
+        return {"status": "success", "results": results}, 200
+    except Exception as e:
+        logger.error(f"Error running pipeline: {e}")
+        return {"status": "error", "message": str(e)}, 500
+
+
+def data_status() -> Tuple[Dict[str, Any], int]:
+    """Returnează status-ul colectării de date"""
+    return DATA_STATUS, 200
+
 
 def create_app(config_name: Optional[str] = None) -> Flask:
     """
@@ -32,34 +65,52 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     config_class = config.get(config_name, config['default'])
     app.config.from_object(config_class)
     
+    # Asset-uri amprentate (manifestul produs de pasul de build); verificate
+    # înaintea oricărei resurse, ca o instalare incompletă să nu pornească
+    assets = AssetManifest(app.static_folder, app.static_url_path,
+                           CDN_FALLBACKS if app.config['ASSET_CDN_FALLBACK'] else None)
+    assets.check_vendored(production=not (app.debug or app.testing))
+    
+    # Serializare JSON rapidă (orjson dacă este instalat)
+    app.json = FastJSONProvider(app)
+    
+    # Dicționarul de cuvinte (mmap, partajat între procese)
+    if app.config.get('WORD_DICTIONARY_PATH'):
+        load_dictionary(app.config['WORD_DICTIONARY_PATH'])
+    
+    # Backend-ul de sesiuni pentru jocurile active
+    app.extensions['game_sessions'] = create_session_store(app.config)
+    
+    app.add_template_global(assets.url, 'asset_url')
+    app.extensions['static_files'] = StaticFiles(app.static_folder)
+    
+    # Metrici per rută, apoi limitarea ratei (cererile respinse sunt și ele măsurate)
+    metrics = init_metrics(app)
+    limiter = init_rate_limiting(app)
+    if metrics is not None:
+        register_gauges(metrics, app.extensions['game_sessions'], limiter)
+    
     # Înregistrează blueprint-uri
     app.register_blueprint(game_bp)
+    app.register_blueprint(assets_bp)
     
-    # Data API Routes
-    @app.route('/api/data/pipeline', methods=['GET'])
-    def run_data_pipeline():
-        """Rulează pipeline-ul de colectare și prelucrare de date"""
-        try:
-            from .data_pipeline import DataPipeline
-            pipeline = DataPipeline(output_dir="output")
-            results = pipeline.run_full_pipeline()
-            return {"status": "success", "results": results}, 200
-        except Exception as e:
-            logger.error(f"Error running pipeline: {e}")
-            return {"status": "error", "message": str(e)}, 500
+    # Pagina principală nu depinde de cerere: se randează și se comprimă o dată
+    with app.test_request_context('/'):
+        app.extensions['index_page'] = CompressedResource(
+            render_template('index.html').encode('utf-8'), 'text/html; charset=utf-8'
+        )
     
-    @app.route('/api/data/status', methods=['GET'])
-    def data_status():
-        """Returnează status-ul colectării de date"""
-        return {"status": "ready", "version": "1.0.0"}, 200
+    # Data API Routes
+    app.add_url_rule('/api/data/pipeline', 'run_data_pipeline', run_pipeline, methods=['GET'])
+    app.add_url_rule('/api/data/status', 'data_status', data_status, methods=['GET'])
     
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
-        return {"error": "Nu a fost găsit"}, 404
+        return NOT_FOUND, 404
     
     @app.errorhandler(500)
     def server_error(error):
-        return {"error": "Eroare server"}, 500
+        return SERVER_ERROR, 500
     
     return app
@@ -0,0 +1,405 @@
+"""
+Varianta ASGI a aplicației: handlere async peste aceeași logică de joc
+
+Configurația, dicționarul și backend-ul de sesiuni sunt construite de
+create_app(), iar endpoint-urile apelează aceleași funcții din
+routes.actions ca blueprint-ul Flask. O conexiune în așteptare nu mai
+ocupă un thread; operațiile blocante (pipeline-ul de date, backend-urile
+SQLite/Redis) rulează în thread pool, iar solver-ul indiciilor se
+construiește la pornire, tot în thread pool.
+
+Fiecare joc are și un canal persistent: WebSocket la /ws și, ca
+alternativă, SSE la /events (vezi realtime.py).
+
+Rulare:
+    uvicorn --factory src.hangman_3d.asgi:create_asgi_app --port 5000
+"""
+
+import asyncio
+import time
+from functools import partial
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+import logging
+
+from . import json_provider
+from .app import NOT_FOUND, SERVER_ERROR, create_app, data_status, run_pipeline
+from .assets import CompressedResource
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, UNMATCHED, Metrics, register_gauges
+from .ratelimit import RateLimiter
+from .realtime import GameChannels, GameEvent, GameEventHub
+from .routes import actions
+from .routes.game import GAME_COOKIE
+from .sessions import MemorySessionStore
+
+logger = logging.getLogger(__name__)
+
+# Corpurile cererilor de joc au câteva zeci de octeți
+MAX_BODY_SIZE = 64 * 1024
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class Request:
+    """Datele unei cereri HTTP, extrase din scope-ul ASGI"""
+
+    __slots__ = ("method", "path", "query", "headers", "cookies", "body", "receive", "_json")
+
+    def __init__(self, scope: Dict[str, Any], body: bytes = b"", receive=None):
+        self.method: str = scope.get("method", "GET")
+        self.path: str = scope["path"]
+        self.query = {
+            key: values[0]
+            for key, values in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()
+        }
+        self.headers: Dict[str, str] = {}
+        self.cookies: Dict[str, str] = {}
+        for name, value in scope.get("headers", ()):
+            if name == b"cookie":
+                cookie = SimpleCookie()
+                cookie.load(value.decode("latin-1"))
+                self.cookies.update((key, morsel.value) for key, morsel in cookie.items())
+            else:
+                self.headers[name.decode("latin-1").lower()] = value.decode("latin-1")
+        self.body = body
+        # Pentru răspunsurile de tip flux, care urmăresc deconectarea clientului
+        self.receive = receive
+        self._json: Optional[Dict[str, Any]] = None
+
+    @property
+    def json(self) -> Dict[str, Any]:
+        """Corpul JSON (obiect gol dacă lipsește sau este invalid)"""
+        if self._json is None:
+            try:
+                data = json_provider.loads(self.body) if self.body else {}
+            except ValueError:
+                data = {}
+            self._json = data if isinstance(data, dict) else {}
+        return self._json
+
+    def game_id(self) -> Optional[str]:
+        """game_id din corpul JSON, query string sau, implicit, din cookie"""
+        return (self.json.get("game_id") or self.query.get("game_id")
+                or self.cookies.get(GAME_COOKIE))
+
+
+class StreamResponse:
+    """Răspuns trimis incremental de o corutină (scope, send)"""
+
+    __slots__ = ("stream",)
+
+    def __init__(self, stream: Callable[[Callable[[Dict[str, Any]], Awaitable[None]]],
+                                        Awaitable[None]]):
+        self.stream = stream
+
+    async def send(self, send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        await self.stream(send)
+
+
+class Response:
+    """Răspuns HTTP gata de trimis"""
+
+    __slots__ = ("status", "body", "headers")
+
+    def __init__(self, body: bytes, status: int = 200,
+                 content_type: bytes = b"application/json",
+                 headers: Optional[Headers] = None):
+        self.status = int(status)
+        self.body = body
+        self.headers: Headers = [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if headers:
+            self.headers.extend(headers)
+
+    @classmethod
+    def json(cls, payload: Dict[str, Any], status: int = 200,
+             headers: Optional[Headers] = None) -> "Response":
+        return cls(json_provider.dumps(payload), status, headers=headers)
+
+    @classmethod
+    def resource(cls, resource: CompressedResource, request: Request) -> "Response":
+        """Răspuns pentru o resursă precomprimată (negociere + 304)"""
+        status, body, headers = resource.respond(
+            request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+        )
+        return cls(body, status, content_type=dict(headers)["Content-Type"].encode(),
+                   headers=[(name.lower().encode(), value.encode())
+                            for name, value in headers if name != "Content-Type"])
+
+    async def send(self, send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        await send({"type": "http.response.start", "status": self.status,
+                    "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+Handler = Callable[[Request], Awaitable[Any]]
+
+
+class HangmanASGI:
+    """Aplicația ASGI: rutare, handlere async și ciclul de viață"""
+
+    def __init__(self, config_name: Optional[str] = None):
+        """
+        Args:
+            config_name: Nume config ('development', 'testing', 'production')
+        """
+        flask_app = create_app(config_name)
+        self.config = flask_app.config
+        self.store = flask_app.extensions["game_sessions"]
+        # Backend-ul în memorie nu face I/O: se apelează direct din event loop
+        self._offload = not isinstance(self.store, MemorySessionStore)
+        # Pagina și asset-urile sunt cele precomprimate de create_app()
+        self._index_page = flask_app.extensions["index_page"]
+        self._static_files = flask_app.extensions["static_files"]
+        self._static_prefix = flask_app.static_url_path.rstrip("/") + "/"
+        self.limiter = RateLimiter.from_config(self.config)
+        self.metrics: Optional[Metrics] = None
+        if self.config.get("METRICS_ENABLED"):
+            self.metrics = Metrics()
+            register_gauges(self.metrics, self.store, self.limiter)
+        self.events = GameEventHub(self.store, self._call)
+        self.channels = GameChannels(self.events)
+
+        self._routes: Dict[str, Tuple[Tuple[str, ...], Handler]] = {
+            "/": (("GET",), self.index),
+            "/start_game": (("POST",), self.start_game),
+            "/guess": (("POST",), self.guess),
+            "/guess_batch": (("POST",), self.guess_batch),
+            "/hint": (("GET", "POST"), self.hint),
+            "/update_time": (("GET", "POST"), self.update_time),
+            "/events": (("GET",), self.event_stream),
+            "/api/data/pipeline": (("GET",), self.data_pipeline),
+            "/api/data/status": (("GET",), self.data_status),
+        }
+        if self.metrics is not None:
+            self._routes["/metrics"] = (("GET",), self.export_metrics)
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Apelează logica de joc, în thread pool dacă backend-ul face I/O"""
+        if self._offload:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    # Handlere
+
+    async def index(self, request: Request) -> Response:
+        """Servește pagina principală"""
+        return Response.resource(self._index_page, request)
+
+    async def static_file(self, request: Request) -> Response:
+        """Servește un fișier static (amprentat: immutable; altfel: ETag)"""
+        resource = self._static_files.get(request.path[len(self._static_prefix):])
+        if resource is None:
+            return Response.json(NOT_FOUND, HTTPStatus.NOT_FOUND)
+        return Response.resource(resource, request)
+
+    async def start_game(self, request: Request) -> Response:
+        """Pornește un joc nou și setează cookie-ul game_id"""
+        payload, status = await self._call(
+            actions.start_game, self.store, request.json.get("difficulty", "mediu")
+        )
+        cookie = f"{GAME_COOKIE}={payload['game_id']}; HttpOnly; Path=/; SameSite=Lax"
+        return Response.json(payload, status, headers=[(b"set-cookie", cookie.encode())])
+
+    def _publish(self, game_id: Optional[str], kind: str, payload: Dict[str, Any],
+                 status: int, **data: Any) -> None:
+        """Trimite rezultatul unei cereri HTTP și abonaților canalului jocului"""
+        if payload.get("time_up"):
+            self.events.publish(game_id, GameEvent.from_result("time_up", {**payload, "time_left": 0}))
+        elif status == 200:
+            self.events.publish(game_id, GameEvent.from_result(kind, payload, **data))
+
+    async def guess(self, request: Request) -> Response:
+        """Ghicește o literă"""
+        game_id, letter = request.game_id(), request.json.get("letter", "")
+        payload, status = await self._call(actions.guess, self.store, game_id, letter)
+        self._publish(game_id, "guess", payload, status, letter=str(letter).upper())
+        return Response.json(payload, status)
+
+    async def guess_batch(self, request: Request) -> Response:
+        """Ghicește mai multe litere într-o singură cerere"""
+        game_id = request.game_id()
+        payload, status = await self._call(
+            actions.guess_batch, self.store, game_id, request.json.get("letters", [])
+        )
+        self._publish(game_id, "guess_batch", payload, status)
+        return Response.json(payload, status)
+
+    async def hint(self, request: Request) -> Response:
+        """Recomandă următoarea literă"""
+        game_id = request.game_id()
+        payload, status = await self._call(actions.hint, self.store, game_id)
+        if payload.get("time_up"):
+            self._publish(game_id, "time_up", payload, status)
+        return Response.json(payload, status)
+
+    async def update_time(self, request: Request) -> Response:
+        """Status timp (doar citire)"""
+        game_id = request.game_id()
+        payload, status = await self._call(actions.status, self.store, game_id)
+        if payload.get("time_up"):
+            self._publish(game_id, "time_up", payload, status)
+        return Response.json(payload, status)
+
+    async def event_stream(self, request: Request) -> Any:
+        """Flux SSE cu evenimentele jocului (alternativa la WebSocket)"""
+        game_id = request.game_id()
+
+        async def stream(send) -> None:
+            if not await self.channels.event_stream(game_id, request.receive, send):
+                await Response.json(actions.NO_GAME, 400).send(send)
+
+        return StreamResponse(stream)
+
+    async def data_pipeline(self, request: Request) -> Response:
+        """Rulează pipeline-ul de date fără a bloca event loop-ul"""
+        payload, status = await asyncio.to_thread(run_pipeline)
+        return Response.json(payload, status)
+
+    async def data_status(self, request: Request) -> Response:
+        """Returnează status-ul colectării de date"""
+        payload, status = data_status()
+        return Response.json(payload, status)
+
+    async def export_metrics(self, request: Request) -> Response:
+        """Expune metricile în formatul text Prometheus"""
+        return Response(self.metrics.render().encode("utf-8"),
+                        content_type=METRICS_CONTENT_TYPE.encode())
+
+    def _route_label(self, path: str) -> str:
+        """Eticheta de rută a unei căi (aceeași formă ca regulile Flask)"""
+        if path in self._routes:
+            return path
+        if path.startswith(self._static_prefix):
+            return self._static_prefix + "<path:filename>"
+        return UNMATCHED
+
+    # Protocolul ASGI
+
+    async def __call__(self, scope: Dict[str, Any],
+                       receive: Callable[[], Awaitable[Dict[str, Any]]],
+                       send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        if scope["type"] == "http":
+            start = time.perf_counter()
+            response = await self._handle_http(scope, receive)
+            if self.metrics is not None:
+                # Pentru un flux SSE se măsoară doar deschiderea lui
+                self.metrics.observe(self._route_label(scope["path"]), scope["method"],
+                                     getattr(response, "status", 200),
+                                     time.perf_counter() - start)
+            await response.send(send)
+        elif scope["type"] == "websocket":
+            if scope["path"] != "/ws":
+                await receive()
+                await send({"type": "websocket.close", "code": 1008})
+                return
+            if self.limiter and self.limiter.check(_client(scope), scope["path"]):
+                await receive()
+                await send({"type": "websocket.close", "code": 1013})  # Try Again Later
+                return
+            # Mesajele de pe canal consumă limitele rutelor HTTP echivalente
+            limit = partial(self._over_limit, _client(scope)) if self.limiter else None
+            await self.channels.websocket(Request(scope).game_id(), receive, send, limit)
+        elif scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+
+    async def _read_body(self, receive) -> Optional[bytes]:
+        """Citește corpul cererii (None dacă depășește MAX_BODY_SIZE)"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_SIZE:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        return b"".join(chunks)
+
+    async def _handle_http(self, scope: Dict[str, Any], receive) -> Response:
+        if self.limiter is None:
+            return await self._dispatch(scope, receive)
+        rejection = self.limiter.admit(_client(scope), scope["path"])
+        if rejection is not None:
+            return Response.json(rejection.payload, rejection.status, headers=[
+                (name.lower().encode(), value.encode()) for name, value in rejection.headers()
+            ])
+        # Locul se eliberează când handler-ul revine; un flux SSE nu îl ocupă
+        try:
+            return await self._dispatch(scope, receive)
+        finally:
+            self.limiter.leave()
+
+    async def _dispatch(self, scope: Dict[str, Any], receive) -> Response:
+        route = self._routes.get(scope["path"])
+        if route is None and scope["path"].startswith(self._static_prefix):
+            route = (("GET",), self.static_file)
+        if route is None:
+            return Response.json(NOT_FOUND, HTTPStatus.NOT_FOUND)
+
+        methods, handler = route
+        if scope["method"] not in methods:
+            return Response.json({"error": "Metodă nepermisă"}, HTTPStatus.METHOD_NOT_ALLOWED,
+                                 headers=[(b"allow", ", ".join(methods).encode())])
+
+        body = await self._read_body(receive)
+        if body is None:
+            return Response.json({"error": "Cerere prea mare"}, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            return await handler(Request(scope, body, receive))
+        except Exception:
+            logger.exception(f"Error handling {scope['method']} {scope['path']}")
+            if self.metrics is not None:
+                self.metrics.exception(self._route_label(scope["path"]))
+            return Response.json(SERVER_ERROR, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    def _over_limit(self, client: Optional[str], path: str) -> bool:
+        return self.limiter is not None and self.limiter.check(client, path) is not None
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Bitset-urile solver-ului nu se construiesc în event loop la primul indiciu
+                await asyncio.to_thread(_warm_solver)
+                logger.info("ASGI application started")
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.store.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def _warm_solver() -> None:
+    """Construiește solver-ul dicționarului activ (NumPy și bitset-urile)"""
+    from .dictionary import get_dictionary
+    from .dictionary.solver import get_solver
+    get_solver(get_dictionary())
+
+
+def _client(scope: Dict[str, Any]) -> Optional[str]:
+    """Adresa clientului din scope (None pentru transporturile fără adresă)"""
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def create_asgi_app(config_name: Optional[str] = None) -> HangmanASGI:
+    """
+    Crează aplicația ASGI
+
+    Args:
+        config_name: Nume config ('development', 'testing', 'production')
+
+    Returns:
+        Aplicație ASGI (callable scope, receive, send)
+    """
+    return HangmanASGI(config_name)
@@ -0,0 +1,416 @@
+"""
+Pipeline de asset-uri: amprentare, precomprimare și răspunsuri cacheabile
+
+Pasul de build copiază fișierele din folderul static în static/dist/ sub
+nume care conțin hash-ul conținutului (game.3f2a9c1b7d4e.js), alături de
+variantele .gz și .br, și scrie un manifest nume logic -> nume amprentat.
+Un fișier amprentat nu se mai schimbă niciodată, deci poate fi păstrat de
+browser un an (Cache-Control: immutable); pagina principală se
+revalidează (ETag + 304) și indică mereu versiunea curentă.
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.assets [static_folder]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import shutil
+import sys
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - brotli este opțional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIST_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# Tipurile de fișiere care merită comprimate (imaginile sunt deja comprimate)
+COMPRESSIBLE = (".css", ".js", ".html", ".json", ".svg", ".txt", ".map")
+
+# Sufixul fișierului precomprimat pentru fiecare Content-Encoding, în ordinea preferinței
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Asset-uri externe incluse prin vendor.py. Lipsa lor oprește build-ul și
+# pornirea în producție; CDN-ul original se folosește doar la cerere
+# (ASSET_CDN_FALLBACK=1 sau build_assets(cdn_fallback=True))
+CDN_FALLBACKS = {
+    "vendor/three.min.js": "https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js",
+}
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+Headers = List[Tuple[str, str]]
+
+
+class MissingAssetError(RuntimeError):
+    """Un asset extern nu a fost inclus în folderul static (vezi vendor.py)"""
+
+
+def missing_vendored(static_folder: str) -> List[str]:
+    """Asset-urile externe (CDN_FALLBACKS) care lipsesc din folderul static"""
+    return [name for name in CDN_FALLBACKS
+            if not os.path.isfile(os.path.join(static_folder, *name.split("/")))]
+
+
+def _missing_message(missing: Sequence[str]) -> str:
+    return (f"Lipsesc asset-urile externe {', '.join(missing)}: rulați "
+            f"python -m src.hangman_3d.vendor sau activați explicit CDN-ul")
+
+
+def content_hash(data: bytes, length: int = 12) -> str:
+    """Hash-ul (hex, trunchiat) al conținutului unui fișier"""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """
+    Comprimă un conținut cu toate codificările disponibile
+
+    Returns:
+        Content-Encoding -> corp comprimat, doar pentru variantele mai mici
+        decât originalul (brotli doar dacă modulul este instalat)
+    """
+    variants = {}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    variants["gzip"] = gzip.compress(data, compresslevel=9, mtime=0)
+    return {encoding: body for encoding, body in variants.items() if len(body) < len(data)}
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available) -> Optional[str]:
+    """
+    Alege codificarea din Accept-Encoding (br înaintea gzip)
+
+    Returns:
+        Content-Encoding ales sau None pentru varianta necomprimată
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+    for encoding in ENCODING_SUFFIXES:
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], etags) -> bool:
+    """Compararea slabă din If-None-Match față de ETag-urile resursei"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag in candidates for etag in etags)
+
+
+class CompressedResource:
+    """
+    O resursă statică în memorie, cu variantele precomprimate și ETag-uri
+
+    Fiecare variantă are propriul ETag puternic (o reprezentare diferită
+    trebuie să aibă alt ETag); un If-None-Match cu oricare dintre ele
+    primește 304, fiind același conținut.
+    """
+
+    __slots__ = ("content_type", "cache_control", "variants", "etags")
+
+    def __init__(self, body: bytes, content_type: str,
+                 cache_control: str = REVALIDATE_CACHE,
+                 variants: Optional[Mapping[str, bytes]] = None):
+        """
+        Args:
+            body: Conținutul necomprimat
+            content_type: Tipul MIME
+            cache_control: Valoarea Cache-Control
+            variants: Variantele precomprimate (implicit se calculează acum)
+        """
+        self.content_type = content_type
+        self.cache_control = cache_control
+        if variants is None:
+            compressible = content_type.startswith(("text/", "application/json",
+                                                    "application/javascript",
+                                                    "image/svg+xml"))
+            variants = compress_variants(body) if compressible else {}
+        self.variants: Dict[Optional[str], bytes] = {None: body, **variants}
+
+        digest = content_hash(body, 16)
+        self.etags = {
+            encoding: f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+            for encoding in self.variants
+        }
+
+    @property
+    def body(self) -> bytes:
+        return self.variants[None]
+
+    def respond(self, accept_encoding: Optional[str] = None,
+                if_none_match: Optional[str] = None) -> Tuple[int, bytes, Headers]:
+        """
+        Construiește răspunsul pentru antetele cererii
+
+        Returns:
+            (cod HTTP, corp, antete); 304 cu corp gol dacă ETag-ul clientului
+            este încă valid
+        """
+        encoding = negotiate_encoding(accept_encoding, self.variants)
+        headers = [
+            ("Content-Type", self.content_type),
+            ("ETag", self.etags[encoding]),
+            ("Cache-Control", self.cache_control),
+            ("Vary", "Accept-Encoding"),
+        ]
+        if etag_matches(if_none_match, self.etags.values()):
+            return 304, b"", headers
+        if encoding:
+            headers.append(("Content-Encoding", encoding))
+        return 200, self.variants[encoding], headers
+
+
+def _guess_type(path: str) -> str:
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def build_assets(static_folder: str, cdn_fallback: bool = False) -> Dict[str, str]:
+    """
+    Amprentează și precomprimă toate fișierele din folderul static
+
+    static/dist/ este reconstruit de la zero la fiecare rulare.
+
+    Args:
+        static_folder: Folderul static al aplicației
+        cdn_fallback: Acceptă lipsa asset-urilor externe (pagina le va
+            încărca de pe CDN)
+
+    Returns:
+        Manifestul: cale logică -> cale amprentată (relative la dist/)
+
+    Raises:
+        MissingAssetError: Un asset extern nu a fost inclus cu vendor.py
+    """
+    missing = missing_vendored(static_folder)
+    if missing and not cdn_fallback:
+        raise MissingAssetError(_missing_message(missing))
+
+    dist = os.path.join(static_folder, DIST_DIR)
+    if os.path.isdir(dist):
+        shutil.rmtree(dist)
+
+    manifest: Dict[str, str] = {}
+    for root, dirs, files in os.walk(static_folder):
+        if os.path.samefile(root, static_folder) and DIST_DIR in dirs:
+            dirs.remove(DIST_DIR)
+        dirs.sort()
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, static_folder).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                data = f.read()
+
+            stem, ext = posixpath.splitext(logical)
+            hashed = f"{stem}.{content_hash(data)}{ext}"
+            target = os.path.join(dist, *hashed.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(data)
+            if ext in COMPRESSIBLE:
+                for encoding, body in compress_variants(data).items():
+                    with open(target + ENCODING_SUFFIXES[encoding], "wb") as f:
+                        f.write(body)
+            manifest[logical] = hashed
+
+    os.makedirs(dist, exist_ok=True)
+    with open(os.path.join(dist, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    logger.info(f"Built {len(manifest)} fingerprinted assets in {dist}")
+    return manifest
+
+
+class AssetManifest:
+    """Rezolvă numele logice ale asset-urilor în URL-uri amprentate"""
+
+    def __init__(self, static_folder: Optional[str], static_url_path: str = "/static",
+                 fallbacks: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            static_folder: Folderul static (manifestul este în dist/)
+            static_url_path: Prefixul URL al fișierelor statice
+            fallbacks: URL-uri externe pentru asset-urile care lipsesc local
+                (de ex. CDN_FALLBACKS); implicit niciunul
+        """
+        self.static_folder = static_folder
+        self.static_url_path = static_url_path.rstrip("/")
+        self.fallbacks = fallbacks or {}
+        self.entries: Dict[str, str] = {}
+        path = os.path.join(static_folder or "", DIST_DIR, MANIFEST_NAME)
+        if static_folder and os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        elif static_folder:
+            logger.warning(f"No asset manifest at {path}; serving unfingerprinted assets")
+
+    def url(self, name: str) -> str:
+        """
+        URL-ul unui asset: varianta amprentată dacă a fost construită,
+        altfel fișierul original (mod dezvoltare, fără build), iar pentru
+        un asset extern încă neinclus, URL-ul din fallbacks
+        """
+        hashed = self.entries.get(name)
+        if hashed:
+            return f"{self.static_url_path}/{DIST_DIR}/{hashed}"
+        if name in self.fallbacks and not (
+                self.static_folder
+                and os.path.isfile(os.path.join(self.static_folder, *name.split("/")))):
+            return self.fallbacks[name]
+        return f"{self.static_url_path}/{name}"
+
+    def check_vendored(self, production: bool) -> None:
+        """
+        Verifică includerea asset-urilor externe
+
+        Fără fallbacks, lipsa lor oprește pornirea în producție; în
+        dezvoltare și testare doar se loghează.
+
+        Raises:
+            MissingAssetError: În producție, fără fallback-uri CDN
+        """
+        if not self.static_folder or self.fallbacks:
+            return
+        missing = [name for name in missing_vendored(self.static_folder)
+                   if name not in self.entries]
+        if not missing:
+            return
+        if production:
+            raise MissingAssetError(_missing_message(missing))
+        logger.warning(f"Vendored assets missing, the page will not load them: {', '.join(missing)}")
+
+
+class StaticFiles:
+    """
+    Servește fișierele din folderul static din memorie
+
+    Fiecare fișier este citit (împreună cu variantele .br/.gz construite)
+    o singură dată. Fișierele din dist/ au numele amprentat, deci nu se
+    schimbă: primesc Cache-Control: immutable și sunt servite din memorie
+    fără nicio verificare. Celelalte sunt revalidate prin ETag, iar intrarea
+    lor din cache este reîncărcată când se schimbă data modificării sau
+    dimensiunea fișierului (editările din dezvoltare apar imediat). Se
+    memorează doar fișierele existente, după calea normalizată, deci cache-ul
+    nu poate crește peste conținutul folderului static oricâte căi
+    inexistente ar cere clienții.
+    """
+
+    def __init__(self, static_folder: str):
+        self.static_folder = static_folder
+        self._cache: Dict[str, Tuple[Optional[Tuple[int, int]], CompressedResource]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[CompressedResource]:
+        """
+        Resursa pentru o cale relativă la folderul static
+
+        Returns:
+            CompressedResource sau None dacă fișierul nu există (sau calea
+            iese din folderul static)
+        """
+        normalized = posixpath.normpath(path)
+        entry = self._cache.get(normalized)
+        if entry is not None:
+            signature, resource = entry
+            if signature is None or signature == self._signature(normalized):
+                return resource
+
+        loaded = self._load(normalized)
+        with self._lock:
+            if loaded is None:
+                self._cache.pop(normalized, None)
+                return None
+            self._cache[normalized] = loaded
+        return loaded[1]
+
+    def _source(self, normalized: str) -> str:
+        return os.path.join(self.static_folder, *normalized.split("/"))
+
+    def _signature(self, normalized: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, dimensiune) sau None dacă fișierul a dispărut"""
+        try:
+            stat = os.stat(self._source(normalized))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, normalized: str
+              ) -> Optional[Tuple[Optional[Tuple[int, int]], CompressedResource]]:
+        if (normalized.startswith(("../", "/")) or normalized in ("..", ".")
+                or normalized.endswith(tuple(ENCODING_SUFFIXES.values()))):
+            return None
+        source = self._source(normalized)
+        if not os.path.isfile(source):
+            return None
+
+        immutable = normalized.startswith(DIST_DIR + "/")
+        # Semnătura se ia înainte de citire: o editare concurentă forțează reîncărcarea
+        signature = None if immutable else self._signature(normalized)
+        with open(source, "rb") as f:
+            body = f.read()
+        variants = None
+        if immutable:
+            variants = {}
+            for encoding, suffix in ENCODING_SUFFIXES.items():
+                if os.path.isfile(source + suffix):
+                    with open(source + suffix, "rb") as f:
+                        variants[encoding] = f.read()
+        return signature, CompressedResource(
+            body, _guess_type(source),
+            cache_control=IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE,
+            variants=variants,
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI pentru pasul de build"""
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "static")
+    parser = argparse.ArgumentParser(description="Amprentează și precomprimă asset-urile statice")
+    parser.add_argument("static_folder", nargs="?", default=os.path.normpath(default))
+    parser.add_argument("--cdn-fallback", action="store_true",
+                        help="Construiește și fără asset-urile externe (pagina le ia de pe CDN)")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = build_assets(args.static_folder, cdn_fallback=args.cdn_fallback)
+    except MissingAssetError as e:
+        print(e, file=sys.stderr)
+        return 1
+    for logical, hashed in sorted(manifest.items()):
+        print(f"{logical} -> {DIST_DIR}/{hashed}")
+    if brotli is None:
+        print("brotli nu este instalat: s-au generat doar variantele gzip")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
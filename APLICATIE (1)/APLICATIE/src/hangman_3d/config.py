@@ -11,6 +11,50 @@ class Config:
     TESTING = False
     JSON_SORT_KEYS = False
 
+    # Sesiuni de joc: 'memory' (un singur proces), 'sqlite' sau 'redis'
+    SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'memory')
+    SESSION_SQLITE_PATH = os.getenv('SESSION_SQLITE_PATH', 'sessions.db')
+    SESSION_REDIS_URL = os.getenv('SESSION_REDIS_URL', 'redis://localhost:6379/0')
+    GAME_SESSION_MAX = 50000
+    GAME_SESSION_TTL = 1800
+    GAME_SESSION_LOCK_STRIPES = 64
+
+    # Asset-urile externe (Three.js) se servesc din static/vendor/ (vendor.py);
+    # cu 1, cele lipsă se încarcă de pe CDN în loc să oprească pornirea
+    ASSET_CDN_FALLBACK = os.getenv('ASSET_CDN_FALLBACK', '0') == '1'
+
+    # Fișier de dicționar (WordDictionary.write); implicit lista WORDS
+    WORD_DICTIONARY_PATH = os.getenv('WORD_DICTIONARY_PATH')
+
+    # Serverul preforkat (server.py); SERVER_WORKERS = 0 înseamnă un worker per nucleu
+    SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
+    SERVER_PORT = int(os.getenv('PORT', '5000'))
+    SERVER_WORKERS = 1
+    SERVER_MAX_REQUESTS = 0
+    SERVER_MAX_REQUESTS_JITTER = 0
+    SERVER_GRACEFUL_TIMEOUT = 30
+    SERVER_BACKLOG = 2048
+    SERVER_ACCESS_LOG = True
+
+    # Limitarea ratei: (cereri pe secundă, rafală) per client și per rută
+    RATE_LIMIT_ENABLED = True
+    RATE_LIMIT_CLIENT = (20, 40)
+    RATE_LIMIT_ROUTES = {
+        '/start_game': (1, 5),
+        '/guess': (10, 20),
+        '/guess_batch': (5, 10),
+        '/hint': (2, 5),
+        '/update_time': (2, 4),
+        '/api/data/pipeline': (0.1, 1),
+    }
+    RATE_LIMIT_EXEMPT = ('/static/',)
+    RATE_LIMIT_MAX_CLIENTS = 100000
+    # Cereri în lucru simultan; peste plafon se răspunde imediat cu 503
+    MAX_CONCURRENT_REQUESTS = 256
+
+    # Histograme de latență și contoare per rută, expuse la /metrics
+    METRICS_ENABLED = True
+
 
 class DevelopmentConfig(Config):
     """Configurație pentru dezvoltare"""
@@ -22,6 +66,9 @@ class TestingConfig(Config):
     """Configurație pentru testare"""
     TESTING = True
     DEBUG = True
+    SESSION_BACKEND = 'memory'
+    GAME_SESSION_MAX = 1000
+    RATE_LIMIT_ENABLED = False
 
 
 class ProductionConfig(Config):
@@ -29,6 +76,14 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
 
+    # Worker-ii nu împart memoria: jocurile trebuie păstrate într-un backend comun
+    SESSION_BACKEND = os.getenv('SESSION_BACKEND', 'sqlite')
+
+    SERVER_WORKERS = int(os.getenv('WEB_CONCURRENCY', '0'))
+    SERVER_MAX_REQUESTS = int(os.getenv('SERVER_MAX_REQUESTS', '10000'))
+    SERVER_MAX_REQUESTS_JITTER = 1000
+    SERVER_ACCESS_LOG = False
+
 
 # Selectează config pe baza mediului
 config = {
@@ -3,30 +3,83 @@ Pipeline pentru colectare, procesare și export de date
 """
 
 import logging
+import os
+from functools import cached_property
+from typing import Any, Dict, List
 from .api_client import APIClient
 from .data_processor import DataProcessor
 from .csv_exporter import CSVExporter
-from .visualizer import DataVisualizer
+from .http_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Cât timp (secunde) se refolosesc răspunsurile fără revalidare, per endpoint
+CACHE_TTLS = {"/users": 3600, "/posts": 300, "/comments": 300}
+
+# Bugetul de latență al unui apel (secunde, cu reîncercări), per endpoint
+API_BUDGETS = {"/users": 3.0, "/posts": 5.0, "/comments": 5.0}
+
 
 class DataPipeline:
     """
     Pipeline complet pentru colectare și prelucrare de date
     """
     
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", use_cache: bool = True):
         """
         Inițializează pipeline-ul
         
         Args:
             output_dir: Directorul de output
+            use_cache: Păstrează răspunsurile API în output_dir/http_cache.sqlite3
         """
-        self.api_client = APIClient()
+        self.output_dir = output_dir
+        self.cache = None
+        if use_cache:
+            os.makedirs(output_dir, exist_ok=True)
+            self.cache = ResponseCache(os.path.join(output_dir, "http_cache.sqlite3"),
+                                       ttls=CACHE_TTLS)
+        self.api_client = APIClient(cache=self.cache, budgets=API_BUDGETS)
         self.processor = DataProcessor()
         self.csv_exporter = CSVExporter(output_dir)
-        self.visualizer = DataVisualizer(output_dir)
+    
+    def __enter__(self) -> "DataPipeline":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Închide clientul API (sesiunea și firele de dublare) și cache-ul HTTP"""
+        self.api_client.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    @cached_property
+    def visualizer(self):
+        """Visualizatorul, creat la primul grafic (matplotlib se importă greu)"""
+        from .visualizer import DataVisualizer
+        return DataVisualizer(self.output_dir)
+    
+    def join_comments(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Atașează comentariile fiecărei postări
+        
+        Comentariile tuturor postărilor se cer împreună (fetch_comments_bulk),
+        nu câte o cerere per postare.
+        
+        Args:
+            posts: Lista de postări
+            
+        Returns:
+            Postări noi, cu câmpurile comments și comment_count
+        """
+        by_post = self.api_client.fetch_comments_bulk(post["id"] for post in posts)
+        joined = []
+        for post in posts:
+            comments = by_post.get(post["id"], [])
+            joined.append({**post, "comments": comments, "comment_count": len(comments)})
+        return joined
     
     def run_full_pipeline(self) -> dict:
         """
@@ -40,6 +93,9 @@ class DataPipeline:
         results = {
             "posts_csv": None,
             "posts_chart": None,
+            "comments_csv": None,
+            "posts_comments_csv": None,
+            "api_latency": None,
             "users_csv": None,
             "users_chart": None
         }
@@ -60,6 +116,18 @@ class DataPipeline:
                     "Posts by User", 
                     "posts_by_user"
                 )
+                
+                # Atașează comentariile postărilor: postările cu numărul de
+                # comentarii și comentariile, fiecare în CSV-ul lor
+                logger.info("Joining comments onto posts")
+                joined = self.join_comments(posts)
+                results["posts_comments_csv"] = self.csv_exporter.export_data(
+                    [{key: value for key, value in post.items() if key != "comments"}
+                     for post in joined],
+                    "posts_with_comments"
+                )
+                comments = [comment for post in joined for comment in post["comments"]]
+                results["comments_csv"] = self.csv_exporter.export_data(comments, "comments_data")
             
             # 2. Colectează utilizatori
             logger.info("Step 2: Collecting users from API")
@@ -83,4 +151,10 @@ class DataPipeline:
         except Exception as e:
             logger.error(f"Error in pipeline: {e}")
         
+        # Latențele apelurilor către API, pentru reglarea bugetelor
+        results["api_latency"] = self.api_client.latency_stats()
+        for row in results["api_latency"]:
+            logger.info(f"API {row['endpoint']}: {row['requests']} requests, "
+                        f"p95 {row['p95_ms']} ms, {row['hedged']} hedged, {row['errors']} errors")
+        
         return results
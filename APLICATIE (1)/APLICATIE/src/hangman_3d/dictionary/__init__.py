@@ -0,0 +1,63 @@
+"""
+Subsistemul de dicționar: cuvinte indexate pe nivel, lungime și literă
+"""
+
+import threading
+from typing import Optional
+import logging
+
+from .store import WordDictionary, ALPHABET, normalize_word
+from ..utils.words import WORDS, DIFFICULTIES
+
+logger = logging.getLogger(__name__)
+
+_active: Optional[WordDictionary] = None
+_lock = threading.Lock()
+
+
+def get_dictionary() -> WordDictionary:
+    """
+    Returnează dicționarul activ
+
+    Dacă nu a fost încărcat niciun fișier, se construiește (o singură dată)
+    un dicționar în memorie din lista implicită WORDS.
+    """
+    global _active
+    if _active is None:
+        with _lock:
+            if _active is None:
+                _active = WordDictionary.from_words(WORDS)
+    return _active
+
+
+def set_dictionary(dictionary: WordDictionary) -> None:
+    """Înlocuiește dicționarul activ"""
+    global _active
+    with _lock:
+        _active = dictionary
+
+
+def load_dictionary(path: str) -> WordDictionary:
+    """
+    Încarcă un fișier de dicționar și îl face activ
+
+    Args:
+        path: Calea fișierului de dicționar
+
+    Returns:
+        Dicționarul încărcat
+    """
+    dictionary = WordDictionary.load(path)
+    set_dictionary(dictionary)
+    return dictionary
+
+
+__all__ = [
+    "WordDictionary",
+    "ALPHABET",
+    "DIFFICULTIES",
+    "normalize_word",
+    "get_dictionary",
+    "set_dictionary",
+    "load_dictionary",
+]
@@ -0,0 +1,182 @@
+"""
+Clasificare automată a cuvintelor pe niveluri de dificultate (vectorizat cu NumPy)
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.dictionary.classifier words.txt words.dict \
+        [--solve-rates rates.csv]
+"""
+
+import argparse
+import csv
+import sys
+from typing import Dict, List, Mapping, Optional, Sequence
+import logging
+
+import numpy as np
+
+from .store import ALPHABET, WordDictionary, normalize_word
+from ..utils.words import DIFFICULTIES
+
+logger = logging.getLogger(__name__)
+
+# Ponderile componentelor scorului (valori standardizate)
+LENGTH_WEIGHT = 0.4
+DISTINCT_WEIGHT = 0.3
+RARITY_WEIGHT = 0.3
+# Cât contează rata empirică de rezolvare, când este cunoscută
+SOLVE_RATE_WEIGHT = 0.5
+
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    """Transformă valorile în scoruri z (deviație zero -> zero)"""
+    std = values.std()
+    if std == 0:
+        return np.zeros_like(values, dtype=np.float64)
+    return (values - values.mean()) / std
+
+
+def word_features(words: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Calculează caracteristicile tuturor cuvintelor, fără bucle per literă
+
+    Args:
+        words: Cuvinte normalizate (majuscule A-Z)
+
+    Returns:
+        Dicționar cu array-urile length, distinct și rarity
+    """
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    letters = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8) - 65
+    rows = np.repeat(np.arange(len(words)), lengths)
+
+    # Matrice de prezență cuvânt x literă
+    presence = np.zeros((len(words), len(ALPHABET)), dtype=bool)
+    presence[rows, letters] = True
+    distinct = presence.sum(axis=1)
+
+    # Raritatea: media lui -log(frecvență) peste literele distincte ale cuvântului
+    frequency = np.bincount(letters, minlength=len(ALPHABET)) / max(1, len(letters))
+    surprisal = -np.log(np.maximum(frequency, 1e-9))
+    rarity = (presence @ surprisal) / np.maximum(distinct, 1)
+
+    return {"length": lengths, "distinct": distinct, "rarity": rarity}
+
+
+def score_words(words: Sequence[str],
+                solve_rates: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculează scorul de dificultate al fiecărui cuvânt (mai mare = mai greu)
+
+    Args:
+        words: Cuvinte normalizate
+        solve_rates: Rata de rezolvare (0-1) per cuvânt, NaN unde lipsește
+
+    Returns:
+        Array float64 cu scorurile
+    """
+    features = word_features(words)
+    score = (LENGTH_WEIGHT * _standardize(features["length"].astype(np.float64))
+             + DISTINCT_WEIGHT * _standardize(features["distinct"].astype(np.float64))
+             + RARITY_WEIGHT * _standardize(features["rarity"]))
+
+    if solve_rates is not None:
+        known = ~np.isnan(solve_rates)
+        if known.any():
+            empirical = np.zeros_like(score)
+            empirical[known] = _standardize(1.0 - solve_rates[known])
+            score = np.where(known,
+                             (1 - SOLVE_RATE_WEIGHT) * score + SOLVE_RATE_WEIGHT * empirical,
+                             score)
+    return score
+
+
+def bucket_scores(scores: np.ndarray,
+                  quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> np.ndarray:
+    """
+    Împarte scorurile în niveluri după cuantile
+
+    Returns:
+        Array cu indexul nivelului (0 = usor ... 3 = expert) pentru fiecare scor
+    """
+    if len(scores) == 0:
+        return np.zeros(0, dtype=np.int64)
+    thresholds = np.quantile(scores, quantiles)
+    return np.searchsorted(thresholds, scores, side="right")
+
+
+def classify(words: Sequence[str],
+             solve_rates: Optional[Mapping[str, float]] = None,
+             quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> Dict[str, List[str]]:
+    """
+    Clasifică o listă de cuvinte pe niveluri de dificultate
+
+    Args:
+        words: Cuvinte brute (se normalizează; invalidele și duplicatele se ignoră)
+        solve_rates: cuvânt -> rata de rezolvare, opțional
+        quantiles: Pragurile (cuantile) dintre niveluri
+
+    Returns:
+        nivel -> cuvinte, gata pentru WordDictionary.write
+    """
+    unique = list(dict.fromkeys(w for w in map(normalize_word, words) if w))
+    rates = None
+    if solve_rates:
+        normalized = {normalize_word(w): r for w, r in solve_rates.items()}
+        rates = np.array([normalized.get(w, np.nan) for w in unique], dtype=np.float64)
+
+    buckets = bucket_scores(score_words(unique, rates), quantiles)
+    order = np.argsort(buckets, kind="stable")
+    counts = np.bincount(buckets, minlength=len(DIFFICULTIES))
+
+    result: Dict[str, List[str]] = {}
+    start = 0
+    for level, difficulty in enumerate(DIFFICULTIES):
+        ids = order[start:start + counts[level]]
+        result[difficulty] = [unique[i] for i in ids]
+        start += counts[level]
+    return result
+
+
+def read_words(path: str) -> List[str]:
+    """
+    Citește cuvintele dintr-un fișier text (un cuvânt pe linie) sau
+    dintr-un fișier de dicționar existent
+    """
+    if WordDictionary.is_dictionary_file(path):
+        dictionary = WordDictionary.load(path)
+        return [dictionary[i] for i in range(len(dictionary))]
+
+    with open(path, encoding="utf-8") as f:
+        return [line.split("\t", 1)[0] for line in f if line.strip()]
+
+
+def read_solve_rates(path: str) -> Dict[str, float]:
+    """Citește un CSV cu coloanele word și solve_rate"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row["word"]: float(row["solve_rate"]) for row in csv.DictReader(f)}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI pentru reclasificare offline"""
+    parser = argparse.ArgumentParser(
+        description="Clasifică automat cuvintele pe niveluri și scrie dicționarul indexat"
+    )
+    parser.add_argument("input", help="Listă de cuvinte (un cuvânt pe linie) sau fișier .dict")
+    parser.add_argument("output", help="Fișierul de dicționar rezultat")
+    parser.add_argument("--solve-rates", help="CSV cu coloanele word,solve_rate")
+    parser.add_argument("--quantiles", type=float, nargs=3, default=[0.25, 0.5, 0.75],
+                        metavar=("Q1", "Q2", "Q3"), help="Pragurile dintre niveluri")
+    args = parser.parse_args(argv)
+
+    words = read_words(args.input)
+    rates = read_solve_rates(args.solve_rates) if args.solve_rates else None
+    buckets = classify(words, rates, args.quantiles)
+    size = WordDictionary.write(args.output, buckets)
+
+    summary = ", ".join(f"{d}={len(w)}" for d, w in buckets.items())
+    print(f"{args.output}: {sum(map(len, buckets.values()))} cuvinte ({summary}), {size} octeți")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Solver Hangman pe bitset-uri peste dicționar (indicii și adversar AI)
+"""
+
+import math
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+import logging
+
+from .store import ALPHABET, WordDictionary
+
+logger = logging.getLogger(__name__)
+
+
+class Hint(NamedTuple):
+    """Rezultatul unei interogări a solver-ului"""
+    letter: Optional[str]
+    probability: float
+    candidates: int
+    letter_counts: Dict[str, int]
+
+
+class _LengthGroup:
+    """Bitset-urile cuvintelor de aceeași lungime (bitul j = al j-lea cuvânt)"""
+
+    __slots__ = ("ids", "all", "positions", "presence")
+
+    def __init__(self, ids: Sequence[int], all_bits: int,
+                 positions: List[List[int]], presence: List[int]):
+        self.ids = ids
+        self.all = all_bits
+        # positions[p][litera] = cuvintele care au litera pe poziția p
+        self.positions = positions
+        # presence[litera] = cuvintele care conțin litera
+        self.presence = presence
+
+
+def _to_bitset(bits) -> int:
+    """Transformă un array boolean NumPy într-un întreg (bitul j = bits[j])"""
+    import numpy as np
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+
+class HangmanSolver:
+    """
+    Găsește cuvintele compatibile cu o stare de joc și litera recomandată
+
+    Pentru fiecare lungime de cuvânt se precalculează bitset-uri per
+    (poziție, literă) și per literă (prezență). O interogare se reduce la
+    câteva operații AND/AND NOT și numărări de biți (int.bit_count),
+    indiferent de mărimea dicționarului.
+    """
+
+    def __init__(self, dictionary: WordDictionary):
+        """
+        Construiește bitset-urile pentru toate lungimile din dicționar
+
+        Args:
+            dictionary: Dicționarul de cuvinte
+        """
+        import numpy as np
+
+        self.dictionary = dictionary
+        self._groups: Dict[int, _LengthGroup] = {}
+
+        for length in range(1, dictionary.max_length + 1):
+            ids = dictionary.ids_by_length(length)
+            if not len(ids):
+                continue
+            buffer = b"".join(dictionary.word_bytes(word_id) for word_id in ids)
+            letters = np.frombuffer(buffer, dtype=np.uint8).reshape(len(ids), length) - 65
+
+            positions = [
+                [_to_bitset(letters[:, pos] == code) for code in range(len(ALPHABET))]
+                for pos in range(length)
+            ]
+            presence = [(letters == code).any(axis=1) for code in range(len(ALPHABET))]
+            self._groups[length] = _LengthGroup(
+                ids, (1 << len(ids)) - 1, positions, [_to_bitset(bits) for bits in presence]
+            )
+
+        logger.info(f"Built solver bitsets for {len(dictionary)} words")
+
+    def candidates_bitset(self, pattern: str, wrong_letters: str = "") -> int:
+        """
+        Calculează bitset-ul cuvintelor compatibile cu starea jocului
+
+        Args:
+            pattern: Cuvântul afișat, cu '_' pentru literele ascunse
+            wrong_letters: Literele încercate care nu sunt în cuvânt
+
+        Returns:
+            Bitset peste cuvintele de lungimea len(pattern)
+        """
+        group = self._groups.get(len(pattern))
+        if group is None:
+            return 0
+
+        revealed = {char for char in pattern if char != "_"}
+        bits = group.all
+        for pos, char in enumerate(pattern):
+            row = group.positions[pos]
+            if char != "_":
+                bits &= row[ord(char) - 65]
+            else:
+                # O literă dezvăluită apare pe toate pozițiile ei
+                for letter in revealed:
+                    bits &= ~row[ord(letter) - 65]
+        for letter in wrong_letters:
+            bits &= ~group.presence[ord(letter) - 65]
+        return bits
+
+    def candidates(self, pattern: str, wrong_letters: str = "",
+                   limit: Optional[int] = None) -> Iterator[str]:
+        """Cuvintele compatibile cu starea jocului (cel mult `limit`)"""
+        bits = self.candidates_bitset(pattern.upper(), wrong_letters.upper())
+        ids = self._groups[len(pattern)].ids if bits else ()
+        produced = 0
+        while bits and (limit is None or produced < limit):
+            low = bits & -bits
+            yield self.dictionary[ids[low.bit_length() - 1]]
+            bits ^= low
+            produced += 1
+
+    def suggest(self, pattern: str, wrong_letters: str = "") -> Hint:
+        """
+        Recomandă următoarea literă
+
+        Se alege litera neîncercată prezentă în cele mai multe cuvinte
+        candidate (probabilitatea maximă de a fi corectă); la egalitate,
+        cea mai informativă: cea al cărei răspuns (pozițiile pe care apare
+        litera, sau absența ei) împarte candidații în grupuri cât mai
+        echilibrate (entropia maximă a partiției).
+
+        Args:
+            pattern: Cuvântul afișat, cu '_' pentru literele ascunse
+            wrong_letters: Literele încercate care nu sunt în cuvânt
+
+        Returns:
+            Hint cu litera, probabilitatea și numărul de candidați
+        """
+        pattern = pattern.upper()
+        wrong_letters = wrong_letters.upper()
+        bits = self.candidates_bitset(pattern, wrong_letters)
+        total = bits.bit_count()
+        if not total:
+            return Hint(None, 0.0, 0, {})
+
+        tried = set(pattern) | set(wrong_letters)
+        presence = self._groups[len(pattern)].presence
+        counts = {
+            letter: (bits & presence[idx]).bit_count()
+            for idx, letter in enumerate(ALPHABET)
+            if letter not in tried
+        }
+
+        most = max(counts.values(), default=0)
+        if not most:
+            return Hint(None, 0.0, total, counts)
+        tied = [letter for letter in counts if counts[letter] == most]
+        best = tied[0] if len(tied) == 1 else max(
+            tied, key=lambda letter: self._split_entropy(pattern, bits, total, letter)
+        )
+        return Hint(best, most / total, total, counts)
+
+    def _split_entropy(self, pattern: str, bits: int, total: int, letter: str) -> float:
+        """
+        Entropia partiției candidaților după răspunsul la o literă
+
+        Candidații cu același răspuns (aceleași poziții ale literei, sau
+        litera absentă) ajung în același grup.
+        """
+        group = self._groups[len(pattern)]
+        idx = ord(letter) - 65
+        groups = [bits & group.presence[idx]]
+        for pos, char in enumerate(pattern):
+            if char != "_":
+                continue
+            row = group.positions[pos][idx]
+            groups = [part for g in groups for part in (g & row, g & ~row) if part]
+        groups.append(bits & ~group.presence[idx])
+        entropy = 0.0
+        for part in groups:
+            count = part.bit_count()
+            if count:
+                p = count / total
+                entropy -= p * math.log2(p)
+        return entropy
+
+
+_solvers: Dict[int, HangmanSolver] = {}
+_solvers_lock = threading.Lock()
+
+
+def get_solver(dictionary: WordDictionary) -> HangmanSolver:
+    """
+    Returnează solver-ul pentru un dicționar, construindu-l o singură dată
+
+    Args:
+        dictionary: Dicționarul activ
+
+    Returns:
+        Instanța HangmanSolver memorată pentru acel dicționar
+    """
+    solver = _solvers.get(id(dictionary))
+    if solver is None or solver.dictionary is not dictionary:
+        with _solvers_lock:
+            solver = _solvers.get(id(dictionary))
+            if solver is None or solver.dictionary is not dictionary:
+                solver = HangmanSolver(dictionary)
+                _solvers.clear()
+                _solvers[id(dictionary)] = solver
+    return solver
@@ -0,0 +1,295 @@
+"""
+Dicționar de cuvinte compact, stocat într-un buffer contiguu cu offset-uri
+"""
+
+import mmap
+import random
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+from ..utils.words import DIFFICULTIES
+
+logger = logging.getLogger(__name__)
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Antet fișier: magic, versiune, ordinea octeților, număr cuvinte,
+# lungime maximă, total intrări în indexul pe litere, lungime buffer
+_MAGIC = b"HMDICT01"
+_HEADER = struct.Struct("<8sBB2xIIII8x")
+_FORMAT_VERSION = 1
+_BYTEORDER = {"little": 0, "big": 1}
+
+
+def normalize_word(word: str) -> Optional[str]:
+    """
+    Normalizează un cuvânt pentru joc
+
+    Returns:
+        Cuvântul cu majuscule sau None dacă nu conține doar litere A-Z
+    """
+    word = word.strip().upper()
+    if not word or len(word) > 255 or not word.isascii() or not word.isalpha():
+        return None
+    return word
+
+
+class WordDictionary:
+    """
+    Dicționar de cuvinte read-only, potrivit pentru milioane de cuvinte
+
+    Cuvintele stau într-un singur buffer ASCII, delimitate de un array de
+    offset-uri. ID-urile sunt alocate pe niveluri de dificultate, astfel încât
+    fiecare nivel este un interval contiguu și alegerea aleatoare este O(1).
+    Indexurile pe lungime, pe literă și ordinea lexicografică sunt array-uri
+    de uint32 din același fișier; încărcat prin mmap, fișierul este partajat
+    de toate procesele worker.
+    """
+
+    def __init__(self, data, source: str = "<memory>"):
+        """
+        Construiește dicționarul peste datele unui fișier de dicționar
+
+        Args:
+            data: bytes sau mmap cu conținutul produs de build()
+            source: Descriere a sursei (pentru log-uri)
+        """
+        magic, version, byteorder, count, max_len, letter_total, buffer_len = \
+            _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"Fișier de dicționar invalid: {source}")
+        if byteorder != _BYTEORDER[sys.byteorder]:
+            raise ValueError(f"Dicționar construit pe altă arhitectură: {source}")
+
+        self.source = source
+        self.max_length = max_len
+        self._data = data
+        self._count = count
+
+        view = memoryview(data)
+        offset = _HEADER.size
+
+        def section(length: int) -> memoryview:
+            nonlocal offset
+            part = view[offset:offset + 4 * length].cast("I")
+            offset += 4 * length
+            return part
+
+        self._offsets = section(count + 1)
+        self._difficulty_starts = section(len(DIFFICULTIES) + 1)
+        self._length_starts = section(max_len + 2)
+        self._length_ids = section(count)
+        self._letter_starts = section(len(ALPHABET) + 1)
+        self._letter_ids = section(letter_total)
+        self._sorted_ids = section(count)
+        self._buffer_start = offset
+        self._ranges = {
+            difficulty: range(self._difficulty_starts[level], self._difficulty_starts[level + 1])
+            for level, difficulty in enumerate(DIFFICULTIES)
+        }
+
+        self.letter_index = lru_cache(maxsize=65536)(self._letter_index)
+
+    @staticmethod
+    def build(words_by_difficulty: Mapping[str, Iterable[str]]) -> bytes:
+        """
+        Serializează cuvintele în formatul binar al dicționarului
+
+        Cuvintele invalide și duplicatele sunt ignorate (un cuvânt rămâne
+        în primul nivel în care apare).
+
+        Args:
+            words_by_difficulty: nivel -> cuvinte
+
+        Returns:
+            Conținutul fișierului de dicționar
+        """
+        words: List[str] = []
+        seen = set()
+        difficulty_starts = array("I", [0])
+        for difficulty in DIFFICULTIES:
+            for raw in words_by_difficulty.get(difficulty, ()):
+                word = normalize_word(raw)
+                if word is None or word in seen:
+                    continue
+                seen.add(word)
+                words.append(word)
+            difficulty_starts.append(len(words))
+
+        count = len(words)
+        max_len = max(map(len, words), default=0)
+
+        offsets = array("I", [0])
+        total = 0
+        for word in words:
+            total += len(word)
+            offsets.append(total)
+        buffer = "".join(words).encode("ascii")
+
+        # Index pe lungime: ID-uri ordonate după lungime, cu început per lungime
+        length_ids = array("I", sorted(range(count), key=lambda i: len(words[i])))
+        length_starts = array("I", [0] * (max_len + 2))
+        for word in words:
+            length_starts[len(word) + 1] += 1
+        for length in range(1, max_len + 2):
+            length_starts[length] += length_starts[length - 1]
+
+        # Index pe literă: ID-urile cuvintelor care conțin fiecare literă
+        per_letter: List[List[int]] = [[] for _ in ALPHABET]
+        for word_id, word in enumerate(words):
+            for char in set(word):
+                per_letter[ord(char) - 65].append(word_id)
+        letter_starts = array("I", [0])
+        letter_ids = array("I")
+        for ids in per_letter:
+            letter_ids.extend(ids)
+            letter_starts.append(len(letter_ids))
+
+        sorted_ids = array("I", sorted(range(count), key=words.__getitem__))
+
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _BYTEORDER[sys.byteorder],
+                              count, max_len, len(letter_ids), len(buffer))
+        return b"".join([
+            header,
+            offsets.tobytes(),
+            difficulty_starts.tobytes(),
+            length_starts.tobytes(),
+            length_ids.tobytes(),
+            letter_starts.tobytes(),
+            letter_ids.tobytes(),
+            sorted_ids.tobytes(),
+            buffer,
+        ])
+
+    @classmethod
+    def from_words(cls, words_by_difficulty: Mapping[str, Iterable[str]]) -> "WordDictionary":
+        """Construiește un dicționar în memorie"""
+        return cls(cls.build(words_by_difficulty))
+
+    @classmethod
+    def write(cls, path: str, words_by_difficulty: Mapping[str, Iterable[str]]) -> int:
+        """
+        Scrie un fișier de dicționar
+
+        Returns:
+            Numărul de octeți scriși
+        """
+        data = cls.build(words_by_difficulty)
+        with open(path, "wb") as f:
+            f.write(data)
+        logger.info(f"Wrote word dictionary to {path} ({len(data)} bytes)")
+        return len(data)
+
+    @staticmethod
+    def is_dictionary_file(path: str) -> bool:
+        """Verifică dacă fișierul are antetul unui dicționar"""
+        with open(path, "rb") as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+
+    @classmethod
+    def load(cls, path: str) -> "WordDictionary":
+        """
+        Încarcă un fișier de dicționar prin mmap (fără a-l parsa)
+
+        Args:
+            path: Calea fișierului produs de write()
+
+        Returns:
+            Instanță WordDictionary
+        """
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        dictionary = cls(data, source=path)
+        logger.info(f"Loaded word dictionary {path}: {len(dictionary)} words")
+        return dictionary
+
+    def __len__(self) -> int:
+        return self._count
+
+    def word_bytes(self, word_id: int) -> bytes:
+        """Cuvântul cu ID-ul dat, ca octeți ASCII"""
+        base = self._buffer_start
+        return self._data[base + self._offsets[word_id]:base + self._offsets[word_id + 1]]
+
+    def __getitem__(self, word_id: int) -> str:
+        if not 0 <= word_id < self._count:
+            raise IndexError(word_id)
+        return self.word_bytes(word_id).decode("ascii")
+
+    def word_length(self, word_id: int) -> int:
+        """Lungimea cuvântului, fără a-l decoda"""
+        return self._offsets[word_id + 1] - self._offsets[word_id]
+
+    def index_of(self, word: str) -> Optional[int]:
+        """
+        Caută ID-ul unui cuvânt (căutare binară în ordinea lexicografică)
+
+        Returns:
+            ID-ul sau None dacă nu există
+        """
+        target = word.upper().encode("ascii", "ignore")
+        pos = bisect_left(self._sorted_ids, target, key=self.word_bytes)
+        if pos < self._count and self.word_bytes(self._sorted_ids[pos]) == target:
+            return self._sorted_ids[pos]
+        return None
+
+    def __contains__(self, word: str) -> bool:
+        return self.index_of(word) is not None
+
+    def word_ids(self, difficulty: str) -> range:
+        """ID-urile cuvintelor unui nivel (interval contiguu)"""
+        return self._ranges[difficulty]
+
+    def difficulty_of(self, word_id: int) -> str:
+        """Nivelul de dificultate al unui cuvânt"""
+        return DIFFICULTIES[bisect_left(self._difficulty_starts, word_id + 1) - 1]
+
+    def ids_by_length(self, length: int) -> Sequence[int]:
+        """ID-urile cuvintelor cu lungimea dată"""
+        if not 0 < length <= self.max_length:
+            return ()
+        return self._length_ids[self._length_starts[length]:self._length_starts[length + 1]]
+
+    def ids_with_letter(self, letter: str) -> Sequence[int]:
+        """ID-urile (crescătoare) ale cuvintelor care conțin litera"""
+        idx = ord(letter.upper()) - 65
+        return self._letter_ids[self._letter_starts[idx]:self._letter_starts[idx + 1]]
+
+    def random_id(self, difficulty: str, rng: random.Random = random) -> int:
+        """
+        Alege în O(1) un cuvânt aleator dintr-un nivel
+
+        Raises:
+            ValueError: Dacă nivelul nu are cuvinte
+        """
+        ids = self._ranges[difficulty]
+        if not ids:
+            raise ValueError(f"Niciun cuvânt pentru nivelul {difficulty}")
+        return ids.start + rng.randrange(len(ids))
+
+    def counts(self) -> Dict[str, int]:
+        """Numărul de cuvinte pe fiecare nivel"""
+        return {difficulty: len(self.word_ids(difficulty)) for difficulty in DIFFICULTIES}
+
+    def _letter_index(self, word_id: int) -> Tuple[int, Tuple[Tuple[int, ...], ...]]:
+        """
+        Precalculează indexul literă -> poziții pentru un cuvânt
+
+        Rezultatul este memorat (lru_cache per dicționar) și partajat de
+        toate jocurile cu același cuvânt.
+
+        Returns:
+            (masca literelor din cuvânt, tuplu de 26 tupluri cu pozițiile fiecărei litere)
+        """
+        positions: List[List[int]] = [[] for _ in ALPHABET]
+        mask = 0
+        for pos, code in enumerate(self.word_bytes(word_id)):
+            idx = code - 65
+            positions[idx].append(pos)
+            mask |= 1 << idx
+        return mask, tuple(tuple(p) for p in positions)
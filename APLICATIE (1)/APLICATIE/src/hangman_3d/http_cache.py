@@ -0,0 +1,217 @@
+"""
+Cache pe disc pentru răspunsurile API-urilor externe (cereri condiționate)
+
+Răspunsurile se păstrează într-o bază SQLite: corpul brut comprimat cu zlib
+și forma deja parsată, serializată cu pickle. Un răspuns proaspăt (în TTL-ul
+endpoint-ului) sau un 304 la revalidare (If-None-Match / If-Modified-Since)
+nu mai trec nici prin rețea, nici prin parsarea JSON.
+
+Peste max_bytes se elimină intrările folosite cel mai demult (LRU).
+Fișierul cache-ului conține pickle-uri: nu trebuie să poată fi scris de alți
+utilizatori.
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+import logging
+
+from requests.utils import parse_header_links
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    link TEXT,
+    stored REAL NOT NULL,
+    used REAL NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    parsed BLOB
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+"""
+
+
+class CachedResponse(NamedTuple):
+    """Un răspuns din cache"""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    link: Optional[str]
+    stored: float  # momentul ultimei descărcări sau revalidări
+    body: bytes  # corpul brut, comprimat
+    parsed: Optional[bytes]  # corpul parsat, serializat cu pickle
+
+    def data(self) -> Any:
+        """Corpul parsat (o copie nouă la fiecare apel)"""
+        if self.parsed is not None:
+            try:
+                return pickle.loads(self.parsed)
+            except Exception as e:
+                logger.warning(f"Unreadable cached form of {self.url}, re-parsing: {e}")
+        return json.loads(zlib.decompress(self.body))
+
+    def links(self) -> Dict[str, Dict[str, str]]:
+        """Antetul Link parsat, ca requests.Response.links"""
+        if not self.link:
+            return {}
+        return {link.get("rel") or link.get("url"): link for link in parse_header_links(self.link)}
+
+    def validators(self) -> Dict[str, str]:
+        """Antetele unei cereri condiționate"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache HTTP într-un fișier SQLite, comun firelor și proceselor
+
+    Fiecare fir are propria conexiune (mod WAL), ca la SQLiteSessionStore.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024,
+                 ttls: Optional[Mapping[str, float]] = None, default_ttl: float = 0.0,
+                 compress_level: int = 6, clock: Callable[[], float] = time.time):
+        """
+        Inițializează cache-ul
+
+        Args:
+            path: Calea fișierului de bază de date
+            max_bytes: Dimensiunea maximă a intrărilor (comprimate)
+            ttls: Prefix de cale (de ex. "/users") -> secunde în care un
+                răspuns se folosește fără revalidare
+            default_ttl: TTL-ul căilor fără prefix în ttls (0 = se
+                revalidează la fiecare cerere)
+            compress_level: Nivelul de compresie zlib al corpurilor
+            clock: Sursa de timp (ceas de perete, comun proceselor)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        # Prefixele cele mai lungi se verifică primele
+        self.ttls = sorted((ttls or {}).items(), key=lambda item: -len(item[0]))
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self._clock = clock
+        self._local = threading.local()
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Returnează conexiunea firului curent, creând-o la nevoie"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def ttl(self, path: str) -> float:
+        """TTL-ul unei căi (relative la base_url-ul clientului)"""
+        for prefix, seconds in self.ttls:
+            if path.startswith(prefix):
+                return seconds
+        return self.default_ttl
+
+    def is_fresh(self, entry: CachedResponse, path: str) -> bool:
+        """Poate fi folosit răspunsul fără a întreba serverul?"""
+        return self._clock() - entry.stored < self.ttl(path)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Caută un răspuns și îl marchează drept folosit recent"""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT url, etag, last_modified, link, stored, body, parsed "
+            "FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE responses SET used = ? WHERE url = ?", (self._clock(), url))
+        return CachedResponse(*row)
+
+    def put(self, url: str, headers: Mapping[str, str], body: bytes, data: Any) -> bool:
+        """
+        Salvează un răspuns 200
+
+        Args:
+            url: URL-ul complet (cu query string)
+            headers: Antetele răspunsului
+            body: Corpul brut
+            data: Corpul parsat
+
+        Returns:
+            False dacă răspunsul nu se poate păstra (no-store sau prea mare)
+        """
+        if "no-store" in headers.get("Cache-Control", ""):
+            return False
+        compressed = zlib.compress(body, self.compress_level)
+        try:
+            parsed: Optional[bytes] = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            parsed = None
+        size = len(compressed) + len(parsed or b"")
+        if size > self.max_bytes:
+            return False
+
+        now = self._clock()
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(url, etag, last_modified, link, stored, used, size, body, parsed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, headers.get("ETag"), headers.get("Last-Modified"), headers.get("Link"),
+             now, now, size, compressed, parsed)
+        )
+        self._evict()
+        return True
+
+    def revalidated(self, url: str, headers: Mapping[str, str]) -> None:
+        """Marchează un răspuns drept confirmat de server (304)"""
+        self._conn().execute(
+            "UPDATE responses SET stored = ?, etag = COALESCE(?, etag), "
+            "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+            (self._clock(), headers.get("ETag"), headers.get("Last-Modified"), url)
+        )
+
+    def _evict(self) -> int:
+        """Elimină intrările folosite cel mai demult, peste max_bytes"""
+        removed = self._conn().execute(
+            "DELETE FROM responses WHERE url IN ("
+            " SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY used DESC, url) AS total"
+            " FROM responses) WHERE total > ?)",
+            (self.max_bytes,)
+        ).rowcount
+        if removed:
+            logger.info(f"Evicted {removed} responses from {self.path}")
+        return removed
+
+    def size(self) -> int:
+        """Dimensiunea totală a intrărilor (octeți)"""
+        return self._conn().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,84 @@
+"""
+Serializare JSON rapidă (orjson, cu fallback pe json din biblioteca standard)
+"""
+
+import json
+from typing import Any, Mapping
+
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson este opțional
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ConstantPayload(dict):
+    """
+    Corp JSON constant, serializat o singură dată la definire
+
+    Se comportă ca un dict read-only; dumps() returnează direct octeții
+    precalculați.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, payload: Mapping[str, Any]):
+        super().__init__(payload)
+        self.encoded = _encode(dict(payload))
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("ConstantPayload nu poate fi modificat")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+def _encode(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=DefaultJSONProvider.default, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializează un obiect în JSON compact (UTF-8)"""
+    if type(obj) is ConstantPayload:
+        return obj.encoded
+    return _encode(obj)
+
+
+def loads(data: Any) -> Any:
+    """Deserializează JSON din str sau bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(JSONProvider):
+    """
+    JSONProvider pentru Flask bazat pe orjson
+
+    Răspunsurile sunt construite direct din octeți, fără conversia
+    intermediară în str; corpurile ConstantPayload nu se mai serializează.
+    """
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", DefaultJSONProvider.default)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
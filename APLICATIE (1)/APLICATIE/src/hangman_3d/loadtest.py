@@ -0,0 +1,362 @@
+"""
+Generator de încărcare: sesiuni de jucători simulate contra aplicației
+
+Fiecare jucător virtual pornește un joc (/start_game, cu dificultatea
+aleasă după un amestec ponderat) și ghicește litere până la sfârșitul
+jocului. Cât timp „se gândește”, resincronizează cronometrul prin
+/update_time la fiecare --timer-interval secunde: implicit 30, ca pagina
+fără WebSocket/SSE (TIMER_SYNC_SECONDS din static/js/game.js); cu 0 nu
+interoghează deloc, ca pagina conectată pe un canal persistent.
+Jucătorii rulează într-un pool de fire, contra unui server pornit (HTTP)
+sau direct contra clientului de test Flask.
+
+Pentru fiecare endpoint se raportează throughput-ul și percentilele
+p50/p95/p99; rezultatele se scriu cu CSVExporter și se desenează cu
+DataVisualizer, cu un fișier per rulare, ca rulările să poată fi comparate.
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.loadtest --url http://localhost:5000 --players 50 --games 500
+    python -m src.hangman_3d.loadtest --in-process --pace bot --games 2000
+"""
+
+import argparse
+import csv
+import glob
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+from .csv_exporter import CSVExporter
+from .simulation import FREQUENCY_ORDER
+from .utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+# Amestecul implicit de dificultăți (ponderi)
+DEFAULT_MIX = {"usor": 3, "mediu": 4, "greu": 2, "expert": 1}
+
+# Timpul de gândire între ghiciri (secunde, min-max)
+PACES = {
+    "human": (0.5, 2.5),
+    "bot": (0.0, 0.0),
+}
+
+# Pagina fără canal persistent își resincronizează cronometrul la 30 de
+# secunde (TIMER_SYNC_SECONDS din static/js/game.js)
+TIMER_INTERVAL = 30.0
+
+PERCENTILES = (50, 95, 99)
+
+
+class FlaskTransport:
+    """Cereri trimise direct aplicației Flask (fără rețea)"""
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                query: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, Any]]:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=payload, query_string=query)
+        return response.status_code, response.get_json(silent=True) or {}
+
+
+class HTTPTransport:
+    """Cereri HTTP către un server pornit; o conexiune keep-alive per fir"""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                query: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, Any]]:
+        import requests
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        try:
+            response = session.request(method, self.base_url + path, json=payload,
+                                       params=query, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.debug(f"{method} {path} failed: {e}")
+            return 0, {}
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, {}
+
+
+@dataclass
+class EndpointStats:
+    """Latențele (secunde) și erorile unui endpoint"""
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+@dataclass
+class LoadTestResult:
+    """Rezultatul unei rulări"""
+    run_id: str
+    players: int
+    games: int
+    pace: str
+    seconds: float
+    endpoints: Dict[str, EndpointStats]
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Câte un rând per endpoint: cereri, erori, throughput, percentile (ms)"""
+        rows = []
+        for endpoint, stats in sorted(self.endpoints.items()):
+            ordered = sorted(stats.latencies)
+            row = {
+                "run_id": self.run_id,
+                "started_at": self.started_at,
+                "endpoint": endpoint,
+                "requests": len(ordered),
+                "errors": stats.errors,
+                "requests_per_second": round(len(ordered) / self.seconds, 1) if self.seconds else 0.0,
+            }
+            for p in PERCENTILES:
+                row[f"p{p}_ms"] = round(percentile(ordered, p) * 1e3, 3)
+            row["max_ms"] = round(ordered[-1] * 1e3, 3) if ordered else 0.0
+            rows.append(row)
+        return rows
+
+
+class Player:
+    """Un jucător virtual: un joc complet, de la start la game_over"""
+
+    def __init__(self, transport, rng: random.Random, difficulty: str,
+                 pace: Tuple[float, float], record, timer_interval: float = TIMER_INTERVAL):
+        self.transport = transport
+        self.rng = rng
+        self.difficulty = difficulty
+        self.pace = pace
+        self.record = record
+        self.timer_interval = timer_interval
+        self._next_tick = 0.0
+
+    def _call(self, endpoint: str, method: str, payload=None, query=None) -> Dict[str, Any]:
+        start = time.perf_counter()
+        status, body = self.transport.request(method, endpoint, payload, query)
+        self.record(endpoint, time.perf_counter() - start, status)
+        return body
+
+    def _think(self, game_id: str) -> None:
+        """Pauza dintre ghiciri, cu cronometrul paginii rulând în fundal"""
+        end = time.monotonic() + self.rng.uniform(*self.pace)
+        if self.timer_interval <= 0:
+            time.sleep(max(0.0, end - time.monotonic()))
+            return
+        while True:
+            now = time.monotonic()
+            if now >= self._next_tick:
+                self._call("/update_time", "GET", query={"game_id": game_id})
+                self._next_tick = max(self._next_tick + self.timer_interval, now)
+            if now >= end:
+                return
+            time.sleep(min(end, self._next_tick) - now)
+
+    def letters(self) -> List[str]:
+        """Ordinea literelor: frecvența în limbă, ușor amestecată"""
+        return sorted(FREQUENCY_ORDER, key=lambda letter: FREQUENCY_ORDER.index(letter)
+                      + self.rng.uniform(0, 6))
+
+    def play(self) -> None:
+        game = self._call("/start_game", "POST", {"difficulty": self.difficulty})
+        game_id = game.get("game_id")
+        if not game_id:
+            return
+        self._next_tick = time.monotonic() + self.timer_interval
+        for letter in self.letters():
+            self._think(game_id)
+            result = self._call("/guess", "POST", {"game_id": game_id, "letter": letter})
+            if not result or result.get("game_over"):
+                return
+
+
+def _pick(mix: Mapping[str, float], rng: random.Random) -> str:
+    return rng.choices(list(mix), weights=list(mix.values()))[0]
+
+
+def run_load_test(transport, games: int, players: int = 10, pace: str = "human",
+                  mix: Mapping[str, float] = DEFAULT_MIX, seed: int = 0,
+                  run_id: Optional[str] = None,
+                  timer_interval: float = TIMER_INTERVAL) -> LoadTestResult:
+    """
+    Rulează `games` jocuri cu `players` jucători concurenți
+
+    Args:
+        transport: FlaskTransport sau HTTPTransport
+        games: Numărul total de jocuri
+        players: Jucători simultani (fire)
+        pace: Ritmul ghicirilor (human, bot)
+        mix: Ponderile dificultăților
+        seed: Sămânța pentru reproductibilitate
+        run_id: Identificatorul rulării (implicit data și ora)
+        timer_interval: Secundele dintre interogările /update_time
+            (0 = fără interogări, ca pagina conectată prin WebSocket/SSE)
+
+    Returns:
+        LoadTestResult cu latențele per endpoint
+    """
+    if pace not in PACES:
+        raise ValueError(f"Ritm necunoscut: {pace}")
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    endpoints: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+    lock = threading.Lock()
+
+    def record(endpoint: str, seconds: float, status: int) -> None:
+        with lock:
+            stats = endpoints[endpoint]
+            stats.latencies.append(seconds)
+            if not 200 <= status < 400:
+                stats.errors += 1
+
+    def play(index: int) -> None:
+        rng = random.Random(seed * 1_000_003 + index)
+        Player(transport, rng, _pick(mix, rng), PACES[pace], record, timer_interval).play()
+
+    logger.info(f"Load test {run_id}: {games} games, {players} players, pace={pace}")
+    started_at = datetime.now().isoformat(timespec="seconds")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=players) as pool:
+        for _ in pool.map(play, range(games)):
+            pass
+    seconds = time.perf_counter() - start
+
+    result = LoadTestResult(run_id, players, games, pace, seconds, dict(endpoints), started_at)
+    logger.info(f"Load test {run_id} finished in {seconds:.1f}s")
+    return result
+
+
+def export_results(result: LoadTestResult, output_dir: str = "output",
+                   prefix: str = "loadtest", plots: bool = True) -> List[str]:
+    """
+    Scrie rezumatul rulării (CSV) și graficele, inclusiv evoluția p99
+    față de rulările anterioare din același director
+
+    Returns:
+        Căile fișierelor scrise
+    """
+    exporter = CSVExporter(output_dir)
+    paths = [exporter.export_data(result.summary(), f"{prefix}_{result.run_id}")]
+    if not plots:
+        return paths
+
+    # Import întârziat: matplotlib este greu și necesar doar pentru grafice
+    from .visualizer import DataVisualizer
+    visualizer = DataVisualizer(output_dir)
+    paths.append(visualizer.create_bar_chart(
+        {row["endpoint"]: row["p99_ms"] for row in result.summary()},
+        f"Latență p99 (ms) - {result.run_id}", f"{prefix}_{result.run_id}_p99"))
+    guess = result.endpoints.get("/guess")
+    if guess and guess.latencies:
+        paths.append(visualizer.create_histogram(
+            [seconds * 1e3 for seconds in guess.latencies],
+            f"Latență /guess (ms) - {result.run_id}", f"{prefix}_{result.run_id}_guess_histogram",
+            bins=50))
+    history = load_history(output_dir, prefix)
+    if len(history) > 1:
+        paths.append(visualizer.create_line_chart(
+            history_series(history), "Latență p99 (ms) per rulare", f"{prefix}_history_p99"))
+    return paths
+
+
+def load_history(output_dir: str, prefix: str = "loadtest") -> Dict[str, Dict[str, float]]:
+    """
+    p99 (ms) per endpoint pentru toate rulările salvate, cheiate după run_id
+    și ordonate după momentul de start înregistrat (nu după numele fișierului)
+
+    Fișierele scrise înainte de coloana started_at folosesc data modificării.
+    """
+    runs: Dict[str, Dict[str, float]] = defaultdict(dict)
+    started: Dict[str, str] = {}
+    for path in glob.glob(os.path.join(output_dir, f"{prefix}_*.csv")):
+        modified = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if "p99_ms" not in row or "run_id" not in row:
+                    continue
+                runs[row["run_id"]][row["endpoint"]] = float(row["p99_ms"])
+                started.setdefault(row["run_id"], row.get("started_at") or modified)
+    order = sorted(runs, key=lambda run_id: (started[run_id], run_id))
+    return {run_id: runs[run_id] for run_id in order}
+
+
+def history_series(history: Mapping[str, Mapping[str, float]]) -> Dict[str, List[float]]:
+    """
+    Serii p99 per endpoint, aliniate pe rulări; un endpoint lipsă dintr-o
+    rulare devine NaN (gol în grafic), fără să deplaseze punctele următoare
+    """
+    endpoints = sorted({endpoint for run in history.values() for endpoint in run})
+    return {endpoint: [run.get(endpoint, math.nan) for run in history.values()]
+            for endpoint in endpoints}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parsează un amestec de forma usor=3,mediu=4"""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI"""
+    parser = argparse.ArgumentParser(description="Generator de încărcare Hangman 3D")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Serverul testat (de ex. http://localhost:5000)")
+    target.add_argument("--in-process", action="store_true",
+                        help="Aplicația Flask în același proces (configurația testing)")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--pace", choices=sorted(PACES), default="human")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timer-interval", type=float, default=TIMER_INTERVAL,
+                        help="Secunde între interogările /update_time (0 = canal WebSocket/SSE)")
+    parser.add_argument("--run-id", help="Numele rulării (implicit data și ora)")
+    parser.add_argument("--output-dir", default="output")
+    parser.add_argument("--no-plots", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.in_process:
+        from .app import create_app
+        transport = FlaskTransport(create_app("testing"))
+    else:
+        transport = HTTPTransport(args.url)
+
+    result = run_load_test(transport, args.games, args.players, args.pace, args.mix,
+                           args.seed, args.run_id, args.timer_interval)
+    print(f"{result.games} games, {result.players} players, {result.seconds:.1f}s")
+    print(f"{'endpoint':<14} {'req':>7} {'err':>5} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for row in result.summary():
+        print(f"{row['endpoint']:<14} {row['requests']:>7} {row['errors']:>5} "
+              f"{row['requests_per_second']:>8} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+              f"{row['p99_ms']:>8}")
+    for path in export_results(result, args.output_dir, plots=not args.no_plots):
+        print(f"  -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
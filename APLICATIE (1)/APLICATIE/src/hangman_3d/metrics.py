@@ -0,0 +1,192 @@
+"""
+Metrici per rută în format Prometheus (/metrics)
+
+Pentru fiecare rută se păstrează o histogramă a latenței cu intervale
+fixe, contoare de cereri pe metodă și cod HTTP și contorul excepțiilor.
+Înregistrarea unei cereri costă o căutare binară și câteva incrementări
+sub lacătul rutei, deci metricile pot rămâne active în producție.
+
+Valorile sunt ale procesului curent: cu serverul preforkat fiecare worker
+are propriile contoare (Prometheus le agregă după eticheta instance dacă
+worker-ii sunt expuși separat).
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+from flask import Flask, Response, current_app, g, request
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Limitele superioare ale intervalelor histogramei (secunde)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Eticheta rutei pentru cererile care nu au nimerit nicio rută (404)
+UNMATCHED = "<unmatched>"
+
+
+class _RouteMetrics:
+    """Histograma și contoarele unei rute"""
+
+    __slots__ = ("lock", "buckets", "total", "count", "responses", "exceptions")
+
+    def __init__(self, bucket_count: int):
+        self.lock = threading.Lock()
+        self.buckets = [0] * (bucket_count + 1)  # ultimul = +Inf
+        self.total = 0.0
+        self.count = 0
+        # (metodă, cod HTTP) -> număr de cereri
+        self.responses: Dict[Tuple[str, int], int] = {}
+        self.exceptions = 0
+
+
+class Metrics:
+    """Registrul de metrici al procesului"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(buckets)
+        self._routes: Dict[str, _RouteMetrics] = {}
+        self._lock = threading.Lock()
+        self._gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+
+    def _route(self, route: str) -> _RouteMetrics:
+        metrics = self._routes.get(route)
+        if metrics is None:
+            with self._lock:
+                metrics = self._routes.setdefault(route, _RouteMetrics(len(self.bounds)))
+        return metrics
+
+    def observe(self, route: str, method: str, status: int, seconds: float) -> None:
+        """Înregistrează o cerere terminată"""
+        metrics = self._route(route)
+        index = bisect.bisect_left(self.bounds, seconds)
+        key = (method, status)
+        with metrics.lock:
+            metrics.buckets[index] += 1
+            metrics.total += seconds
+            metrics.count += 1
+            metrics.responses[key] = metrics.responses.get(key, 0) + 1
+
+    def exception(self, route: str) -> None:
+        """Înregistrează o excepție netratată într-o rută"""
+        metrics = self._route(route)
+        with metrics.lock:
+            metrics.exceptions += 1
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Adaugă o valoare citită la fiecare export (de ex. sesiunile active)"""
+        self._gauges[name] = (help_text, read)
+
+    def render(self) -> str:
+        """Toate metricile în formatul text Prometheus"""
+        with self._lock:
+            routes = sorted(self._routes.items())
+        snapshot = []
+        for route, metrics in routes:
+            with metrics.lock:
+                snapshot.append((route, list(metrics.buckets), metrics.total, metrics.count,
+                                 dict(metrics.responses), metrics.exceptions))
+
+        lines: List[str] = [
+            "# HELP hangman_http_requests_total HTTP requests by route, method and status.",
+            "# TYPE hangman_http_requests_total counter",
+        ]
+        for route, _, _, _, responses, _ in snapshot:
+            for (method, status), value in sorted(responses.items()):
+                lines.append(f'hangman_http_requests_total{{route="{_escape(route)}",'
+                             f'method="{method}",status="{status}"}} {value}')
+
+        lines += [
+            "# HELP hangman_http_exceptions_total Unhandled exceptions by route.",
+            "# TYPE hangman_http_exceptions_total counter",
+        ]
+        for route, _, _, _, _, exceptions in snapshot:
+            if exceptions:
+                lines.append(f'hangman_http_exceptions_total{{route="{_escape(route)}"}} {exceptions}')
+
+        lines += [
+            "# HELP hangman_http_request_duration_seconds Request latency by route.",
+            "# TYPE hangman_http_request_duration_seconds histogram",
+        ]
+        for route, buckets, total, count, _, _ in snapshot:
+            label = f'route="{_escape(route)}"'
+            cumulative = 0
+            for bound, value in zip((*map(_number, self.bounds), "+Inf"), buckets):
+                cumulative += value
+                lines.append(f'hangman_http_request_duration_seconds_bucket{{{label},le="{bound}"}} '
+                             f'{cumulative}')
+            lines.append(f"hangman_http_request_duration_seconds_sum{{{label}}} {total!r}")
+            lines.append(f"hangman_http_request_duration_seconds_count{{{label}}} {count}")
+
+        for name, (help_text, read) in sorted(self._gauges.items()):
+            try:
+                value = read()
+            except Exception as e:
+                logger.warning(f"Could not read metric {name}: {e}")
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {_number(value)}"]
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def register_gauges(metrics: Metrics, store: Any, limiter: Optional[Any] = None) -> None:
+    """Valorile comune celor două moduri de servire (WSGI și ASGI)"""
+    metrics.gauge("hangman_active_sessions", "Active game sessions in the session store.",
+                  lambda: len(store))
+    if limiter is not None and limiter.concurrency is not None:
+        metrics.gauge("hangman_requests_in_flight", "Requests currently being handled.",
+                      lambda: limiter.concurrency.in_flight)
+
+
+def init_metrics(app: Flask) -> Optional[Metrics]:
+    """
+    Instrumentează aplicația Flask și înregistrează ruta /metrics
+
+    Trebuie apelată înaintea limitării ratei, astfel încât și cererile
+    respinse (429/503) să fie măsurate.
+    """
+    if not app.config.get("METRICS_ENABLED"):
+        return None
+    metrics = Metrics()
+    app.extensions["metrics"] = metrics
+
+    @app.before_request
+    def start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        start = g.pop("metrics_start", None)
+        if start is not None:
+            rule = request.url_rule
+            metrics.observe(rule.rule if rule is not None else UNMATCHED, request.method,
+                            response.status_code, time.perf_counter() - start)
+        return response
+
+    @app.teardown_request
+    def record_exception(error):
+        if error is not None:
+            rule = request.url_rule
+            metrics.exception(rule.rule if rule is not None else UNMATCHED)
+
+    app.add_url_rule("/metrics", "metrics", export_metrics, methods=["GET"])
+    return metrics
+
+
+def export_metrics() -> Response:
+    """Expune metricile în formatul text Prometheus"""
+    return Response(current_app.extensions["metrics"].render(), content_type=CONTENT_TYPE)
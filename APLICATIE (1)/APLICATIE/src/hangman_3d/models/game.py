@@ -2,44 +2,176 @@
 Model pentru starea jocului și logica de ghicire
 """
 
-import random
-from typing import Dict, List, Any
-from ..utils import WORDS
+import math
+import struct
+import time
+from typing import Dict, Iterable, List, Any, Optional
+from ..dictionary import ALPHABET, DIFFICULTIES, get_dictionary
+
+# Timp diferit pentru fiecare nivel (secunde)
+TIME_LIMITS = {"usor": 400, "mediu": 300, "greu": 200, "expert": 150}
+
+# Antet binar: versiune, flag-uri (inclusiv dificultatea), greșeli,
+# max greșeli, termen limită (epoch), lungime cuvânt, masca literelor ghicite
+_HEADER = struct.Struct("<BBHHdBI")
+_FORMAT_VERSION = 4
+_FLAG_GAME_OVER = 1
+_FLAG_WON = 2
+_FLAG_LAST_CORRECT = 4
+# Biții 3-4 din flag-uri: indexul dificultății în DIFFICULTIES
+_DIFFICULTY_SHIFT = 3
+_DIFFICULTY_BITS = 3 << _DIFFICULTY_SHIFT
+
+_UNDERSCORE = ord("_")
 
 
 class GameState:
     """
     Gestiunea stării jocului Hangman
     
+    Literele ghicite sunt păstrate ca mască de 26 de biți; cuvântul afișat
+    este actualizat incremental într-un bytearray, iar victoria este
+    detectată când masca literelor rămase devine zero. Obiectul folosește
+    __slots__, păstrează doar indexul cuvântului în dicționar și împachetează
+    game_over/won/dificultatea într-un singur întreg de flag-uri.
+    
     Atribute:
-        word: Cuvântul de ghicit
-        guessed_letters: Lista literelor ghicite
+        word_id: Indexul cuvântului în dicționar
+        word: Cuvântul de ghicit (derivat din word_id)
+        guessed_mask: Masca literelor ghicite (bitul i = litera 'A' + i)
+        remaining_mask: Masca literelor din cuvânt încă neghicite
+        guessed_letters: Lista literelor ghicite (derivată din mască)
         wrong_guesses: Numărul de greșeli
         max_wrong: Numărul maxim de greșeli permise
         game_over: Flag pentru sfârșit joc
         won: Flag pentru victorie
-        time_left: Timp rămas în secunde
+        deadline: Termenul limită (time.monotonic) calculat la start
+        time_left: Timp rămas în secunde, derivat din deadline
         difficulty: Nivel de dificultate
     """
     
-    def __init__(self, difficulty: str = "mediu"):
+    __slots__ = (
+        "word_id", "guessed_mask", "remaining_mask", "wrong_guesses",
+        "max_wrong", "deadline", "_flags", "_display"
+    )
+    
+    def __init__(self, difficulty: str = "mediu", word_id: Optional[int] = None):
         """
         Inițializează o nouă stare de joc
         
         Args:
             difficulty: Nivelul de dificultate (usor, mediu, greu, expert)
+            word_id: Indexul cuvântului în dicționar (implicit unul aleator
+                al nivelului)
         """
-        self.difficulty = difficulty
-        self.word = random.choice(WORDS[difficulty])
-        self.guessed_letters: List[str] = []
+        self._flags = DIFFICULTIES.index(difficulty) << _DIFFICULTY_SHIFT
+        if word_id is None:
+            word_id = get_dictionary().random_id(difficulty)
+        self._set_word(word_id)
         self.wrong_guesses = 0
         self.max_wrong = 6
-        self.game_over = False
-        self.won = False
         
-        # Timp diferit pentru fiecare nivel
-        time_limits = {"usor": 400, "mediu": 300, "greu": 200, "expert": 150}
-        self.time_left = time_limits[difficulty]
+        # Serverul este autoritar pentru timp: se păstrează doar termenul limită
+        self.deadline = time.monotonic() + TIME_LIMITS[difficulty]
+    
+    def _set_word(self, word_id: int, guessed_mask: int = 0) -> None:
+        """Setează cuvântul și reconstruiește măștile și cuvântul afișat"""
+        dictionary = get_dictionary()
+        word = dictionary.word_bytes(word_id)
+        word_mask = dictionary.letter_index(word_id)[0]
+        self.word_id = word_id
+        self.guessed_mask = guessed_mask
+        self.remaining_mask = word_mask & ~guessed_mask
+        self._display = bytearray(
+            code if guessed_mask >> (code - 65) & 1 else _UNDERSCORE
+            for code in word
+        )
+    
+    def _set_flag(self, flag: int, value: bool) -> None:
+        """Setează sau șterge un bit din flag-urile împachetate"""
+        if value:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+    
+    @property
+    def word(self) -> str:
+        """Cuvântul de ghicit"""
+        return get_dictionary()[self.word_id]
+    
+    @property
+    def difficulty(self) -> str:
+        """Nivelul de dificultate"""
+        return DIFFICULTIES[(self._flags & _DIFFICULTY_BITS) >> _DIFFICULTY_SHIFT]
+    
+    @property
+    def game_over(self) -> bool:
+        """Flag pentru sfârșit joc"""
+        return bool(self._flags & _FLAG_GAME_OVER)
+    
+    @game_over.setter
+    def game_over(self, value: bool) -> None:
+        self._set_flag(_FLAG_GAME_OVER, value)
+    
+    @property
+    def won(self) -> bool:
+        """Flag pentru victorie"""
+        return bool(self._flags & _FLAG_WON)
+    
+    @won.setter
+    def won(self, value: bool) -> None:
+        self._set_flag(_FLAG_WON, value)
+    
+    @property
+    def _last_correct(self) -> bool:
+        """Ultima ghicire a fost corectă"""
+        return bool(self._flags & _FLAG_LAST_CORRECT)
+    
+    @_last_correct.setter
+    def _last_correct(self, value: bool) -> None:
+        self._set_flag(_FLAG_LAST_CORRECT, value)
+    
+    @property
+    def guessed_letters(self) -> List[str]:
+        """Literele ghicite, în ordine alfabetică"""
+        mask = self.guessed_mask
+        return [letter for i, letter in enumerate(ALPHABET) if mask >> i & 1]
+    
+    @property
+    def wrong_letters(self) -> str:
+        """Literele încercate care nu sunt în cuvânt, în ordine alfabetică"""
+        mask = self.guessed_mask & ~get_dictionary().letter_index(self.word_id)[0]
+        return ''.join(letter for i, letter in enumerate(ALPHABET) if mask >> i & 1)
+    
+    @property
+    def time_left(self) -> int:
+        """Secunde întregi rămase până la termenul limită"""
+        return max(0, math.ceil(self.deadline - time.monotonic()))
+    
+    @property
+    def expiry_pending(self) -> bool:
+        """Timpul a expirat, dar jocul nu este încă marcat încheiat"""
+        return not self.game_over and time.monotonic() >= self.deadline
+    
+    def _check_expired(self) -> bool:
+        """
+        Evaluează leneș expirarea timpului
+        
+        Returns:
+            True dacă timpul a expirat acum (jocul tocmai s-a încheiat)
+        """
+        if not self.game_over and time.monotonic() >= self.deadline:
+            self.game_over = True
+            return True
+        return False
+    
+    def _time_up_response(self) -> Dict[str, Any]:
+        """Răspunsul pentru un joc încheiat prin expirarea timpului"""
+        return {
+            "time_up": True,
+            "game_over": True,
+            "word": self.word
+        }
     
     def guess_letter(self, letter: str) -> Dict[str, Any]:
         """
@@ -54,27 +186,49 @@ class GameState:
         letter = letter.upper()
         
         # Validări
+        if len(letter) != 1 or not "A" <= letter <= "Z":
+            return {
+                "success": False,
+                "error": "Literă invalidă"
+            }
+        
+        if self._check_expired():
+            return {
+                "success": False,
+                "error": "Timpul a expirat",
+                **self._time_up_response()
+            }
+        
         if self.game_over:
             return {
                 "success": False,
                 "error": "Jocul s-a încheiat"
             }
         
-        if letter in self.guessed_letters:
+        idx = ord(letter) - 65
+        bit = 1 << idx
+        if self.guessed_mask & bit:
             return {
                 "success": False,
                 "error": "Litera a fost deja ghicită"
             }
         
         # Adaugă litera
-        self.guessed_letters.append(letter)
+        self.guessed_mask |= bit
         
         # Verifică dacă este corectă
-        is_correct = letter in self.word
+        self._last_correct = bool(self.remaining_mask & bit)
         
-        if is_correct:
+        if self._last_correct:
+            # Dezvăluie pozițiile literei în cuvântul afișat
+            code = 65 + idx
+            display = self._display
+            for pos in get_dictionary().letter_index(self.word_id)[1][idx]:
+                display[pos] = code
+            
             # Verifică dacă a câștigat
-            if all(l in self.guessed_letters for l in self.word):
+            self.remaining_mask &= ~bit
+            if not self.remaining_mask:
                 self.won = True
                 self.game_over = True
         else:
@@ -85,51 +239,152 @@ class GameState:
         
         return self._get_response()
     
+    def guess_letters(self, letters: Iterable[str]) -> Dict[str, Any]:
+        """
+        Procesează în ordine mai multe litere, oprindu-se la sfârșitul jocului
+        
+        Args:
+            letters: Literele ghicite, în ordinea tastării
+            
+        Returns:
+            Dict cu starea finală (ca la guess_letter) și lista
+            `results` cu rezultatul fiecărei litere procesate
+        """
+        results = []
+        for letter in letters:
+            result = self.guess_letter(letter)
+            if result["success"]:
+                results.append({"letter": letter.upper(), "success": True,
+                                "correct": result["correct"]})
+            else:
+                results.append({"letter": letter.upper(), "success": False,
+                                "error": result["error"]})
+            if self.game_over:
+                break
+        
+        response = self._get_response()
+        response["results"] = results
+        return response
+    
     def _get_response(self) -> Dict[str, Any]:
         """Construiește răspunsul pentru o ghicire"""
-        displayed_word = ''.join(
-            letter if letter in self.guessed_letters else '_'
-            for letter in self.word
-        )
-        
         return {
             "success": True,
-            "correct": len(self.guessed_letters) > 0 and self.guessed_letters[-1] in self.word,
-            "displayed_word": displayed_word,
+            "correct": self._last_correct,
+            "displayed_word": self._display.decode("ascii"),
             "wrong_guesses": self.wrong_guesses,
             "game_over": self.game_over,
             "won": self.won,
-            "word": self.word if self.game_over else None
+            "word": self.word if self.game_over else None,
+            "time_left": self.time_left
         }
     
-    def update_time(self, time_left: int) -> Dict[str, Any]:
+    def status(self) -> Dict[str, Any]:
         """
-        Actualizează timp și verifică dacă s-a terminat
+        Returnează timpul rămas și verifică expirarea
         
-        Args:
-            time_left: Timp rămas în secunde
-            
         Returns:
-            Dict cu status-ul
+            Dict cu status-ul (sau time_up dacă timpul tocmai a expirat)
         """
-        self.time_left = time_left
-        
-        if self.time_left <= 0 and not self.game_over:
-            self.game_over = True
-            return {
-                "time_up": True,
-                "game_over": True,
-                "word": self.word
-            }
+        if self._check_expired():
+            return self._time_up_response()
         
         return {
             "success": True,
-            "time_left": self.time_left
+            "time_left": self.time_left,
+            "game_over": self.game_over
         }
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returnează starea completă vizibilă clientului (și verifică expirarea)
+        
+        Returns:
+            Dict cu cuvântul afișat, greșelile, timpul și sfârșitul jocului;
+            time_up dacă timpul tocmai a expirat
+        """
+        state = {
+            "success": True,
+            "displayed_word": self._display.decode("ascii"),
+            "wrong_guesses": self.wrong_guesses,
+            "guessed_letters": "".join(self.guessed_letters),
+            "time_left": self.time_left,
+            "game_over": False,
+            "won": self.won,
+            "word": None
+        }
+        if self._check_expired():
+            state["time_up"] = True
+        if self.game_over:
+            state["game_over"] = True
+            state["word"] = self.word
+        return state
+    
+    def update_time(self, time_left: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compatibilitate cu clienții vechi: valoarea trimisă este ignorată
+        
+        Args:
+            time_left: Timp raportat de client (nu mai este folosit)
+            
+        Returns:
+            Dict cu status-ul, ca status()
+        """
+        return self.status()
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializează starea într-o formă binară compactă
+
+        Returns:
+            Octeții stării (antet fix + cuvânt ASCII)
+        """
+        word = get_dictionary().word_bytes(self.word_id)
+        header = _HEADER.pack(
+            _FORMAT_VERSION,
+            self._flags,
+            self.wrong_guesses,
+            self.max_wrong,
+            time.time() + (self.deadline - time.monotonic()),
+            len(word),
+            self.guessed_mask
+        )
+        return header + word
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameState":
+        """
+        Reconstruiește starea din forma produsă de to_bytes
+
+        Args:
+            data: Octeții serializați
+
+        Returns:
+            Instanță GameState
+
+        Raises:
+            ValueError: Dacă formatul nu este recunoscut
+        """
+        (version, flags, wrong_guesses, max_wrong,
+         deadline, word_len, guessed_mask) = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Versiune de format necunoscută: {version}")
+
+        offset = _HEADER.size
+        word = data[offset:offset + word_len].decode('ascii')
+        word_id = get_dictionary().index_of(word)
+        if word_id is None:
+            raise ValueError(f"Cuvânt absent din dicționar: {word}")
+        
+        game = cls.__new__(cls)
+        game._flags = flags
+        game._set_word(word_id, guessed_mask)
+        game.wrong_guesses = wrong_guesses
+        game.max_wrong = max_wrong
+        # Termenul este transportat ca timp de perete, comun proceselor
+        game.deadline = time.monotonic() + (deadline - time.time())
+        return game
+
     def get_display_word(self) -> str:
         """Returnează cuvântul cu literele ascunse"""
-        return ''.join(
-            letter if letter in self.guessed_letters else '_'
-            for letter in self.word
-        )
+        return self._display.decode("ascii")
@@ -0,0 +1,224 @@
+"""
+Limitarea ratei cererilor și plafonul de concurență
+
+Fiecare client are o găleată de jetoane globală, plus câte una pentru
+rutele cu limită proprie (de ex. /update_time, apelată de cronometrul
+paginii). Peste limită, cererea primește imediat 429 cu Retry-After; când
+serverul are deja MAX_CONCURRENT_REQUESTS cereri în lucru, primește 503
+în loc să aștepte într-o coadă nelimitată.
+
+Starea găleților este împărțită pe segmente (lock striping), iar fiecare
+segment păstrează clienții în ordine LRU, deci memoria rămâne limitată
+la RATE_LIMIT_MAX_CLIENTS clienți per găleată.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+import logging
+
+from flask import Flask, g, request
+
+from .json_provider import ConstantPayload
+
+logger = logging.getLogger(__name__)
+
+TOO_MANY_REQUESTS = ConstantPayload({"error": "Prea multe cereri"})
+OVERLOADED = ConstantPayload({"error": "Server supraîncărcat"})
+
+# (cereri pe secundă, rafală maximă)
+Limit = Tuple[float, float]
+
+
+class Rejection(NamedTuple):
+    """Cerere respinsă: corpul, codul HTTP și secundele până la reîncercare"""
+    payload: ConstantPayload
+    status: int
+    retry_after: float
+
+    def headers(self) -> List[Tuple[str, str]]:
+        return [("Retry-After", str(max(1, math.ceil(self.retry_after))))]
+
+
+class _Bucket:
+    """Jetoanele rămase și momentul ultimei reumpleri"""
+
+    __slots__ = ("tokens", "stamp")
+
+    def __init__(self, tokens: float, stamp: float):
+        self.tokens = tokens
+        self.stamp = stamp
+
+
+class _Stripe:
+    """Un segment de găleți, cu lacătul propriu"""
+
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # cheie -> _Bucket; ordinea = ordinea LRU
+        self.buckets: "OrderedDict[Any, _Bucket]" = OrderedDict()
+
+
+class TokenBuckets:
+    """Găleți de jetoane indexate după client, cu evacuare LRU"""
+
+    def __init__(self, rate: float, burst: float, max_keys: int = 100000,
+                 stripes: int = 64, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Jetoane adăugate pe secundă
+            burst: Capacitatea găleții (rafala permisă)
+            max_keys: Numărul maxim de clienți urmăriți
+            stripes: Numărul de segmente (lacăte) independente
+            clock: Sursa de timp (injectabilă pentru teste)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate trebuie să fie pozitiv și burst cel puțin 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._stripes = [_Stripe() for _ in range(max(1, stripes))]
+        self._stripe_capacity = max(1, -(-max_keys // len(self._stripes)))
+
+    def take(self, key: Any) -> float:
+        """
+        Consumă un jeton pentru `key`
+
+        Returns:
+            0 dacă cererea este permisă, altfel secundele până la următorul jeton
+        """
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        now = self._clock()
+        with stripe.lock:
+            bucket = stripe.buckets.get(key)
+            if bucket is None:
+                bucket = stripe.buckets[key] = _Bucket(self.burst, now)
+                if len(stripe.buckets) > self._stripe_capacity:
+                    stripe.buckets.popitem(last=False)
+            else:
+                stripe.buckets.move_to_end(key)
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.stamp) * self.rate)
+                bucket.stamp = now
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return 0.0
+            return (1 - bucket.tokens) / self.rate
+
+    def __len__(self) -> int:
+        return sum(len(stripe.buckets) for stripe in self._stripes)
+
+
+class ConcurrencyLimiter:
+    """Plafon de cereri în lucru simultan; fără coadă de așteptare"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+class RateLimiter:
+    """Găleata per client, găleți per rută și plafonul de concurență"""
+
+    def __init__(self, client_limit: Optional[Limit] = None,
+                 route_limits: Optional[Mapping[str, Limit]] = None,
+                 max_concurrent: int = 0, exempt: Tuple[str, ...] = (),
+                 max_clients: int = 100000, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            client_limit: Limita globală a unui client (None = fără)
+            route_limits: Limite suplimentare per cale
+            max_concurrent: Cereri simultane permise (0 = nelimitat)
+            exempt: Prefixe de cale fără limită de rată (fișierele statice)
+            max_clients: Clienți urmăriți per găleată (LRU)
+            clock: Sursa de timp (injectabilă pentru teste)
+        """
+        self.exempt = tuple(exempt)
+        self.client_buckets = (TokenBuckets(*client_limit, max_keys=max_clients, clock=clock)
+                               if client_limit else None)
+        self.route_buckets: Dict[str, TokenBuckets] = {
+            path: TokenBuckets(*limit, max_keys=max_clients, clock=clock)
+            for path, limit in (route_limits or {}).items()
+        }
+        self.concurrency = ConcurrencyLimiter(max_concurrent) if max_concurrent > 0 else None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["RateLimiter"]:
+        """Construiește limitatorul din configurația aplicației (None dacă e dezactivat)"""
+        if not config.get("RATE_LIMIT_ENABLED"):
+            return None
+        return cls(
+            client_limit=config["RATE_LIMIT_CLIENT"],
+            route_limits=config["RATE_LIMIT_ROUTES"],
+            max_concurrent=config["MAX_CONCURRENT_REQUESTS"],
+            exempt=config["RATE_LIMIT_EXEMPT"],
+            max_clients=config["RATE_LIMIT_MAX_CLIENTS"],
+        )
+
+    def check(self, client: Optional[str], path: str) -> Optional[Rejection]:
+        """Verifică limitele de rată (consumă jetoanele); None dacă cererea trece"""
+        if path.startswith(self.exempt):
+            return None
+        wait = self.client_buckets.take(client) if self.client_buckets else 0.0
+        route = self.route_buckets.get(path)
+        if not wait and route is not None:
+            wait = route.take(client)
+        if wait:
+            return Rejection(TOO_MANY_REQUESTS, 429, wait)
+        return None
+
+    def admit(self, client: Optional[str], path: str) -> Optional[Rejection]:
+        """
+        Verifică limitele și ocupă un loc de concurență
+
+        Returns:
+            None dacă cererea este admisă (apelantul trebuie să apeleze
+            leave() la final), altfel motivul respingerii
+        """
+        rejection = self.check(client, path)
+        if rejection is None and self.concurrency and not self.concurrency.try_acquire():
+            rejection = Rejection(OVERLOADED, 503, 1.0)
+        return rejection
+
+    def leave(self) -> None:
+        """Eliberează locul ocupat de admit()"""
+        if self.concurrency:
+            self.concurrency.release()
+
+
+def init_rate_limiting(app: Flask) -> Optional[RateLimiter]:
+    """Înregistrează limitarea în aplicația Flask, dacă este activată în configurație"""
+    limiter = RateLimiter.from_config(app.config)
+    if limiter is None:
+        return None
+    app.extensions["rate_limiter"] = limiter
+
+    @app.before_request
+    def admit_request():
+        rejection = limiter.admit(request.remote_addr, request.path)
+        if rejection is not None:
+            return rejection.payload, rejection.status, rejection.headers()
+        g.rate_limit_slot = True
+        return None
+
+    @app.teardown_request
+    def leave_request(error):
+        if g.pop("rate_limit_slot", False):
+            limiter.leave()
+
+    return limiter
@@ -0,0 +1,348 @@
+"""
+Canal persistent per joc (WebSocket, cu SSE ca alternativă)
+
+Clientul trimite ghicirile ca mesaje pe canal, iar serverul împinge
+diferențele de stare, expirarea timpului și sfârșitul jocului. Toate
+conexiunile aceluiași joc (de ex. două tab-uri, sau un tab care ghicește
+prin POST și ascultă prin SSE) sunt abonate la același GameEventHub.
+
+Canalul există doar în aplicația ASGI și este local procesului: hub-ul
+ține abonații în memorie, iar evenimentele vin din handlerele ASGI (canal,
+POST /guess, /update_time). Aplicația Flask/WSGI nu publică nimic, iar
+între procese sau instanțe diferite nu se propagă evenimente; pagina
+folosește atunci cererile HTTP și resincronizarea periodică a cronometrului.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set
+import logging
+
+from . import json_provider
+from .routes import actions
+
+logger = logging.getLogger(__name__)
+
+# Câmpurile de stare urmărite; pe canal se trimit doar cele modificate
+STATE_FIELDS = ("displayed_word", "wrong_guesses", "time_left", "game_over", "won", "word")
+
+# Intervalul comentariilor keep-alive pe fluxul SSE
+SSE_HEARTBEAT = 15.0
+
+# Coduri de închidere WebSocket (intervalul 4000-4999 este al aplicației)
+CLOSE_NO_GAME = 4404
+CLOSE_POLICY_VIOLATION = 1008
+
+# Ruta HTTP echivalentă fiecărui mesaj de pe canal, ale cărei limite de rată
+# se aplică mesajului; mesajele necunoscute consumă doar limita clientului
+MESSAGE_ROUTES = {
+    "guess": "/guess",
+    "guess_batch": "/guess_batch",
+    "hint": "/hint",
+    "status": "/update_time",
+}
+
+# Mesajele dintr-un eveniment pot aștepta în coadă dacă un client e lent
+QUEUE_SIZE = 64
+
+_MISSING = object()
+
+NO_GAME_FRAME = json_provider.ConstantPayload({"type": "error", "error": actions.NO_GAME_ERROR})
+
+Call = Callable[..., Awaitable[Any]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+# Ruta -> True dacă mesajul depășește limita de rată
+Limit = Callable[[str], bool]
+
+
+class GameEvent(NamedTuple):
+    """Un eveniment al jocului, livrat tuturor abonaților"""
+    type: str
+    # Câmpuri proprii evenimentului (litera, corectitudinea, eroarea)
+    data: Dict[str, Any]
+    # Starea jocului după eveniment (subset din STATE_FIELDS)
+    state: Dict[str, Any]
+
+    @classmethod
+    def from_result(cls, type: str, result: Dict[str, Any], **data: Any) -> "GameEvent":
+        """Împarte un răspuns de acțiune în date proprii și stare"""
+        state = {key: result[key] for key in STATE_FIELDS if key in result}
+        data.update((key, value) for key, value in result.items()
+                    if key not in STATE_FIELDS and key != "success")
+        return cls(type, data, state)
+
+
+class StateTracker:
+    """
+    Starea văzută de o conexiune; transformă evenimentele în cadre delta
+    """
+
+    __slots__ = ("last",)
+
+    def __init__(self):
+        self.last: Dict[str, Any] = {}
+
+    def frames(self, event: GameEvent) -> List[Dict[str, Any]]:
+        """
+        Cadrele de trimis pentru un eveniment
+
+        Returns:
+            Cadrul evenimentului (doar câmpurile modificate) și, la
+            tranziția spre sfârșitul jocului, un cadru game_over
+        """
+        frame = {"type": event.type, **event.data}
+        finished = event.state.get("game_over") and not self.last.get("game_over")
+        for key, value in event.state.items():
+            if self.last.get(key, _MISSING) != value:
+                frame[key] = value
+                self.last[key] = value
+        frames = [frame]
+        if finished:
+            frames.append({"type": "game_over", "won": bool(self.last.get("won")),
+                           "word": self.last.get("word")})
+        return frames
+
+
+class GameEventHub:
+    """
+    Abonații fiecărui joc și supravegherea termenului limită
+
+    Cât timp un joc are abonați, o sarcină așteaptă până la termenul
+    limită și evaluează expirarea pe server, astfel încât time_up este
+    împins imediat, fără interogări din partea clientului.
+    """
+
+    def __init__(self, store, call: Call):
+        """
+        Args:
+            store: Backend-ul de sesiuni
+            call: Apelează o funcție din actions (direct sau în thread pool)
+        """
+        self.store = store
+        self.call = call
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+
+    def subscribe(self, game_id: str) -> asyncio.Queue:
+        """Abonează o conexiune la evenimentele jocului"""
+        queue: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+        self._subscribers.setdefault(game_id, set()).add(queue)
+        if game_id not in self._timers:
+            self._timers[game_id] = asyncio.create_task(self._watch_deadline(game_id))
+        return queue
+
+    def unsubscribe(self, game_id: str, queue: asyncio.Queue) -> None:
+        """Dezabonează o conexiune; ultimul abonat oprește supravegherea"""
+        subscribers = self._subscribers.get(game_id)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[game_id]
+            timer = self._timers.pop(game_id, None)
+            if timer is not None:
+                timer.cancel()
+
+    def publish(self, game_id: Optional[str], event: GameEvent) -> None:
+        """Livrează un eveniment tuturor abonaților jocului"""
+        for queue in self._subscribers.get(game_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropping {event.type} event for slow subscriber of {game_id}")
+
+    def __len__(self) -> int:
+        return sum(map(len, self._subscribers.values()))
+
+    async def _watch_deadline(self, game_id: str) -> None:
+        """Împinge time_up la expirarea termenului limită"""
+        try:
+            while True:
+                result, status = await self.call(actions.status, self.store, game_id)
+                if status != 200:
+                    return
+                if result.get("time_up"):
+                    self.publish(game_id, GameEvent.from_result("time_up", {**result, "time_left": 0}))
+                    return
+                if result.get("game_over"):
+                    return
+                # time_left este rotunjit în sus: trezirea are loc după termen
+                await asyncio.sleep(max(result["time_left"], 0.05))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Deadline watcher failed for game {game_id}")
+        finally:
+            if self._timers.get(game_id) is asyncio.current_task():
+                del self._timers[game_id]
+
+
+class GameChannels:
+    """Protocolul canalelor: mesajele WebSocket și fluxul SSE"""
+
+    def __init__(self, hub: GameEventHub):
+        self.hub = hub
+
+    @property
+    def store(self):
+        return self.hub.store
+
+    async def perform(self, game_id: str, message: Dict[str, Any]) -> Optional[GameEvent]:
+        """
+        Execută o acțiune primită pe canal
+
+        Rezultatele reușite sunt publicate tuturor abonaților jocului.
+
+        Returns:
+            Evenimentul destinat doar expeditorului (eroare, indiciu) sau None
+        """
+        kind = message.get("type")
+        if kind == "guess":
+            letter = message.get("letter", "")
+            result, status = await self.hub.call(actions.guess, self.store, game_id, letter)
+            if status == 200:
+                self.hub.publish(game_id, GameEvent.from_result(
+                    "guess", result, letter=str(letter).upper()))
+                return None
+        elif kind == "guess_batch":
+            result, status = await self.hub.call(
+                actions.guess_batch, self.store, game_id, message.get("letters", []))
+            if status == 200:
+                self.hub.publish(game_id, GameEvent.from_result("guess_batch", result))
+                return None
+        elif kind == "hint":
+            result, status = await self.hub.call(actions.hint, self.store, game_id)
+        elif kind == "status":
+            result, status = await self.hub.call(actions.status, self.store, game_id)
+        else:
+            return GameEvent("error", {"error": "Mesaj necunoscut"}, {})
+
+        if result.get("time_up"):
+            # Expirarea a fost detectată de această acțiune: o află toți abonații
+            self.hub.publish(game_id, GameEvent.from_result("time_up", {**result, "time_left": 0}))
+            return None
+        if status == 200:
+            return GameEvent.from_result(kind, result)
+        return GameEvent.from_result("error", result)
+
+    async def _initial_state(self, game_id: Optional[str]) -> Optional[GameEvent]:
+        result, status = await self.hub.call(actions.snapshot, self.store, game_id)
+        if status != 200:
+            return None
+        return GameEvent.from_result("time_up" if result.get("time_up") else "state", result)
+
+    async def websocket(self, game_id: Optional[str], receive: Receive, send: Send,
+                        limit: Optional[Limit] = None) -> None:
+        """
+        Sesiune WebSocket pentru un joc
+
+        Mesaje client -> server (JSON): {"type": "guess", "letter": "A"},
+        {"type": "guess_batch", "letters": "AE"}, {"type": "status"},
+        {"type": "hint"}. Server -> client: cadre {"type": ..., ...} cu
+        câmpurile de stare modificate.
+
+        Fiecare mesaj consumă limita de rată a rutei HTTP echivalente
+        (MESSAGE_ROUTES); peste limită conexiunea se închide cu 1008.
+        """
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        initial = await self._initial_state(game_id)
+        await send({"type": "websocket.accept"})
+        if initial is None:
+            await send({"type": "websocket.send",
+                        "text": json_provider.dumps(NO_GAME_FRAME).decode("utf-8")})
+            await send({"type": "websocket.close", "code": CLOSE_NO_GAME})
+            return
+
+        tracker = StateTracker()
+        queue = self.hub.subscribe(game_id)
+        queue.put_nowait(initial)
+
+        async def pump() -> None:
+            while True:
+                event = await queue.get()
+                for frame in tracker.frames(event):
+                    await send({"type": "websocket.send",
+                                "text": json_provider.dumps(frame).decode("utf-8")})
+
+        writer = asyncio.create_task(pump())
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message["type"] != "websocket.receive":
+                    continue
+                try:
+                    payload = json_provider.loads(message.get("text") or message.get("bytes") or b"")
+                except ValueError:
+                    payload = None
+                kind = payload.get("type") if isinstance(payload, dict) else None
+                if limit is not None and limit(MESSAGE_ROUTES.get(kind, "/ws")):
+                    logger.info(f"Rate limit exceeded on the channel of game {game_id}, closing")
+                    await send({"type": "websocket.close", "code": CLOSE_POLICY_VIOLATION})
+                    break
+                if not isinstance(payload, dict):
+                    reply = GameEvent("error", {"error": "Mesaj invalid"}, {})
+                else:
+                    reply = await self.perform(game_id, payload)
+                if reply is not None:
+                    await queue.put(reply)
+        finally:
+            writer.cancel()
+            self.hub.unsubscribe(game_id, queue)
+
+    async def event_stream(self, game_id: Optional[str], receive: Receive,
+                           send: Send) -> bool:
+        """
+        Flux SSE (text/event-stream) pentru un joc; se încheie la game_over
+
+        Ghicirile se trimit în continuare prin POST, iar rezultatele lor
+        ajung și pe acest flux.
+
+        Returns:
+            False dacă jocul nu există (nu s-a trimis nimic)
+        """
+        initial = await self._initial_state(game_id)
+        if initial is None:
+            return False
+
+        await send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"text/event-stream"),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),
+        ]})
+
+        tracker = StateTracker()
+        queue = self.hub.subscribe(game_id)
+        queue.put_nowait(initial)
+        disconnected = asyncio.create_task(self._wait_disconnect(receive))
+        try:
+            while not disconnected.done():
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, disconnected}, timeout=SSE_HEARTBEAT,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    if not done:
+                        await send({"type": "http.response.body", "body": b": keep-alive\n\n",
+                                    "more_body": True})
+                    continue
+                frames = tracker.frames(getter.result())
+                body = b"".join(b"data: " + json_provider.dumps(frame) + b"\n\n" for frame in frames)
+                finished = frames[-1]["type"] == "game_over"
+                await send({"type": "http.response.body", "body": body,
+                            "more_body": not finished})
+                if finished:
+                    break
+        finally:
+            disconnected.cancel()
+            self.hub.unsubscribe(game_id, queue)
+        return True
+
+    @staticmethod
+    async def _wait_disconnect(receive: Receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
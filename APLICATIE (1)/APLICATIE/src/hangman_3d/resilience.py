@@ -0,0 +1,181 @@
+"""
+Bugete de latență, cereri dublate (hedging) și circuit breaker pentru
+apelurile către API-uri externe
+
+Fiecare endpoint are un buget: timpul total al unui apel, cu tot cu
+reîncercări. Dacă primul răspuns întârzie peste p95-ul recent al
+endpoint-ului, se trimite o a doua cerere identică și se folosește cea care
+răspunde prima; reîncercările (cu backoff exponențial și jitter) se fac doar
+cât mai rămâne buget. Circuit breaker-ul refuză imediat apelurile cât timp
+serverul pare căzut, apoi lasă o singură cerere de probă.
+
+LatencyTracker păstrează latențele recente per endpoint și contoarele
+folosite la reglarea acestor valori (APIClient.latency_stats()).
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+import logging
+
+import requests
+
+from .utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+# Segmentele numerice ale căii devin {id}: /posts/3/comments -> /posts/{id}/comments
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_of(path: str) -> str:
+    """Eticheta endpoint-ului unei căi (fără query string și ID-uri)"""
+    return _NUMERIC_SEGMENT.sub("/{id}", path.split("?", 1)[0]) or "/"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Apel refuzat fără a contacta serverul: circuitul este deschis"""
+
+
+class BudgetExceededError(requests.exceptions.Timeout):
+    """Bugetul de latență al apelului s-a epuizat"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker cu trei stări: închis, deschis și semi-deschis
+
+    După failure_threshold apeluri eșuate consecutiv circuitul se deschide
+    și apelurile sunt refuzate timp de reset_timeout secunde; apoi un
+    singur apel de probă decide dacă circuitul se închide sau se redeschide.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            failure_threshold: Eșecuri consecutive care deschid circuitul
+            reset_timeout: Secunde până la apelul de probă
+            clock: Sursa de timp (injectabilă pentru teste)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.state = self.CLOSED
+
+    def allow(self) -> bool:
+        """Poate pleca un apel?"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Upstream recovered, closing circuit")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Upstream degraded after {self._failures} failures, "
+                                   f"opening circuit for {self.reset_timeout}s")
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+class _EndpointStats:
+    """Latențele recente și contoarele unui endpoint"""
+
+    __slots__ = ("latencies", "requests", "errors", "hedged", "hedge_wins",
+                 "retries", "budget_exceeded", "rejected")
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.retries = 0
+        self.budget_exceeded = 0
+        self.rejected = 0
+
+
+class LatencyTracker:
+    """Latențele recente (fereastră glisantă) și contoarele per endpoint"""
+
+    def __init__(self, window: int = 512):
+        self.window = window
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints.setdefault(endpoint, _EndpointStats(self.window))
+        return stats
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Înregistrează durata unei cereri reușite (inclusiv dublurile)"""
+        with self._lock:
+            self._stats(endpoint).latencies.append(seconds)
+
+    def count(self, endpoint: str, counter: str, value: int = 1) -> None:
+        """Incrementează un contor (requests, errors, hedged, retries...)"""
+        with self._lock:
+            stats = self._stats(endpoint)
+            setattr(stats, counter, getattr(stats, counter) + value)
+
+    def ratio(self, endpoint: str, counter: str) -> float:
+        """Contorul raportat la numărul de cereri ale endpoint-ului"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None or not stats.requests:
+                return 0.0
+            return getattr(stats, counter) / stats.requests
+
+    def percentile(self, endpoint: str, p: float, min_samples: int = 1) -> Optional[float]:
+        """Percentila p a latențelor recente, None sub min_samples măsurători"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None or len(stats.latencies) < min_samples:
+                return None
+            ordered = sorted(stats.latencies)
+        return percentile(ordered, p)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Câte un rând per endpoint, cu percentilele în milisecunde"""
+        with self._lock:
+            snapshot = [(endpoint, sorted(stats.latencies), {
+                name: getattr(stats, name) for name in _EndpointStats.__slots__[1:]
+            }) for endpoint, stats in sorted(self._endpoints.items())]
+        return [{
+            "endpoint": endpoint,
+            **counters,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        } for endpoint, ordered, counters in snapshot]
@@ -3,5 +3,6 @@ Rute și endpoints API
 """
 
 from .game import game_bp
+from .assets import assets_bp
 
-__all__ = ["game_bp"]
+__all__ = ["game_bp", "assets_bp"]
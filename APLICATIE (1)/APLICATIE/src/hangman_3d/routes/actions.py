@@ -0,0 +1,162 @@
+"""
+Logica endpoint-urilor de joc, independentă de framework
+
+Funcțiile primesc backend-ul de sesiuni și datele deja extrase din cerere
+și returnează (corp JSON, cod HTTP). Sunt folosite atât de blueprint-ul
+Flask (WSGI), cât și de aplicația ASGI.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models import GameState
+from ..dictionary import DIFFICULTIES, get_dictionary
+from ..sessions import SessionStore
+from ..json_provider import ConstantPayload
+
+Result = Tuple[Dict[str, Any], int]
+
+# Alfabetul are 26 de litere; loturile mai mari sunt inutile
+MAX_BATCH_LETTERS = 26
+
+NO_GAME_ERROR = "Nu este inițiat niciun joc"
+
+# Corpurile de eroare constante sunt serializate o singură dată
+NO_GAME = ConstantPayload({"error": NO_GAME_ERROR})
+NO_LETTER = ConstantPayload({"error": "Nicio literă furnizată"})
+TOO_MANY_LETTERS = ConstantPayload({"error": "Prea multe litere într-o cerere"})
+GAME_ENDED = ConstantPayload({"success": False, "error": "Jocul s-a încheiat"})
+
+
+def _no_game() -> Result:
+    return NO_GAME, 400
+
+
+def start_game(store: SessionStore, difficulty: Any = 'mediu') -> Result:
+    """
+    Pornește un joc nou
+
+    Returns:
+        Corpul răspunsului (include game_id) și codul HTTP
+    """
+    # Validare dificultate
+    if difficulty not in DIFFICULTIES:
+        difficulty = 'mediu'
+
+    game_state = GameState(difficulty)
+    game_id = store.create(game_state)
+
+    return {
+        "success": True,
+        "game_id": game_id,
+        "word_length": len(game_state.word),
+        "time_left": game_state.time_left,
+        "difficulty": difficulty
+    }, 200
+
+
+def guess(store: SessionStore, game_id: Optional[str], letter: Any) -> Result:
+    """Ghicește o literă în jocul `game_id`"""
+    if not letter:
+        if store.get(game_id) is None:
+            return _no_game()
+        return NO_LETTER, 400
+
+    result = store.update(game_id, lambda game: game.guess_letter(letter))
+
+    if result is None:
+        return _no_game()
+
+    if not result.get('success'):
+        return result, 400
+
+    return result, 200
+
+
+def guess_batch(store: SessionStore, game_id: Optional[str], letters: Any) -> Result:
+    """Ghicește mai multe litere într-o singură operație atomică"""
+    if isinstance(letters, str):
+        letters = list(letters)
+
+    if (not letters or not isinstance(letters, list)
+            or not all(isinstance(letter, str) for letter in letters)):
+        return NO_LETTER, 400
+
+    if len(letters) > MAX_BATCH_LETTERS:
+        return TOO_MANY_LETTERS, 400
+
+    batch: List[str] = letters
+    result = store.update(game_id, lambda game: game.guess_letters(batch))
+
+    if result is None:
+        return _no_game()
+
+    return result, 200
+
+
+def hint(store: SessionStore, game_id: Optional[str]) -> Result:
+    """Recomandă următoarea literă pentru jocul `game_id`"""
+    game_state = store.get(game_id)
+
+    if game_state is None:
+        return _no_game()
+
+    # Ca la celelalte acțiuni, expirarea este evaluată înaintea indiciului
+    if game_state.expiry_pending:
+        result = store.update(game_id, GameState.status)
+        if result is None:
+            return _no_game()
+        if result.get('time_up'):
+            return {"success": False, "error": "Timpul a expirat", **result}, 400
+        return GAME_ENDED, 400
+
+    if game_state.game_over:
+        return GAME_ENDED, 400
+
+    # Import întârziat: solver-ul folosește NumPy la construirea bitset-urilor
+    from ..dictionary.solver import get_solver
+    suggestion = get_solver(get_dictionary()).suggest(
+        game_state.get_display_word(), game_state.wrong_letters
+    )
+
+    return {
+        "success": True,
+        "letter": suggestion.letter,
+        "probability": round(suggestion.probability, 3),
+        "candidates": suggestion.candidates
+    }, 200
+
+
+def _read(store: SessionStore, game_id: Optional[str],
+          view: Callable[[GameState], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Citește jocul fără a-l scrie înapoi
+
+    Doar când timpul tocmai a expirat (game_over trebuie salvat) citirea
+    trece prin store.update; altfel nu există nicio scriere CAS.
+    """
+    game = store.get(game_id)
+    if game is None:
+        return None
+    if game.expiry_pending:
+        return store.update(game_id, view)
+    return view(game)
+
+
+def status(store: SessionStore, game_id: Optional[str]) -> Result:
+    """Statusul timpului pentru jocul `game_id` (doar citire)"""
+    result = _read(store, game_id, GameState.status)
+
+    if result is None:
+        return _no_game()
+
+    return result, 200
+
+
+def snapshot(store: SessionStore, game_id: Optional[str]) -> Result:
+    """Starea completă a jocului `game_id` (pentru clienții care se conectează)"""
+    result = _read(store, game_id, GameState.snapshot)
+
+    if result is None:
+        return _no_game()
+
+    return result, 200
@@ -0,0 +1,24 @@
+"""
+Rute pentru asset-urile amprentate (static/dist)
+"""
+
+from flask import Blueprint, abort, current_app, request
+
+assets_bp = Blueprint('assets', __name__)
+
+
+def send_resource(resource):
+    """Răspunsul Flask pentru o resursă precomprimată (negociere + 304)"""
+    status, body, headers = resource.respond(
+        request.headers.get('Accept-Encoding'), request.headers.get('If-None-Match')
+    )
+    return current_app.response_class(body, status=status, headers=headers)
+
+
+@assets_bp.route('/static/dist/<path:filename>')
+def fingerprinted(filename: str):
+    """Servește un asset amprentat, precomprimat, cu cache immutable"""
+    resource = current_app.extensions['static_files'].get(f'dist/{filename}')
+    if resource is None:
+        abort(404)
+    return send_resource(resource)
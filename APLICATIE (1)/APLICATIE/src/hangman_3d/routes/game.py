@@ -3,61 +3,68 @@ Rute pentru endpoints de joc
 """
 
 from typing import Optional
-from flask import Blueprint, render_template, jsonify, request
-from ..models import GameState
+from flask import Blueprint, jsonify, request, current_app
+from ..sessions import SessionStore
+from . import actions
+from .assets import send_resource
 
 game_bp = Blueprint('game', __name__)
 
-# Starea globală a jocului (în producție, ar trebui să folosească sesiuni)
-game_state: Optional[GameState] = None
+# Numele cookie-ului care identifică jocul clientului
+GAME_COOKIE = 'game_id'
+
+
+def _sessions() -> SessionStore:
+    """Returnează backend-ul de sesiuni al aplicației curente"""
+    return current_app.extensions['game_sessions']
+
+
+def _game_id() -> Optional[str]:
+    """Extrage game_id din corpul JSON, query string sau, implicit, din cookie"""
+    payload = request.get_json(silent=True) or {}
+    return (payload.get('game_id') or request.args.get('game_id')
+            or request.cookies.get(GAME_COOKIE))
 
 
 @game_bp.route('/')
 def index():
-    """Servește pagina principală"""
-    return render_template('index.html')
+    """Servește pagina principală (randată și comprimată la pornire)"""
+    return send_resource(current_app.extensions['index_page'])
 
 
 @game_bp.route('/start_game', methods=['POST'])
 def start_game():
     """
     Pornește un joc nou
-    
+
     Request JSON:
         - difficulty: str (usor, mediu, greu, expert)
-        
+
     Response:
         - success: bool
+        - game_id: str
         - word_length: int
         - time_left: int
         - difficulty: str
     """
-    global game_state
-    
     difficulty = request.json.get('difficulty', 'mediu') if request.json else 'mediu'
-    
-    # Validare dificultate
-    if difficulty not in ['usor', 'mediu', 'greu', 'expert']:
-        difficulty = 'mediu'
-    
-    game_state = GameState(difficulty)
-    
-    return jsonify({
-        "success": True,
-        "word_length": len(game_state.word),
-        "time_left": game_state.time_left,
-        "difficulty": difficulty
-    })
+
+    payload, status = actions.start_game(_sessions(), difficulty)
+
+    response = jsonify(payload)
+    response.set_cookie(GAME_COOKIE, payload['game_id'], httponly=True, samesite='Lax')
+    return response, status
 
 
 @game_bp.route('/guess', methods=['POST'])
 def guess_letter():
     """
     Ghicește o literă
-    
+
     Request JSON:
         - letter: str (o singură literă)
-        
+        - game_id: str (opțional, implicit din cookie)
+
     Response:
         - correct: bool
         - displayed_word: str
@@ -66,42 +73,63 @@ def guess_letter():
         - won: bool
         - word: str (doar dacă game_over)
     """
-    global game_state
-    
-    if game_state is None:
-        return jsonify({"error": "Nu este inițiat niciun joc"}), 400
-    
     letter = request.json.get('letter', '') if request.json else ''
-    
-    if not letter:
-        return jsonify({"error": "Nicio literă furnizată"}), 400
-    
-    result = game_state.guess_letter(letter)
-    
-    if not result.get('success'):
-        return jsonify(result), 400
-    
-    return jsonify(result)
-
-
-@game_bp.route('/update_time', methods=['POST'])
-def update_time():
+
+    payload, status = actions.guess(_sessions(), _game_id(), letter)
+    return jsonify(payload), status
+
+
+@game_bp.route('/guess_batch', methods=['POST'])
+def guess_batch():
     """
-    Actualizează timp rămas
-    
+    Ghicește mai multe litere într-o singură cerere, atomic
+
     Request JSON:
-        - time_left: int (secunde)
-        
+        - letters: list[str] sau str (literele, în ordine)
+        - game_id: str (opțional, implicit din cookie)
+
+    Response:
+        - results: list (letter, success, correct sau error) pentru fiecare
+          literă procesată; procesarea se oprește la sfârșitul jocului
+        - displayed_word, wrong_guesses, game_over, won, word: starea finală
+    """
+    letters = request.json.get('letters', []) if request.json else []
+
+    payload, status = actions.guess_batch(_sessions(), _game_id(), letters)
+    return jsonify(payload), status
+
+
+@game_bp.route('/hint', methods=['GET', 'POST'])
+def hint():
+    """
+    Recomandă următoarea literă pentru jocul curent
+
+    Request JSON (opțional):
+        - game_id: str (opțional, implicit din cookie)
+
+    Response:
+        - success: bool
+        - letter: str (sau null dacă nu există recomandare)
+        - probability: float (proporția candidaților care conțin litera)
+        - candidates: int (cuvinte din dicționar compatibile cu jocul)
+    """
+    payload, status = actions.hint(_sessions(), _game_id())
+    return jsonify(payload), status
+
+
+@game_bp.route('/update_time', methods=['GET', 'POST'])
+def update_time():
+    """
+    Status timp (doar citire; serverul calculează timpul din termenul limită)
+
+    Request JSON (opțional):
+        - game_id: str (opțional, implicit din cookie)
+        - time_left: int (ignorat, păstrat pentru clienții vechi)
+
     Response:
         - success: bool
         - time_left: int (sau time_up: bool dacă timeout)
+        - game_over: bool
     """
-    global game_state
-    
-    if game_state is None:
-        return jsonify({"error": "Nu este inițiat niciun joc"}), 400
-    
-    time_left = request.json.get('time_left', 0) if request.json else 0
-    result = game_state.update_time(time_left)
-    
-    return jsonify(result)
+    payload, status = actions.status(_sessions(), _game_id())
+    return jsonify(payload), status
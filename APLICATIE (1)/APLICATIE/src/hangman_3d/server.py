@@ -0,0 +1,373 @@
+"""
+Server WSGI de producție cu procese preforkate
+
+Procesul master construiește aplicația (create_app('production')) și
+dicționarul de cuvinte o singură dată, deschide socket-ul de ascultare și
+apoi pornește N procese worker prin fork(). Worker-ii moștenesc paginile
+deja încărcate și le împart copy-on-write; gc.freeze() mută obiectele
+preîncărcate din generațiile colectorului, ca acesta să nu le atingă (și
+copieze) în fiecare worker.
+
+Semnale acceptate de master:
+    SIGHUP          reîncarcă aplicația și înlocuiește treptat worker-ii
+    SIGTERM/SIGINT  oprire: worker-ii termină cererea curentă și ies
+
+Un worker iese singur după SERVER_MAX_REQUESTS cereri (plus un jitter
+aleator, ca să nu se recicleze toți deodată) și este înlocuit de master.
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.server [--workers 4] [--port 5000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+import logging
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+logger = logging.getLogger(__name__)
+
+# Cât așteaptă un worker pe socket înainte să-și verifice starea
+WORKER_POLL_INTERVAL = 1.0
+
+# Un worker care moare mai repede de atât este considerat defect la pornire
+MIN_WORKER_LIFETIME = 1.0
+
+AppFactory = Callable[[], Callable[..., Any]]
+
+
+def worker_count(configured: int = 0) -> int:
+    """Numărul de worker-i: valoarea configurată sau numărul de nuclee"""
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def server_options(app_config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Argumentele PreforkServer citite din configurația aplicației"""
+    return {
+        "host": app_config["SERVER_HOST"],
+        "port": app_config["SERVER_PORT"],
+        "workers": worker_count(app_config["SERVER_WORKERS"]),
+        "max_requests": app_config["SERVER_MAX_REQUESTS"],
+        "max_requests_jitter": app_config["SERVER_MAX_REQUESTS_JITTER"],
+        "graceful_timeout": app_config["SERVER_GRACEFUL_TIMEOUT"],
+        "backlog": app_config["SERVER_BACKLOG"],
+        "access_log": app_config["SERVER_ACCESS_LOG"],
+    }
+
+
+class _RequestHandler(WSGIRequestHandler):
+    """Handler HTTP/1.0: o conexiune keep-alive ar bloca un worker sincron"""
+
+    protocol_version = "HTTP/1.0"
+    access_log = False
+
+    def log_request(self, *args: Any, **kwargs: Any) -> None:
+        if self.access_log:
+            super().log_request(*args, **kwargs)
+
+
+class _WorkerServer(BaseWSGIServer):
+    """Serverul unui worker, pe socket-ul moștenit de la master"""
+
+    multiprocess = True
+
+
+class PreforkServer:
+    """
+    Master care preîncarcă aplicația și supraveghează worker-ii
+
+    Socket-ul de ascultare este neblocant și comun tuturor worker-ilor:
+    fiecare face accept() când select() îl anunță, iar cei care pierd
+    cursa primesc EAGAIN și reiau așteptarea.
+    """
+
+    def __init__(self, app_factory: AppFactory, host: str = "0.0.0.0", port: int = 5000,
+                 workers: int = 1, max_requests: int = 0, max_requests_jitter: int = 0,
+                 graceful_timeout: float = 30.0, backlog: int = 2048,
+                 access_log: bool = False):
+        """
+        Args:
+            app_factory: Construiește aplicația WSGI (apelată în master, și la SIGHUP)
+            host: Adresa de ascultare
+            port: Portul (0 = ales de sistem)
+            workers: Numărul de procese worker
+            max_requests: Cereri după care un worker este reciclat (0 = niciodată)
+            max_requests_jitter: Cereri suplimentare aleatoare peste max_requests
+            graceful_timeout: Secunde acordate worker-ilor să termine la oprire
+            backlog: Lungimea cozii de conexiuni a socket-ului
+            access_log: Loghează fiecare cerere
+        """
+        self.app_factory = app_factory
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.access_log = access_log
+
+        self.app: Optional[Callable[..., Any]] = None
+        self.socket: Optional[socket.socket] = None
+        self.children: Dict[int, float] = {}  # pid -> momentul pornirii
+        self._signals: list = []
+        self._wakeup_r = self._wakeup_w = -1
+
+    # ---- master ----
+
+    def preload(self) -> None:
+        """Construiește aplicația în master, înainte de fork"""
+        self.app = self.app_factory()
+        # Conexiunile deschise în master (SQLite, Redis) nu trebuie împărțite
+        # între procese; worker-ii le redeschid la prima cerere
+        store = getattr(self.app, "extensions", {}).get("game_sessions")
+        if store is not None:
+            store.close()
+        gc.collect()
+        gc.freeze()
+
+    def bind(self) -> socket.socket:
+        """Deschide socket-ul de ascultare comun"""
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.setblocking(False)
+        self.port = sock.getsockname()[1]
+        self.socket = sock
+        return sock
+
+    def run(self) -> int:
+        """Pornește master-ul; revine după oprire"""
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Serverul preforkat necesită os.fork (Linux/macOS)")
+
+        self.preload()
+        if self.socket is None:
+            self.bind()
+        logger.info(f"Prefork master {os.getpid()} listening on {self.host}:{self.port} "
+                    f"with {self.workers} workers")
+
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        signal.set_wakeup_fd(self._wakeup_w)
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(signum, self._on_signal)
+
+        try:
+            self._spawn_missing()
+            while True:
+                select.select([self._wakeup_r], [], [], 1.0)
+                try:
+                    os.read(self._wakeup_r, 64)
+                except BlockingIOError:
+                    pass
+                self._reap()
+                signals, self._signals = self._signals, []
+                if signal.SIGTERM in signals or signal.SIGINT in signals:
+                    break
+                if signal.SIGHUP in signals:
+                    self.reload()
+                self._spawn_missing()
+        finally:
+            self.stop()
+            signal.set_wakeup_fd(-1)
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+        return 0
+
+    def _on_signal(self, signum: int, frame: Any) -> None:
+        self._signals.append(signum)
+
+    def _spawn_missing(self) -> None:
+        while len(self.children) < self.workers:
+            self._spawn()
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return pid
+        # Proces copil: nu se mai întoarce în bucla master-ului
+        code = 1
+        try:
+            code = self._worker()
+        except BaseException:
+            logger.exception(f"Worker {os.getpid()} crashed")
+        finally:
+            os._exit(code)
+
+    def _reap(self) -> None:
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            started = self.children.pop(pid, None)
+            if started is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if code != 0:
+                logger.warning(f"Worker {pid} exited with status {code}")
+                if time.monotonic() - started < MIN_WORKER_LIFETIME:
+                    # Evită o buclă strânsă de fork-uri dacă worker-ii nu pot porni
+                    time.sleep(MIN_WORKER_LIFETIME)
+
+    def reload(self) -> None:
+        """
+        Reîncărcare fără întrerupere: aplicația este reconstruită, noii
+        worker-i pornesc, apoi cei vechi termină cererea curentă și ies
+
+        Dacă aplicația nouă nu se poate construi (de ex. o eroare în cod
+        sau în configurație), rămân aplicația și worker-ii existenți.
+        """
+        logger.info("Reloading application")
+        old = list(self.children)
+        old_app = self.app
+        gc.unfreeze()
+        try:
+            self.preload()
+        except Exception:
+            logger.exception("Reload failed, keeping the running workers")
+            self.app = old_app
+            gc.freeze()
+            return
+        for _ in range(self.workers):
+            self._spawn()
+        for pid in old:
+            self._kill(pid, signal.SIGTERM)
+
+    def stop(self) -> None:
+        """Oprește worker-ii (SIGTERM, apoi SIGKILL după graceful_timeout)"""
+        for pid in list(self.children):
+            self._kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.05)
+        for pid in list(self.children):
+            logger.warning(f"Worker {pid} did not stop in time, killing it")
+            self._kill(pid, signal.SIGKILL)
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.children.clear()
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        logger.info("Prefork master stopped")
+
+    def _kill(self, pid: int, signum: int) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            self.children.pop(pid, None)
+
+    # ---- worker ----
+
+    def _worker(self) -> int:
+        """Bucla unui worker; returnează codul de ieșire"""
+        signal.set_wakeup_fd(-1)
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        master = os.getppid()
+        alive = True
+
+        def stop(signum: int, frame: Any) -> None:
+            nonlocal alive
+            alive = False
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        limit = 0
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, max(self.max_requests_jitter, 0))
+        served = 0
+        app = self.app
+
+        def counting_app(environ: Dict[str, Any], start_response: Callable[..., Any]):
+            nonlocal served
+            served += 1
+            return app(environ, start_response)
+
+        handler = type("RequestHandler", (_RequestHandler,), {"access_log": self.access_log})
+        server = _WorkerServer(self.host, self.port, counting_app, handler=handler,
+                               fd=self.socket.fileno())
+        server.timeout = WORKER_POLL_INTERVAL
+        try:
+            while alive and (limit == 0 or served < limit) and os.getppid() == master:
+                server.handle_request()
+        finally:
+            server.server_close()
+        if limit and served >= limit:
+            logger.info(f"Worker {os.getpid()} recycled after {served} requests")
+        return 0
+
+
+def serve(config_name: str = "production", **overrides: Any) -> int:
+    """
+    Pornește aplicația Hangman 3D sub serverul preforkat
+
+    Args:
+        config_name: Configurația aplicației (setările SERVER_* o conduc)
+        overrides: Valori care înlocuiesc setările din configurație
+    """
+    from flask import Config
+
+    from .app import create_app
+    from .config import config
+    from .dictionary import get_dictionary
+
+    app_config = Config("")
+    app_config.from_object(config.get(config_name, config["default"]))
+    options = server_options(app_config)
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    if app_config["SESSION_BACKEND"] == "memory" and options["workers"] > 1:
+        logger.warning("SESSION_BACKEND=memory keeps games per worker; "
+                       "use sqlite or redis with several workers")
+
+    def load_app():
+        app = create_app(config_name)
+        # Indexul de cuvinte se construiește în master și se împarte cu worker-ii
+        get_dictionary()
+        return app
+
+    return PreforkServer(load_app, **options).run()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI"""
+    parser = argparse.ArgumentParser(description="Server WSGI preforkat pentru Hangman 3D")
+    parser.add_argument("--config", default="production")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--workers", type=int, help="Implicit numărul de nuclee")
+    parser.add_argument("--max-requests", type=int)
+    args = parser.parse_args(argv)
+
+    workers = worker_count(args.workers) if args.workers is not None else None
+    return serve(args.config, host=args.host, port=args.port, workers=workers,
+                 max_requests=args.max_requests)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Stocarea sesiunilor de joc (memorie, SQLite, Redis)
+"""
+
+from typing import Any, Mapping
+
+from .base import SessionStore, SerializedSessionStore, SessionConflictError
+from .memory import MemorySessionStore
+from .sqlite import SQLiteSessionStore
+from .redis import RedisSessionStore
+
+
+def create_session_store(config: Mapping[str, Any]) -> SessionStore:
+    """
+    Construiește backend-ul de sesiuni descris de configurație
+
+    Args:
+        config: Configurația aplicației (app.config)
+
+    Returns:
+        Instanță SessionStore
+    """
+    backend = config.get('SESSION_BACKEND', 'memory')
+    max_sessions = config['GAME_SESSION_MAX']
+    ttl = config['GAME_SESSION_TTL']
+
+    if backend == 'memory':
+        return MemorySessionStore(
+            max_sessions=max_sessions,
+            ttl=ttl,
+            stripes=config['GAME_SESSION_LOCK_STRIPES']
+        )
+    if backend == 'sqlite':
+        return SQLiteSessionStore(config['SESSION_SQLITE_PATH'], max_sessions=max_sessions, ttl=ttl)
+    if backend == 'redis':
+        return RedisSessionStore(config['SESSION_REDIS_URL'], ttl=ttl)
+
+    raise ValueError(f"Backend de sesiuni necunoscut: {backend}")
+
+
+__all__ = [
+    "SessionStore",
+    "SerializedSessionStore",
+    "SessionConflictError",
+    "MemorySessionStore",
+    "SQLiteSessionStore",
+    "RedisSessionStore",
+    "create_session_store",
+]
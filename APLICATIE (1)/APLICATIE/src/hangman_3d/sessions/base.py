@@ -0,0 +1,125 @@
+"""
+Abstracția SessionStore pentru stocarea jocurilor active
+"""
+
+import secrets
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple, TypeVar
+import logging
+
+from ..models import GameState
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SessionConflictError(RuntimeError):
+    """Ridicată când o actualizare nu reușește după toate reîncercările CAS"""
+
+
+class SessionStore(ABC):
+    """
+    Interfață comună pentru backend-urile de sesiuni de joc
+
+    Rutele folosesc doar create/get/update, astfel încât backend-ul
+    (memorie, SQLite, Redis) poate fi schimbat din configurație.
+    """
+
+    @staticmethod
+    def new_game_id() -> str:
+        """Generează un identificator de joc imposibil de ghicit"""
+        return secrets.token_urlsafe(16)
+
+    def create(self, game: GameState) -> str:
+        """
+        Înregistrează un joc nou
+
+        Args:
+            game: Starea jocului
+
+        Returns:
+            game_id generat pentru joc
+        """
+        game_id = self.new_game_id()
+        self.put(game_id, game)
+        return game_id
+
+    @abstractmethod
+    def put(self, game_id: str, game: GameState) -> None:
+        """Înregistrează (sau înlocuiește) jocul pentru un game_id"""
+
+    @abstractmethod
+    def get(self, game_id: Optional[str]) -> Optional[GameState]:
+        """Returnează jocul sau None dacă nu există ori a expirat"""
+
+    @abstractmethod
+    def update(self, game_id: Optional[str], mutator: Callable[[GameState], T]) -> Optional[T]:
+        """
+        Aplică atomic o modificare asupra unui joc
+
+        Args:
+            game_id: Identificatorul jocului
+            mutator: Funcție care modifică starea și returnează un rezultat
+                (nu trebuie să returneze None)
+
+        Returns:
+            Rezultatul mutator-ului sau None dacă jocul nu există
+        """
+
+    @abstractmethod
+    def delete(self, game_id: str) -> bool:
+        """Elimină un joc; returnează True dacă exista"""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Elimină jocurile expirate; returnează numărul lor"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Numărul de jocuri active"""
+
+    def close(self) -> None:
+        """Eliberează resursele backend-ului (conexiuni, fișiere)"""
+
+
+class SerializedSessionStore(SessionStore):
+    """
+    Bază pentru backend-urile care păstrează jocurile serializate
+
+    Subclasele implementează doar citirea versionată și compare-and-set;
+    o actualizare costă exact o citire și o scriere condiționată.
+    """
+
+    max_retries = 8
+
+    @abstractmethod
+    def _load(self, game_id: str) -> Optional[Tuple[int, bytes]]:
+        """Returnează (versiune, octeți) sau None"""
+
+    @abstractmethod
+    def _compare_and_set(self, game_id: str, version: int, data: bytes) -> bool:
+        """Scrie datele doar dacă versiunea stocată este încă `version`"""
+
+    def get(self, game_id: Optional[str]) -> Optional[GameState]:
+        if not game_id:
+            return None
+        loaded = self._load(game_id)
+        if loaded is None:
+            return None
+        return GameState.from_bytes(loaded[1])
+
+    def update(self, game_id: Optional[str], mutator: Callable[[GameState], T]) -> Optional[T]:
+        if not game_id:
+            return None
+        for _ in range(self.max_retries):
+            loaded = self._load(game_id)
+            if loaded is None:
+                return None
+            version, data = loaded
+            game = GameState.from_bytes(data)
+            result = mutator(game)
+            if self._compare_and_set(game_id, version, game.to_bytes()):
+                return result
+            logger.debug(f"CAS conflict on game {game_id}, retrying")
+        raise SessionConflictError(f"Actualizare eșuată pentru jocul {game_id}")
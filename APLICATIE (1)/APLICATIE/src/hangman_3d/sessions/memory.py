@@ -0,0 +1,176 @@
+"""
+Backend de sesiuni în memoria procesului
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, TypeVar
+import logging
+
+from ..models import GameState
+from .base import SessionStore
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    """Intrare compactă din registru: jocul și momentul ultimului acces"""
+
+    __slots__ = ("game", "last_access")
+
+    def __init__(self, game: GameState, last_access: float):
+        self.game = game
+        self.last_access = last_access
+
+
+class _Stripe:
+    """Un segment al registrului, cu lacătul și intrările proprii"""
+
+    __slots__ = ("lock", "entries")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # game_id -> _Entry; ordinea = ordinea LRU
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Registru de jocuri active în memorie, indexat după game_id
+
+    Cheile sunt distribuite pe mai multe segmente (lock striping), astfel încât
+    cererile pentru jocuri diferite nu se serializează pe un singur lacăt.
+    Fiecare segment ține intrările în ordine LRU și elimină jocurile
+    abandonate după TTL sau când capacitatea segmentului este depășită.
+    """
+
+    def __init__(self, max_sessions: int = 50000, ttl: float = 1800,
+                 stripes: int = 64, clock: Callable[[], float] = time.monotonic):
+        """
+        Inițializează registrul
+
+        Args:
+            max_sessions: Numărul maxim de jocuri păstrate în memorie
+            ttl: Secunde de inactivitate după care un joc este eliminat
+            stripes: Numărul de segmente (lacăte) independente
+            clock: Sursa de timp (injectabilă pentru teste)
+        """
+        if stripes < 1:
+            raise ValueError("stripes trebuie să fie cel puțin 1")
+
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._stripes: List[_Stripe] = [_Stripe() for _ in range(stripes)]
+        self._stripe_capacity = max(1, -(-max_sessions // stripes))
+
+    def _stripe_for(self, game_id: str) -> _Stripe:
+        """Returnează segmentul responsabil de un game_id"""
+        return self._stripes[hash(game_id) % len(self._stripes)]
+
+    def _evict(self, stripe: _Stripe, now: float) -> None:
+        """Elimină intrările expirate și surplusul LRU (apelat sub lacăt)"""
+        entries = stripe.entries
+        deadline = now - self.ttl
+        while entries:
+            game_id, entry = next(iter(entries.items()))
+            if entry.last_access > deadline and len(entries) <= self._stripe_capacity:
+                break
+            del entries[game_id]
+
+    def put(self, game_id: str, game: GameState) -> None:
+        """Înregistrează (sau înlocuiește) jocul pentru un game_id"""
+        stripe = self._stripe_for(game_id)
+        now = self._clock()
+        with stripe.lock:
+            stripe.entries[game_id] = _Entry(game, now)
+            stripe.entries.move_to_end(game_id)
+            self._evict(stripe, now)
+
+    def _touch(self, stripe: _Stripe, game_id: str, now: float) -> Optional[GameState]:
+        """Returnează jocul și îl marchează ca recent folosit (apelat sub lacăt)"""
+        entry = stripe.entries.get(game_id)
+        if entry is None:
+            return None
+        if entry.last_access <= now - self.ttl:
+            del stripe.entries[game_id]
+            return None
+        entry.last_access = now
+        stripe.entries.move_to_end(game_id)
+        return entry.game
+
+    def get(self, game_id: Optional[str]) -> Optional[GameState]:
+        """
+        Returnează jocul pentru un game_id
+
+        Args:
+            game_id: Identificatorul jocului
+
+        Returns:
+            GameState sau None dacă jocul nu există ori a expirat
+        """
+        if not game_id:
+            return None
+        stripe = self._stripe_for(game_id)
+        with stripe.lock:
+            return self._touch(stripe, game_id, self._clock())
+
+    @contextmanager
+    def locked(self, game_id: Optional[str]) -> Iterator[Optional[GameState]]:
+        """
+        Oferă acces exclusiv la un joc pe durata blocului with
+
+        Lacătul segmentului este ținut cât timp blocul rulează, deci
+        modificările (ghiciri, timp) sunt atomice față de alte cereri
+        pentru același joc.
+
+        Args:
+            game_id: Identificatorul jocului
+
+        Yields:
+            GameState sau None dacă jocul nu există
+        """
+        if not game_id:
+            yield None
+            return
+        stripe = self._stripe_for(game_id)
+        with stripe.lock:
+            yield self._touch(stripe, game_id, self._clock())
+
+    def update(self, game_id: Optional[str], mutator: Callable[[GameState], T]) -> Optional[T]:
+        """Aplică mutator-ul pe obiectul viu, sub lacătul segmentului"""
+        with self.locked(game_id) as game:
+            if game is None:
+                return None
+            return mutator(game)
+
+    def delete(self, game_id: str) -> bool:
+        """Elimină un joc; returnează True dacă exista"""
+        stripe = self._stripe_for(game_id)
+        with stripe.lock:
+            return stripe.entries.pop(game_id, None) is not None
+
+    def purge_expired(self) -> int:
+        """
+        Elimină toate jocurile expirate din toate segmentele
+
+        Returns:
+            Numărul de jocuri eliminate
+        """
+        removed = 0
+        now = self._clock()
+        for stripe in self._stripes:
+            with stripe.lock:
+                before = len(stripe.entries)
+                self._evict(stripe, now)
+                removed += before - len(stripe.entries)
+        if removed:
+            logger.info(f"Purged {removed} expired game sessions")
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
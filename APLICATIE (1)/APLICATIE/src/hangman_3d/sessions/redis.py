@@ -0,0 +1,205 @@
+"""
+Backend de sesiuni peste protocolul Redis (RESP)
+"""
+
+import hashlib
+import socket
+import struct
+import threading
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+from ..models import GameState
+from .base import SerializedSessionStore
+
+logger = logging.getLogger(__name__)
+
+# Valoarea stocată: 8 octeți versiune (big-endian) + GameState.to_bytes()
+_VERSION = struct.Struct(">Q")
+
+# Compare-and-set atomic pe server: compară prefixul de versiune și scrie
+CAS_SCRIPT = """
+local cur = redis.call('GET', KEYS[1])
+if not cur or string.sub(cur, 1, 8) ~= ARGV[1] then return 0 end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+CAS_SCRIPT_SHA = hashlib.sha1(CAS_SCRIPT.encode()).hexdigest()
+
+
+class RedisError(Exception):
+    """Eroare raportată de server (răspuns RESP de tip -ERR)"""
+
+
+class ProtocolError(ConnectionError):
+    """Răspuns RESP neașteptat: conexiunea nu mai este sincronizată"""
+
+
+class RespConnection:
+    """
+    Conexiune minimală RESP2: trimite comenzi și citește răspunsuri
+    """
+
+    def __init__(self, host: str, port: int, db: int = 0, timeout: float = 5.0):
+        """
+        Deschide conexiunea
+
+        Args:
+            host: Host-ul serverului
+            port: Portul serverului
+            db: Indexul bazei de date (SELECT)
+            timeout: Timeout socket în secunde
+        """
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile('rb')
+        if db:
+            self.execute('SELECT', db)
+
+    @staticmethod
+    def _encode(args: Tuple[Any, ...]) -> bytes:
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        return b''.join(parts)
+
+    def _read(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Conexiune Redis închisă")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest.decode()
+        if kind == b'-':
+            raise RedisError(rest.decode())
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._file.read(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            length = int(rest)
+            if length < 0:
+                return None
+            return [self._read() for _ in range(length)]
+        raise ProtocolError(f"Răspuns RESP necunoscut: {line!r}")
+
+    def execute(self, *args: Any) -> Any:
+        """
+        Trimite o comandă și returnează răspunsul decodat
+
+        La o eroare de socket (inclusiv timeout) sau de protocol, conexiunea
+        se închide: pe socket pot rămâne octeți dintr-un răspuns citit doar
+        pe jumătate, care ar fi luați drept răspunsul comenzii următoare.
+        """
+        try:
+            self._sock.sendall(self._encode(args))
+            return self._read()
+        except (OSError, ValueError) as e:
+            self.close()
+            if isinstance(e, ValueError):
+                raise ProtocolError(f"Răspuns RESP invalid: {e}") from e
+            raise
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+
+class RedisSessionStore(SerializedSessionStore):
+    """
+    Jocuri stocate într-un server compatibil Redis
+
+    Citirea folosește GETEX (reîmprospătează TTL-ul), iar scrierea un script
+    Lua de compare-and-set apelat prin EVALSHA, deci fiecare operație este
+    un singur drum dus-întors. Limita de memorie este lăsată pe seama
+    politicii maxmemory/LRU a serverului.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", ttl: int = 1800,
+                 prefix: str = "hangman:game:", timeout: float = 5.0):
+        """
+        Inițializează backend-ul Redis
+
+        Args:
+            url: URL de forma redis://host:port/db
+            ttl: Secunde de inactivitate după care un joc expiră
+            prefix: Prefixul cheilor
+            timeout: Timeout socket în secunde
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.ttl = int(ttl)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _conn(self) -> RespConnection:
+        """Returnează conexiunea firului curent, creând-o la nevoie"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = RespConnection(self.host, self.port, self.db, self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _execute(self, *args: Any) -> Any:
+        """Execută o comandă; o conexiune stricată se înlocuiește la următorul apel"""
+        try:
+            return self._conn().execute(*args)
+        except OSError:
+            # Timeout, conexiune închisă sau ProtocolError: RespConnection
+            # a închis deja socket-ul
+            self._local.conn = None
+            raise
+
+    def _key(self, game_id: str) -> str:
+        return self.prefix + game_id
+
+    def put(self, game_id: str, game: GameState) -> None:
+        self._execute(
+            'SET', self._key(game_id), _VERSION.pack(0) + game.to_bytes(), 'EX', self.ttl
+        )
+
+    def _load(self, game_id: str) -> Optional[Tuple[int, bytes]]:
+        value = self._execute('GETEX', self._key(game_id), 'EX', self.ttl)
+        if value is None:
+            return None
+        return _VERSION.unpack_from(value)[0], value[_VERSION.size:]
+
+    def _compare_and_set(self, game_id: str, version: int, data: bytes) -> bool:
+        args: List[Any] = [
+            1, self._key(game_id),
+            _VERSION.pack(version), _VERSION.pack(version + 1) + data, self.ttl
+        ]
+        try:
+            return self._execute('EVALSHA', CAS_SCRIPT_SHA, *args) == 1
+        except RedisError as e:
+            if not str(e).startswith('NOSCRIPT'):
+                raise
+            logger.info("Loading CAS script into Redis")
+            return self._execute('EVAL', CAS_SCRIPT, *args) == 1
+
+    def delete(self, game_id: str) -> bool:
+        return self._execute('DEL', self._key(game_id)) == 1
+
+    def purge_expired(self) -> int:
+        """Expirarea este gestionată de server prin TTL-ul cheilor"""
+        return 0
+
+    def __len__(self) -> int:
+        """Numărul de chei din baza de date (se presupune una dedicată jocului)"""
+        return self._execute('DBSIZE')
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
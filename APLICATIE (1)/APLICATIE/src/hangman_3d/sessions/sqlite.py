@@ -0,0 +1,123 @@
+"""
+Backend de sesiuni într-un fișier SQLite (mod WAL), partajat între procese
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Tuple
+import logging
+
+from ..models import GameState
+from .base import SerializedSessionStore
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_sessions (
+    game_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS game_sessions_expires ON game_sessions (expires);
+"""
+
+
+class SQLiteSessionStore(SerializedSessionStore):
+    """
+    Jocuri stocate într-o bază SQLite comună tuturor worker-ilor
+
+    Fiecare fir are propria conexiune; modul WAL permite citiri concurente
+    cu un singur scriitor. Actualizările folosesc o coloană de versiune
+    pentru compare-and-set.
+    """
+
+    def __init__(self, path: str, max_sessions: int = 50000, ttl: float = 1800,
+                 clock: Callable[[], float] = time.time):
+        """
+        Inițializează backend-ul SQLite
+
+        Args:
+            path: Calea fișierului de bază de date
+            max_sessions: Numărul maxim de jocuri păstrate
+            ttl: Secunde de inactivitate după care un joc expiră
+            clock: Sursa de timp (ceas de perete, comun proceselor)
+        """
+        self.path = path
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._clock = clock
+        self._local = threading.local()
+        self._writes = 0
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Returnează conexiunea firului curent, creând-o la nevoie"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, game_id: str, game: GameState) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO game_sessions (game_id, version, expires, data) "
+            "VALUES (?, 0, ?, ?)",
+            (game_id, self._clock() + self.ttl, game.to_bytes())
+        )
+        self._writes += 1
+        if self._writes % 1024 == 0:
+            self.purge_expired()
+
+    def _load(self, game_id: str) -> Optional[Tuple[int, bytes]]:
+        row = self._conn().execute(
+            "SELECT version, data FROM game_sessions WHERE game_id = ? AND expires > ?",
+            (game_id, self._clock())
+        ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def _compare_and_set(self, game_id: str, version: int, data: bytes) -> bool:
+        cursor = self._conn().execute(
+            "UPDATE game_sessions SET data = ?, version = version + 1, expires = ? "
+            "WHERE game_id = ? AND version = ?",
+            (data, self._clock() + self.ttl, game_id, version)
+        )
+        return cursor.rowcount == 1
+
+    def delete(self, game_id: str) -> bool:
+        cursor = self._conn().execute(
+            "DELETE FROM game_sessions WHERE game_id = ?", (game_id,)
+        )
+        return cursor.rowcount == 1
+
+    def purge_expired(self) -> int:
+        """Elimină jocurile expirate și, peste capacitate, pe cele mai vechi"""
+        conn = self._conn()
+        removed = conn.execute(
+            "DELETE FROM game_sessions WHERE expires <= ?", (self._clock(),)
+        ).rowcount
+        excess = len(self) - self.max_sessions
+        if excess > 0:
+            removed += conn.execute(
+                "DELETE FROM game_sessions WHERE game_id IN "
+                "(SELECT game_id FROM game_sessions ORDER BY expires LIMIT ?)",
+                (excess,)
+            ).rowcount
+        if removed:
+            logger.info(f"Purged {removed} game sessions from {self.path}")
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM game_sessions").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
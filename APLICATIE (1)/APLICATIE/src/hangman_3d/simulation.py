@@ -0,0 +1,284 @@
+"""
+Simulare self-play: milioane de jocuri GameState jucate de strategii automate
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.simulation --games 1000000 --strategy frequency
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+from .csv_exporter import CSVExporter
+from .dictionary import ALPHABET, DIFFICULTIES, get_dictionary, load_dictionary
+from .models import GameState
+
+logger = logging.getLogger(__name__)
+
+# Ordinea literelor după frecvența în engleză
+FREQUENCY_ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+
+class RandomStrategy:
+    """Alege o literă neîncercată la întâmplare"""
+
+    name = "random"
+
+    def next_letter(self, game: GameState, rng: random.Random) -> str:
+        mask = game.guessed_mask
+        return rng.choice([letter for i, letter in enumerate(ALPHABET) if not mask >> i & 1])
+
+
+class FrequencyStrategy:
+    """Încearcă literele în ordinea frecvenței lor în limbă"""
+
+    name = "frequency"
+
+    def next_letter(self, game: GameState, rng: random.Random) -> str:
+        mask = game.guessed_mask
+        for letter in FREQUENCY_ORDER:
+            if not mask >> (ord(letter) - 65) & 1:
+                return letter
+        raise ValueError("Toate literele au fost încercate")
+
+
+class SolverStrategy:
+    """Folosește HangmanSolver pe dicționarul activ (adversarul AI)"""
+
+    name = "solver"
+
+    def __init__(self):
+        from .dictionary.solver import get_solver
+        self._solver = get_solver(get_dictionary())
+        self._fallback = FrequencyStrategy()
+
+    def next_letter(self, game: GameState, rng: random.Random) -> str:
+        hint = self._solver.suggest(game.get_display_word(), game.wrong_letters)
+        return hint.letter or self._fallback.next_letter(game, rng)
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "solver": SolverStrategy,
+}
+
+
+@dataclass
+class DifficultyStats:
+    """Statistici agregate pentru un nivel de dificultate"""
+    games: int = 0
+    wins: int = 0
+    guesses: Counter = field(default_factory=Counter)
+    wrong: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "DifficultyStats") -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.guesses.update(other.guesses)
+        self.wrong.update(other.wrong)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        total = sum(count * value for value, count in self.guesses.items())
+        return total / self.games if self.games else 0.0
+
+    @property
+    def mean_wrong(self) -> float:
+        total = sum(count * value for value, count in self.wrong.items())
+        return total / self.games if self.games else 0.0
+
+
+@dataclass
+class SimulationResult:
+    """Rezultatul unei simulări"""
+    strategy: str
+    games: int
+    seconds: float
+    stats: Dict[str, DifficultyStats]
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def play_game(difficulty: str, strategy, rng: random.Random) -> Tuple[bool, int, int]:
+    """
+    Joacă un joc complet
+
+    Returns:
+        (câștigat, număr de ghiciri, număr de greșeli)
+    """
+    # Cuvântul se alege din rng-ul simulării, pentru rezultate reproductibile
+    game = GameState(difficulty, word_id=get_dictionary().random_id(difficulty, rng))
+    guesses = 0
+    while not game.game_over:
+        game.guess_letter(strategy.next_letter(game, rng))
+        guesses += 1
+    return game.won, guesses, game.wrong_guesses
+
+
+def _init_worker(dictionary_path: Optional[str]) -> None:
+    """Inițializarea unui proces worker"""
+    if dictionary_path:
+        load_dictionary(dictionary_path)
+
+
+def _simulate_chunk(task: Tuple[str, Sequence[str], int, int, int]) -> Dict[str, DifficultyStats]:
+    """Joacă un lot de jocuri și returnează doar statisticile agregate"""
+    strategy_name, difficulties, first, games, seed = task
+    strategy = STRATEGIES[strategy_name]()
+    rng = random.Random(seed)
+    stats = {difficulty: DifficultyStats() for difficulty in difficulties}
+    for index in range(first, first + games):
+        difficulty = difficulties[index % len(difficulties)]
+        won, guesses, wrong = play_game(difficulty, strategy, rng)
+        bucket = stats[difficulty]
+        bucket.games += 1
+        bucket.wins += won
+        bucket.guesses[guesses] += 1
+        bucket.wrong[wrong] += 1
+    return stats
+
+
+def run_simulation(games: int, strategy: str = "frequency",
+                   difficulties: Sequence[str] = DIFFICULTIES,
+                   workers: Optional[int] = None, chunk_size: int = 5000,
+                   seed: int = 0, dictionary_path: Optional[str] = None) -> SimulationResult:
+    """
+    Rulează simularea distribuită pe un pool de procese
+
+    Args:
+        games: Numărul total de jocuri
+        strategy: Numele strategiei (random, frequency, solver)
+        difficulties: Nivelurile jucate, în proporții egale
+        workers: Numărul de procese (implicit numărul de nuclee; 1 = în proces)
+        chunk_size: Jocuri per lot trimis unui worker
+        seed: Sămânța pentru reproductibilitate
+        dictionary_path: Fișier de dicționar încărcat de fiecare worker
+
+    Returns:
+        SimulationResult cu throughput-ul și statisticile pe niveluri
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Strategie necunoscută: {strategy}")
+
+    tasks = [
+        (strategy, tuple(difficulties), first, min(chunk_size, games - first), seed + n)
+        for n, first in enumerate(range(0, games, chunk_size))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"Simulating {games} games ({strategy}) in {len(tasks)} chunks on {workers} workers")
+
+    totals = {difficulty: DifficultyStats() for difficulty in difficulties}
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(dictionary_path)
+        partials = map(_simulate_chunk, tasks)
+        for partial in partials:
+            for difficulty, stats in partial.items():
+                totals[difficulty].merge(stats)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(dictionary_path,)) as pool:
+            for partial in pool.map(_simulate_chunk, tasks):
+                for difficulty, stats in partial.items():
+                    totals[difficulty].merge(stats)
+    seconds = time.perf_counter() - start
+
+    result = SimulationResult(strategy, games, seconds, totals)
+    logger.info(f"Simulation finished: {result.games_per_second:.0f} games/s")
+    return result
+
+
+def export_results(result: SimulationResult, exporter: CSVExporter,
+                   prefix: str = "simulation") -> List[str]:
+    """
+    Exportă rezumatul și distribuțiile (ghiciri și greșeli per joc) în CSV
+
+    Returns:
+        Căile fișierelor scrise
+    """
+    summary = [
+        {
+            "strategy": result.strategy,
+            "difficulty": difficulty,
+            "games": stats.games,
+            "wins": stats.wins,
+            "win_rate": round(stats.win_rate, 4),
+            "mean_guesses": round(stats.mean_guesses, 3),
+            "mean_wrong": round(stats.mean_wrong, 3),
+            "games_per_second": round(result.games_per_second, 1),
+        }
+        for difficulty, stats in result.stats.items()
+    ]
+    distribution = [
+        {
+            "strategy": result.strategy,
+            "difficulty": difficulty,
+            "guesses": guesses,
+            "games": count,
+        }
+        for difficulty, stats in result.stats.items()
+        for guesses, count in sorted(stats.guesses.items())
+    ]
+    wrong_distribution = [
+        {
+            "strategy": result.strategy,
+            "difficulty": difficulty,
+            "wrong": wrong,
+            "games": count,
+        }
+        for difficulty, stats in result.stats.items()
+        for wrong, count in sorted(stats.wrong.items())
+    ]
+    return [
+        exporter.export_data(summary, f"{prefix}_summary"),
+        exporter.export_data(distribution, f"{prefix}_guess_distribution"),
+        exporter.export_data(wrong_distribution, f"{prefix}_wrong_distribution"),
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI"""
+    parser = argparse.ArgumentParser(description="Simulare self-play Hangman")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dictionary", help="Fișier de dicționar (implicit lista WORDS)")
+    parser.add_argument("--output-dir", default="output")
+    args = parser.parse_args(argv)
+
+    if args.dictionary:
+        load_dictionary(args.dictionary)
+
+    result = run_simulation(args.games, args.strategy, workers=args.workers,
+                            chunk_size=args.chunk_size, seed=args.seed,
+                            dictionary_path=args.dictionary)
+
+    print(f"{result.games} games in {result.seconds:.2f}s "
+          f"({result.games_per_second:.0f} games/s, strategy={result.strategy})")
+    for difficulty, stats in result.stats.items():
+        print(f"  {difficulty:<7} win_rate={stats.win_rate:.3f} mean_guesses={stats.mean_guesses:.2f} "
+              f"mean_wrong={stats.mean_wrong:.2f}")
+    for path in export_results(result, CSVExporter(args.output_dir)):
+        print(f"  -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
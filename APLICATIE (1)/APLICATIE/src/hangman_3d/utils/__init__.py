@@ -2,6 +2,7 @@
 Utilitare și helper functions
 """
 
-from .words import WORDS
+from .words import WORDS, DIFFICULTIES
+from .stats import percentile
 
-__all__ = ["WORDS"]
+__all__ = ["WORDS", "DIFFICULTIES", "percentile"]
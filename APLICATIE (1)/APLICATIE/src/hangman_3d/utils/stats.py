@@ -0,0 +1,13 @@
+"""
+Statistici simple pentru măsurătorile de latență
+"""
+
+import math
+from typing import Sequence
+
+
+def percentile(ordered: Sequence[float], p: float) -> float:
+    """Percentila p a unei liste sortate (rang cel mai apropiat)"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
@@ -28,3 +28,7 @@ WORDS = {
         "CONSTITUTIONAL", "INTERDISCIPLINARY", "INTERNATIONALLY", "CHARACTERIZATION"
     ]
 }
+
+
+# Ordinea fixă a nivelurilor (folosită de dicționar și la serializare)
+DIFFICULTIES = tuple(WORDS)
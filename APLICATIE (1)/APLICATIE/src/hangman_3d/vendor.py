@@ -0,0 +1,149 @@
+"""
+Include Three.js în static/vendor/, redus la clasele folosite de scenă
+
+Pachetul npm three (r128) este descărcat o singură dată (sau luat dintr-un
+fișier .tgz copiat manual, pentru mașinile fără internet). Dacă esbuild
+este disponibil, se construiește un bundle IIFE care expune global `THREE`
+doar cu clasele din THREE_EXPORTS; altfel se copiază three.min.js complet.
+Pasul de build (assets.py) îl amprentează apoi ca pe orice asset.
+
+Utilizare din linia de comandă:
+    python -m src.hangman_3d.vendor [--package three-0.128.0.tgz] [static_folder]
+"""
+
+import argparse
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import urllib.request
+from typing import Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+THREE_VERSION = "0.128.0"  # r128, versiunea folosită de scenă
+THREE_PACKAGE_URL = f"https://registry.npmjs.org/three/-/three-{THREE_VERSION}.tgz"
+
+# Calea logică a bundle-ului, relativă la folderul static
+THREE_ASSET = "vendor/three.min.js"
+
+# Clasele folosite de static/js/game.js
+THREE_EXPORTS = (
+    "Scene",
+    "PerspectiveCamera",
+    "WebGLRenderer",
+    "Mesh",
+    "CylinderGeometry",
+    "SphereGeometry",
+    "MeshLambertMaterial",
+    "AmbientLight",
+    "DirectionalLight",
+)
+
+
+def entry_module(module_path: str = "./package/build/three.module.js") -> str:
+    """Modulul de intrare care reexportă doar clasele necesare"""
+    return f"export {{ {', '.join(THREE_EXPORTS)} }} from {module_path!r};\n"
+
+
+def read_package(source: Optional[str] = None, timeout: float = 30.0) -> bytes:
+    """
+    Conținutul arhivei npm three
+
+    Args:
+        source: Fișier .tgz local; implicit se descarcă din registry
+    """
+    if source:
+        with open(source, "rb") as f:
+            return f.read()
+    logger.info(f"Downloading {THREE_PACKAGE_URL}")
+    with urllib.request.urlopen(THREE_PACKAGE_URL, timeout=timeout) as response:
+        return response.read()
+
+
+def _esbuild() -> Optional[Sequence[str]]:
+    """Comanda esbuild, dacă este instalat"""
+    path = shutil.which("esbuild")
+    return [path] if path else None
+
+
+def _extract(archive: tarfile.TarFile, workdir: str) -> None:
+    """
+    Dezarhivează pachetul în workdir, fără a putea scrie în afara lui
+
+    Filtrul "data" al tarfile există doar de la Python 3.11.4; pe versiunile
+    mai vechi se păstrează doar fișierele și directoarele cu căi relative
+    din interiorul workdir.
+    """
+    if hasattr(tarfile, "data_filter"):
+        archive.extractall(workdir, filter="data")
+        return
+    root = os.path.realpath(workdir)
+    members = []
+    for member in archive.getmembers():
+        target = os.path.realpath(os.path.join(root, member.name))
+        if os.path.isabs(member.name) or os.path.commonpath([root, target]) != root:
+            raise ValueError(f"Cale nepermisă în arhivă: {member.name}")
+        if member.isfile() or member.isdir():
+            members.append(member)
+        else:
+            logger.warning(f"Skipping non-regular archive member {member.name}")
+    archive.extractall(workdir, members=members)
+
+
+def build_three(package: bytes, output: str) -> bool:
+    """
+    Scrie bundle-ul Three.js
+
+    Args:
+        package: Arhiva .tgz a pachetului npm
+        output: Fișierul rezultat (static/vendor/three.min.js)
+
+    Returns:
+        True dacă bundle-ul a fost redus la THREE_EXPORTS, False dacă s-a
+        copiat build-ul complet (esbuild indisponibil)
+    """
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with tempfile.TemporaryDirectory() as workdir:
+        with tarfile.open(fileobj=io.BytesIO(package), mode="r:gz") as archive:
+            _extract(archive, workdir)
+
+        esbuild = _esbuild()
+        if esbuild:
+            entry = os.path.join(workdir, "entry.js")
+            with open(entry, "w", encoding="utf-8") as f:
+                f.write(entry_module())
+            subprocess.run([
+                *esbuild, entry, "--bundle", "--minify", "--format=iife",
+                "--global-name=THREE", "--legal-comments=inline", f"--outfile={output}",
+            ], check=True, cwd=workdir)
+            logger.info(f"Wrote trimmed Three.js bundle ({len(THREE_EXPORTS)} exports) to {output}")
+            return True
+
+        logger.warning("esbuild not found: vendoring the full three.min.js build")
+        shutil.copyfile(os.path.join(workdir, "package", "build", "three.min.js"), output)
+        return False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punct de intrare CLI"""
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "static")
+    parser = argparse.ArgumentParser(description="Include Three.js în folderul static")
+    parser.add_argument("static_folder", nargs="?", default=os.path.normpath(default))
+    parser.add_argument("--package", help=f"Arhiva three-{THREE_VERSION}.tgz, pentru instalări offline")
+    args = parser.parse_args(argv)
+
+    output = os.path.join(args.static_folder, *THREE_ASSET.split("/"))
+    trimmed = build_three(read_package(args.package), output)
+    kind = "redus" if trimmed else "complet (instalați esbuild pentru reducere)"
+    print(f"{output}: {os.path.getsize(output)} octeți, {kind}")
+    print("Rulați pasul de build al asset-urilor pentru amprentare")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
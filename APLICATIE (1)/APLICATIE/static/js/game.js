@@ -0,0 +1,658 @@
+let currentDifficulty = 'mediu';
+let gameStarted = false;
+let timer;
+let timeLeft = 300;
+let scene, camera, renderer;
+let hangmanParts = [];
+let wrongGuesses = 0;
+let musicPlaying = false;
+
+// Inițializare Three.js
+function initThreeJS() {
+    const canvas = document.getElementById('hangman-canvas');
+    const container = canvas.parentElement;
+
+    scene = new THREE.Scene();
+    camera = new THREE.PerspectiveCamera(75, container.offsetWidth / container.offsetHeight, 0.1, 1000);
+    renderer = new THREE.WebGLRenderer({ canvas: canvas, alpha: true });
+    renderer.setSize(container.offsetWidth, container.offsetHeight);
+    renderer.setClearColor(0x000000, 0);
+
+    // Lumină
+    const light = new THREE.DirectionalLight(0xffffff, 1);
+    light.position.set(5, 5, 5);
+    scene.add(light);
+
+    const ambientLight = new THREE.AmbientLight(0x404040, 0.5);
+    scene.add(ambientLight);
+
+    // Spânzurătoarea de bază
+    const poleGeometry = new THREE.CylinderGeometry(0.1, 0.1, 5, 8);
+    const poleMaterial = new THREE.MeshLambertMaterial({ color: 0x8B4513 });
+    const pole = new THREE.Mesh(poleGeometry, poleMaterial);
+    pole.position.set(0, 0, 0);
+    scene.add(pole);
+
+    const topBeamGeometry = new THREE.CylinderGeometry(0.05, 0.05, 3, 8);
+    const topBeam = new THREE.Mesh(topBeamGeometry, poleMaterial);
+    topBeam.rotation.z = Math.PI / 2;
+    topBeam.position.set(1.5, 2.5, 0);
+    scene.add(topBeam);
+
+    const nooseGeometry = new THREE.CylinderGeometry(0.02, 0.02, 1, 8);
+    const noose = new THREE.Mesh(nooseGeometry, poleMaterial);
+    noose.position.set(3, 1.5, 0);
+    scene.add(noose);
+
+    camera.position.set(5, 2, 5);
+    camera.lookAt(2, 1, 0);
+
+    // Animație de rotație
+    function animate() {
+        requestAnimationFrame(animate);
+        camera.position.x = Math.cos(Date.now() * 0.001) * 6;
+        camera.position.z = Math.sin(Date.now() * 0.001) * 6;
+        camera.lookAt(2, 1, 0);
+        renderer.render(scene, camera);
+    }
+    animate();
+}
+
+// Adaugă părți ale omului spânzurat
+function addHangmanPart(partNumber) {
+    const material = new THREE.MeshLambertMaterial({ color: 0xFFDAB9 });
+    let part;
+
+    switch(partNumber) {
+        case 1: // Cap
+            const headGeometry = new THREE.SphereGeometry(0.3, 16, 16);
+            part = new THREE.Mesh(headGeometry, material);
+            part.position.set(3, 1, 0);
+            break;
+        case 2: // Trup
+            const bodyGeometry = new THREE.CylinderGeometry(0.2, 0.2, 1, 8);
+            part = new THREE.Mesh(bodyGeometry, material);
+            part.position.set(3, 0.2, 0);
+            break;
+        case 3: // Braț stâng
+            const leftArmGeometry = new THREE.CylinderGeometry(0.05, 0.05, 0.8, 8);
+            part = new THREE.Mesh(leftArmGeometry, material);
+            part.rotation.z = Math.PI / 4;
+            part.position.set(2.6, 0.4, 0);
+            break;
+        case 4: // Braț drept
+            const rightArmGeometry = new THREE.CylinderGeometry(0.05, 0.05, 0.8, 8);
+            part = new THREE.Mesh(rightArmGeometry, material);
+            part.rotation.z = -Math.PI / 4;
+            part.position.set(3.4, 0.4, 0);
+            break;
+        case 5: // Picior stâng
+            const leftLegGeometry = new THREE.CylinderGeometry(0.05, 0.05, 0.8, 8);
+            part = new THREE.Mesh(leftLegGeometry, material);
+            part.rotation.z = Math.PI / 6;
+            part.position.set(2.8, -0.6, 0);
+            break;
+        case 6: // Picior drept
+            const rightLegGeometry = new THREE.CylinderGeometry(0.05, 0.05, 0.8, 8);
+            part = new THREE.Mesh(rightLegGeometry, material);
+            part.rotation.z = -Math.PI / 6;
+            part.position.set(3.2, -0.6, 0);
+            break;
+    }
+
+    if (part) {
+        scene.add(part);
+        hangmanParts.push(part);
+
+        // Animație de apariție
+        part.scale.set(0, 0, 0);
+        const startTime = Date.now();
+        function scaleUp() {
+            const elapsed = Date.now() - startTime;
+            const progress = Math.min(elapsed / 500, 1);
+            const scale = progress * 1;
+            part.scale.set(scale, scale, scale);
+
+            if (progress < 1) {
+                requestAnimationFrame(scaleUp);
+            }
+        }
+        scaleUp();
+    }
+}
+
+// Toggle muzică
+function toggleMusic() {
+    const btn = document.querySelector('.music-btn');
+    if (musicPlaying) {
+        musicPlaying = false;
+        btn.textContent = '🔇';
+    } else {
+        playAdventureMusic();
+        musicPlaying = true;
+        btn.textContent = '🎵';
+    }
+}
+
+// Create adventure music using Web Audio API
+function playAdventureMusic() {
+    try {
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        function createTone(frequency, duration, time, volume = 0.05) {
+            const oscillator = audioContext.createOscillator();
+            const gainNode = audioContext.createGain();
+
+            oscillator.connect(gainNode);
+            gainNode.connect(audioContext.destination);
+
+            oscillator.frequency.setValueAtTime(frequency, time);
+            oscillator.type = 'sine';
+            gainNode.gain.setValueAtTime(0, time);
+            gainNode.gain.linearRampToValueAtTime(volume, time + 0.01);
+            gainNode.gain.exponentialRampToValueAtTime(0.01, time + duration);
+
+            oscillator.start(time);
+            oscillator.stop(time + duration);
+        }
+
+        // Adventure melody - mysterious and epic
+        const melody = [
+            {freq: 220, dur: 0.5}, // A3
+            {freq: 246.94, dur: 0.5}, // B3
+            {freq: 277.18, dur: 0.5}, // C#4
+            {freq: 329.63, dur: 0.5}, // E4
+            {freq: 277.18, dur: 0.5}, // C#4
+            {freq: 246.94, dur: 0.5}, // B3
+            {freq: 220, dur: 1}, // A3
+            {freq: 293.66, dur: 0.5}, // D4
+            {freq: 329.63, dur: 0.5}, // E4
+            {freq: 369.99, dur: 0.5}, // F#4
+            {freq: 415.30, dur: 1}, // G#4
+        ];
+
+        let time = audioContext.currentTime;
+        melody.forEach(note => {
+            createTone(note.freq, note.dur, time, 0.03);
+            time += note.dur;
+        });
+
+        // Loop the melody
+        setTimeout(() => {
+            if (musicPlaying) playAdventureMusic();
+        }, time * 1000 - audioContext.currentTime * 1000 + 500);
+    } catch(e) {
+        console.log('Audio not supported');
+    }
+}
+
+// Victory music
+function playVictoryMusic() {
+    try {
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        function createTone(frequency, duration, time, volume = 0.1) {
+            const oscillator = audioContext.createOscillator();
+            const gainNode = audioContext.createGain();
+
+            oscillator.connect(gainNode);
+            gainNode.connect(audioContext.destination);
+
+            oscillator.frequency.setValueAtTime(frequency, time);
+            oscillator.type = 'sine';
+            gainNode.gain.setValueAtTime(0, time);
+            gainNode.gain.linearRampToValueAtTime(volume, time + 0.01);
+            gainNode.gain.exponentialRampToValueAtTime(0.01, time + duration);
+
+            oscillator.start(time);
+            oscillator.stop(time + duration);
+        }
+
+        // Victory fanfare
+        const victoryMelody = [
+            {freq: 523.25, dur: 0.3}, // C5
+            {freq: 659.25, dur: 0.3}, // E5
+            {freq: 783.99, dur: 0.3}, // G5
+            {freq: 1046.50, dur: 0.6}, // C6
+            {freq: 783.99, dur: 0.3}, // G5
+            {freq: 1046.50, dur: 0.9}, // C6
+        ];
+
+        let time = audioContext.currentTime;
+        victoryMelody.forEach(note => {
+            createTone(note.freq, note.dur, time, 0.08);
+            time += note.dur;
+        });
+    } catch(e) {
+        console.log('Audio not supported');
+    }
+}
+
+// Keyboard click sound
+function playKeySound() {
+    try {
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        const oscillator = audioContext.createOscillator();
+        const gainNode = audioContext.createGain();
+
+        oscillator.connect(gainNode);
+        gainNode.connect(audioContext.destination);
+
+        oscillator.frequency.setValueAtTime(800, audioContext.currentTime);
+        oscillator.frequency.exponentialRampToValueAtTime(600, audioContext.currentTime + 0.1);
+        oscillator.type = 'square';
+
+        gainNode.gain.setValueAtTime(0, audioContext.currentTime);
+        gainNode.gain.linearRampToValueAtTime(0.05, audioContext.currentTime + 0.01);
+        gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.1);
+
+        oscillator.start(audioContext.currentTime);
+        oscillator.stop(audioContext.currentTime + 0.1);
+    } catch(e) {
+        console.log('Audio not supported');
+    }
+}
+
+// Game over explosion sound
+function playExplosionSound() {
+    try {
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        // Create noise for explosion effect
+        const bufferSize = audioContext.sampleRate * 0.5;
+        const buffer = audioContext.createBuffer(1, bufferSize, audioContext.sampleRate);
+        const output = buffer.getChannelData(0);
+
+        for (let i = 0; i < bufferSize; i++) {
+            output[i] = Math.random() * 2 - 1;
+        }
+
+        const whiteNoise = audioContext.createBufferSource();
+        const gainNode = audioContext.createGain();
+        const filter = audioContext.createBiquadFilter();
+
+        whiteNoise.buffer = buffer;
+        whiteNoise.connect(filter);
+        filter.connect(gainNode);
+        gainNode.connect(audioContext.destination);
+
+        filter.type = 'lowpass';
+        filter.frequency.setValueAtTime(100, audioContext.currentTime);
+        filter.frequency.exponentialRampToValueAtTime(2000, audioContext.currentTime + 0.1);
+        filter.frequency.exponentialRampToValueAtTime(50, audioContext.currentTime + 0.5);
+
+        gainNode.gain.setValueAtTime(0.2, audioContext.currentTime);
+        gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.5);
+
+        whiteNoise.start(audioContext.currentTime);
+        whiteNoise.stop(audioContext.currentTime + 0.5);
+    } catch(e) {
+        console.log('Audio not supported');
+    }
+}
+
+// Create sparkles effect
+function createSparkles() {
+    const sparklesContainer = document.getElementById('sparkles');
+    sparklesContainer.style.display = 'block';
+    sparklesContainer.innerHTML = '';
+
+    for (let i = 0; i < 50; i++) {
+        const sparkle = document.createElement('div');
+        sparkle.className = 'sparkle';
+        sparkle.style.left = Math.random() * 100 + '%';
+        sparkle.style.animationDelay = Math.random() * 2 + 's';
+        sparkle.style.animationDuration = (2 + Math.random() * 2) + 's';
+        sparklesContainer.appendChild(sparkle);
+    }
+
+    setTimeout(() => {
+        sparklesContainer.style.display = 'none';
+    }, 4000);
+}
+
+// Selectare dificultate
+document.querySelectorAll('.difficulty-btn').forEach(btn => {
+    btn.addEventListener('click', () => {
+        document.querySelectorAll('.difficulty-btn').forEach(b => b.classList.remove('active'));
+        btn.classList.add('active');
+        currentDifficulty = btn.dataset.difficulty;
+    });
+});
+
+// Creare alfabet
+function createAlphabet() {
+    const alphabet = document.getElementById('alphabet');
+    alphabet.innerHTML = '';
+    for (let i = 65; i <= 90; i++) {
+        const letter = String.fromCharCode(i);
+        const btn = document.createElement('button');
+        btn.className = 'letter-btn';
+        btn.textContent = letter;
+        btn.onclick = () => guessLetter(letter);
+        alphabet.appendChild(btn);
+    }
+}
+
+// Pornire joc
+async function startGame() {
+    try {
+        const response = await fetch('/start_game', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ difficulty: currentDifficulty })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            document.getElementById('gameSetup').style.display = 'none';
+            document.getElementById('gameArea').style.display = 'grid';
+
+            timeLeft = data.time_left;
+            document.getElementById('currentDifficulty').textContent = data.difficulty.toUpperCase();
+            document.getElementById('wordDisplay').textContent = '_ '.repeat(data.word_length).trim();
+            document.getElementById('wrongCount').textContent = '0';
+
+            createAlphabet();
+            startTimer();
+            gameStarted = true;
+            wrongGuesses = 0;
+            openGameChannel(data.game_id);
+
+            // Auto-start adventure music
+            if (!musicPlaying) {
+                toggleMusic();
+            }
+
+            // Reset 3D scene
+            hangmanParts.forEach(part => scene.remove(part));
+            hangmanParts = [];
+
+            if (!scene) {
+                initThreeJS();
+            }
+        }
+    } catch(error) {
+        console.error('Error starting game:', error);
+    }
+}
+
+// Timer
+// Serverul păstrează termenul limită; clientul doar afișează local
+// și se resincronizează rar (și din răspunsurile la ghiciri).
+const TIMER_SYNC_SECONDS = 30;
+let timerDeadline = 0;
+let timerTicks = 0;
+
+function syncTimer(serverTimeLeft) {
+    if (typeof serverTimeLeft === 'number') {
+        timerDeadline = Date.now() + serverTimeLeft * 1000;
+    }
+}
+
+async function pollTimeStatus() {
+    try {
+        const response = await fetch('/update_time');
+        const data = await response.json();
+        if (data.time_up) {
+            clearInterval(timer);
+            if (gameStarted) {
+                endGame(false, `Timpul a expirat! Cuvântul era: ${data.word}`);
+            }
+        } else {
+            syncTimer(data.time_left);
+        }
+    } catch(err) {
+        console.log('Timer sync error:', err);
+    }
+}
+
+function startTimer() {
+    if (timer) clearInterval(timer);
+    syncTimer(timeLeft);
+    timerTicks = 0;
+    timer = setInterval(() => {
+        timeLeft = Math.max(0, Math.ceil((timerDeadline - Date.now()) / 1000));
+        const minutes = Math.floor(timeLeft / 60);
+        const seconds = timeLeft % 60;
+        const timerEl = document.getElementById('timer');
+        timerEl.textContent = `${minutes}:${seconds.toString().padStart(2, '0')}`;
+
+        if (timeLeft <= 30) {
+            timerEl.classList.add('warning');
+        }
+
+        if (gameSocket || gameEvents) {
+            // Expirarea și resincronizarea sunt împinse pe canal
+        } else if (timeLeft <= 0) {
+            // Serverul confirmă expirarea și trimite cuvântul
+            pollTimeStatus();
+        } else if (++timerTicks % TIMER_SYNC_SECONDS === 0) {
+            pollTimeStatus();
+        }
+    }, 1000);
+}
+
+// Canal persistent per joc: WebSocket, apoi SSE; fără canal
+// (de ex. serverul de dezvoltare Flask) se folosesc cererile HTTP
+let gameSocket = null;
+let gameEvents = null;
+let channelState = {};
+
+function closeGameChannel() {
+    if (gameSocket) {
+        gameSocket.onclose = null;
+        gameSocket.close();
+        gameSocket = null;
+    }
+    if (gameEvents) {
+        gameEvents.close();
+        gameEvents = null;
+    }
+}
+
+function openGameChannel(gameId) {
+    closeGameChannel();
+    channelState = {};
+    if (!('WebSocket' in window)) {
+        openEventStream(gameId);
+        return;
+    }
+    const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const socket = new WebSocket(`${protocol}//${location.host}/ws?game_id=${encodeURIComponent(gameId)}`);
+    let opened = false;
+    socket.onopen = () => {
+        opened = true;
+        gameSocket = socket;
+    };
+    socket.onmessage = (event) => handleChannelFrame(JSON.parse(event.data));
+    socket.onclose = () => {
+        if (gameSocket === socket) gameSocket = null;
+        if (!opened && gameStarted) openEventStream(gameId);
+    };
+}
+
+function openEventStream(gameId) {
+    if (!('EventSource' in window)) return;
+    const source = new EventSource(`/events?game_id=${encodeURIComponent(gameId)}`);
+    source.onmessage = (event) => handleChannelFrame(JSON.parse(event.data));
+    source.onerror = () => {
+        // Fluxul se închide la sfârșitul jocului; nu se reconectează
+        source.close();
+        if (gameEvents === source) gameEvents = null;
+    };
+    gameEvents = source;
+}
+
+// Cadrele conțin doar câmpurile modificate; channelState le cumulează
+function handleChannelFrame(frame) {
+    Object.assign(channelState, frame);
+    syncTimer(frame.time_left);
+
+    if (frame.type === 'guess' && gameSocket) {
+        applyGuess(frame.letter, channelState);
+    } else if (frame.type === 'time_up') {
+        clearInterval(timer);
+        if (gameStarted) {
+            endGame(false, `Timpul a expirat! Cuvântul era: ${frame.word}`);
+        }
+    } else if (frame.type === 'game_over') {
+        clearInterval(timer);
+        if (gameStarted) {
+            endGame(frame.won, frame.won
+                ? 'Felicitări! Ai câștigat!'
+                : `Ai pierdut! Cuvântul era: ${frame.word}`);
+        }
+    }
+}
+
+// Ghicire literă
+async function guessLetter(letter) {
+    if (!gameStarted) return;
+
+    // Play keyboard sound
+    playKeySound();
+
+    if (gameSocket && gameSocket.readyState === WebSocket.OPEN) {
+        // Rezultatul sosește ca un cadru pe canal
+        gameSocket.send(JSON.stringify({ type: 'guess', letter: letter }));
+        return;
+    }
+
+    try {
+        const response = await fetch('/guess', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ letter: letter })
+        });
+
+        const data = await response.json();
+
+        if (data.time_up) {
+            clearInterval(timer);
+            endGame(false, `Timpul a expirat! Cuvântul era: ${data.word}`);
+            return;
+        }
+
+        if (data.error) {
+            return;
+        }
+
+        syncTimer(data.time_left);
+        applyGuess(letter, data);
+
+        if (data.game_over) {
+            clearInterval(timer);
+            if (data.won) {
+                endGame(true, 'Felicitări! Ai câștigat!');
+            } else {
+                endGame(false, `Ai pierdut! Cuvântul era: ${data.word}`);
+            }
+        }
+    } catch(error) {
+        console.error('Error guessing letter:', error);
+    }
+}
+
+// Actualizează tastatura, cuvântul și spânzurătoarea după o ghicire
+function applyGuess(letter, data) {
+    // Find the button with matching letter
+    const allBtns = document.querySelectorAll('.letter-btn');
+    let targetBtn = null;
+
+    allBtns.forEach(button => {
+        if (button.textContent === letter && !button.disabled) {
+            targetBtn = button;
+        }
+    });
+
+    if (targetBtn) {
+        targetBtn.disabled = true;
+
+        if (data.correct) {
+            targetBtn.classList.add('correct');
+            document.getElementById('wordDisplay').textContent = data.displayed_word.split('').join(' ');
+        } else {
+            targetBtn.classList.add('incorrect');
+            wrongGuesses = data.wrong_guesses;
+            document.getElementById('wrongCount').textContent = wrongGuesses;
+            addHangmanPart(wrongGuesses);
+        }
+    }
+}
+
+// Sfârșitul jocului
+function endGame(won, message) {
+    gameStarted = false;
+
+    if (!won) {
+        // Explosion effects
+        playExplosionSound();
+        document.getElementById('fireOverlay').style.display = 'block';
+
+        // Shake screen effect
+        document.body.style.animation = 'shake 0.5s ease-in-out 3';
+
+        setTimeout(() => {
+            document.getElementById('fireOverlay').style.display = 'none';
+            document.body.style.animation = '';
+        }, 3000);
+    } else {
+        // Victory effects
+        playVictoryMusic();
+        document.getElementById('victoryOverlay').style.display = 'block';
+        createSparkles();
+
+        setTimeout(() => {
+            document.getElementById('victoryOverlay').style.display = 'none';
+        }, 4000);
+    }
+
+    const title = won ? '🎉 VICTORIE GLORIOASĂ!' : '💀 EXPLOZIE! Ai murit!';
+    document.getElementById('gameOverTitle').textContent = title;
+    document.getElementById('gameOverMessage').textContent = message;
+    document.getElementById('gameOver').style.display = 'flex';
+}
+
+// Reset joc
+function resetGame() {
+    document.getElementById('gameOver').style.display = 'none';
+    document.getElementById('gameArea').style.display = 'none';
+    document.getElementById('gameSetup').style.display = 'block';
+    document.getElementById('timer').classList.remove('warning');
+
+    if (timer) {
+        clearInterval(timer);
+    }
+    closeGameChannel();
+
+    gameStarted = false;
+}
+
+// Controlul tastaturii
+document.addEventListener('keydown', (e) => {
+    if (gameStarted && e.key.match(/[a-zA-Z]/) && e.key.length === 1) {
+        guessLetter(e.key.toUpperCase());
+    }
+});
+
+// Inițializare la încărcarea paginii
+window.addEventListener('load', () => {
+    createAlphabet();
+});
+
+// Responsive
+window.addEventListener('resize', () => {
+    if (renderer) {
+        const container = document.getElementById('hangman-canvas').parentElement;
+        camera.aspect = container.offsetWidth / container.offsetHeight;
+        camera.updateProjectionMatrix();
+        renderer.setSize(container.offsetWidth, container.offsetHeight);
+    }
+});
@@ -0,0 +1,182 @@
+"""
+Server HTTP local compatibil jsonplaceholder, folosit în teste și benchmark-uri
+
+Servește /posts, /users, /comments și /posts/<id>/comments din date
+generate, cu filtrele și parametrii json-server folosiți de APIClient
+(_limit, _page, postId repetat). Răspunsurile au ETag și Last-Modified și
+se revalidează cu If-None-Match / If-Modified-Since (304). Conexiunile sunt
+keep-alive (HTTP/1.1), iar serverul numără cererile și conexiunile primite.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+def make_dataset(posts=100, users=10, comments_per_post=5):
+    """Date deterministe în forma jsonplaceholder"""
+    return {
+        "posts": [
+            {"userId": i % users + 1, "id": i + 1, "title": f"post {i + 1}", "body": "x" * 40}
+            for i in range(posts)
+        ],
+        "users": [
+            {"id": i + 1, "name": f"user {i + 1}", "address": {"city": f"city {i % 3}"}}
+            for i in range(users)
+        ],
+        "comments": [
+            {"postId": post + 1, "id": post * comments_per_post + n + 1,
+             "email": f"c{n}@example.com", "body": "y" * 20}
+            for post in range(posts) for n in range(comments_per_post)
+        ],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Răspunde din setul de date al serverului"""
+
+    protocol_version = "HTTP/1.1"
+    # Antetele și corpul pleacă în scrieri separate; fără asta, Nagle și
+    # ACK-ul întârziat adaugă ~40 ms fiecărei cereri keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.paths.append(self.path)
+            failing = server.fail_next > 0
+            if failing:
+                server.fail_next -= 1
+        delay = server.delay(self.path) if callable(server.delay) else server.delay
+        if delay:
+            time.sleep(delay)
+        if failing:
+            return self._send(server.fail_status, {"error": "injected"})
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split("/") if part]
+        if len(parts) == 3 and parts[0] == "posts" and parts[2] == "comments":
+            records = [c for c in server.data["comments"] if str(c["postId"]) == parts[1]]
+        elif len(parts) == 1 and parts[0] in server.data:
+            records = server.data[parts[0]]
+        else:
+            return self._send(404, {})
+
+        for field, values in query.items():
+            if len(values) > 1 and not server.multi_filter:
+                return self._send(400, {"error": "repeated filter"})
+            if server.multi_filter == "first":
+                values = values[:1]
+            elif server.multi_filter == "last":
+                values = values[-1:]
+            if not field.startswith("_"):
+                records = [r for r in records if str(r.get(field)) in values]
+        headers = {}
+        if "_cursor" in query:
+            after = int(query["_cursor"][0])
+            records = [r for r in records if r["id"] > after]
+        if "_limit" in query:
+            limit = int(query["_limit"][0])
+            page = int(query.get("_page", ["1"])[0])
+            if "_page" in query and server.paging in ("page", None):
+                records = records[(page - 1) * limit:page * limit + 1]
+            more = len(records) > limit
+            records = records[:limit]
+            if more and server.paging == "page" and "_page" in query:
+                headers["Link"] = self._link(url.path, {"_page": page + 1, "_limit": limit})
+            elif more and server.paging == "cursor":
+                headers["Link"] = self._link(url.path, {"_cursor": records[-1]["id"], "_limit": limit})
+        self._send(200, records, headers)
+
+    def _link(self, path, params):
+        return f'<{self.server.url}{path}?{urlencode(params)}>; rel="next"'
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        server = self.server
+        if status == 200 and server.validators:
+            headers = dict(headers or {})
+            headers["ETag"] = etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            headers["Last-Modified"] = server.last_modified
+            if server.cache_control:
+                headers["Cache-Control"] = server.cache_control
+            if etag == self.headers.get("If-None-Match") or (
+                    self.headers.get("If-None-Match") is None
+                    and self.headers.get("If-Modified-Since") == server.last_modified):
+                with server.lock:
+                    server.not_modified += 1
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubAPI(ThreadingHTTPServer):
+    """
+    Server stub pornit într-un fir de fundal
+
+    Utilizare:
+        with StubAPI() as api:
+            client = APIClient(api.url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, data=None, delay=0.0, multi_filter=True, paging="page", validators=True):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.data = data if data is not None else make_dataset()
+        # Secunde per cerere, sau o funcție cale -> secunde (întârzieri injectate)
+        self.delay = delay
+        # Următoarele fail_next cereri primesc fail_status
+        self.fail_next = 0
+        self.fail_status = 503
+        # False: filtrele repetate (postId=1&postId=2) primesc 400; "first" /
+        # "last": se aplică doar prima / ultima valoare, fără eroare
+        self.multi_filter = multi_filter
+        # "page": _page și Link rel="next" (json-server); "cursor": doar Link
+        # cu _cursor=<ultimul id>; None: _page fără antet Link; "ignore":
+        # _page este ignorat
+        self.paging = paging
+        # ETag / Last-Modified pe răspunsurile 200 (schimbați data -> alt ETag)
+        self.validators = validators
+        self.last_modified = "Mon, 05 Oct 2026 10:00:00 GMT"
+        self.cache_control = None
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.paths = []
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,133 @@
+"""
+Server local compatibil RESP, folosit în teste în locul unui Redis real
+
+Implementează doar comenzile folosite de RedisSessionStore; scriptul
+de compare-and-set este recunoscut după SHA și executat în Python.
+"""
+
+import socketserver
+import threading
+import time
+
+from src.hangman_3d.sessions.redis import CAS_SCRIPT, CAS_SCRIPT_SHA
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Procesează comenzile unei conexiuni"""
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    @staticmethod
+    def _encode(value):
+        if value is None:
+            return b'$-1\r\n'
+        if isinstance(value, int):
+            return b':%d\r\n' % value
+        if isinstance(value, Exception):
+            return b'-%s\r\n' % str(value).encode()
+        if isinstance(value, str):
+            return b'+%s\r\n' % value.encode()
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            with server.lock:
+                reply = self._encode(server.dispatch(args[0].upper().decode(), args[1:]))
+                stall, server.stall_next = server.stall_next, 0.0
+            if stall:
+                # Jumătate din răspuns, o pauză, apoi restul (răspuns întârziat)
+                self.wfile.write(reply[:len(reply) // 2])
+                time.sleep(stall)
+                reply = reply[len(reply) // 2:]
+            try:
+                self.wfile.write(reply)
+            except OSError:
+                return
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """Server RESP în memorie pornit pe un port liber din localhost"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.lock = threading.Lock()
+        self.data = {}
+        self.expires = {}
+        self.scripts = set()
+        # Secunde de pauză la mijlocul următorului răspuns (0 = fără pauză)
+        self.stall_next = 0.0
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+    def start(self) -> "RespStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def _alive(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def _set(self, key, value, ttl):
+        self.data[key] = value
+        self.expires[key] = time.monotonic() + ttl
+
+    def _cas(self, key, expected, value, ttl):
+        if not self._alive(key) or self.data[key][:8] != expected:
+            return 0
+        self._set(key, value, int(ttl))
+        return 1
+
+    def dispatch(self, command, args):
+        if command == 'SELECT':
+            return 'OK'
+        if command == 'SET':
+            self._set(args[0], args[1], int(args[3]))
+            return 'OK'
+        if command in ('GET', 'GETEX'):
+            if not self._alive(args[0]):
+                return None
+            if command == 'GETEX':
+                self.expires[args[0]] = time.monotonic() + int(args[2])
+            return self.data[args[0]]
+        if command == 'DEL':
+            alive = self._alive(args[0])
+            self.data.pop(args[0], None)
+            self.expires.pop(args[0], None)
+            return int(alive)
+        if command == 'DBSIZE':
+            return sum(1 for key in list(self.data) if self._alive(key))
+        if command == 'EVAL':
+            if args[0].decode() != CAS_SCRIPT:
+                return Exception('ERR script necunoscut')
+            self.scripts.add(CAS_SCRIPT_SHA)
+            return self._cas(*args[2:])
+        if command == 'EVALSHA':
+            if args[0].decode() not in self.scripts:
+                return Exception('NOSCRIPT No matching script')
+            return self._cas(*args[2:])
+        return Exception(f'ERR unknown command {command}')
@@ -0,0 +1,233 @@
+"""
+Teste pentru clientul API (pe serverul stub local)
+"""
+
+import csv
+import time
+import tracemalloc
+
+import pytest  # type: ignore
+import requests
+
+from src.hangman_3d.api_client import APIClient, FetchResult
+from src.hangman_3d.data_pipeline import DataPipeline
+
+from .http_standin import StubAPI, make_dataset
+
+
+@pytest.fixture
+def api():
+    with StubAPI() as server:
+        yield server
+
+
+@pytest.fixture
+def client(api):
+    with APIClient(api.url, pool_size=4) as client:
+        yield client
+
+
+class TestFetch:
+    """Teste pentru cererile individuale"""
+
+    def test_fetch_posts_and_users(self, client):
+        assert len(client.fetch_posts(limit=7)) == 7
+        assert [user['id'] for user in client.fetch_users(limit=3)] == [1, 2, 3]
+
+    def test_fetch_comments(self, client):
+        comments = client.fetch_comments(post_id=4)
+        assert comments and all(comment['postId'] == 4 for comment in comments)
+
+    def test_errors_return_empty_list(self, api):
+        with APIClient(f'{api.url}/missing') as client:
+            assert client.fetch_posts() == []
+        with APIClient('http://127.0.0.1:9', timeout=1) as client:
+            assert client.fetch_users() == []
+
+    def test_connections_reused(self, api, client):
+        """Test că cererile succesive folosesc aceeași conexiune keep-alive"""
+        for post_id in range(1, 21):
+            client.fetch_comments(post_id)
+        assert api.requests == 20
+        assert api.connections == 1
+
+
+class TestFetchConcurrent:
+    """Teste pentru cererile în paralel"""
+
+    def test_all_results(self, api, client):
+        client.hedge = False  # dublurile ar deschide conexiuni peste pool
+        paths = [f'/posts/{post_id}/comments' for post_id in range(1, 41)]
+        results = list(client.fetch_concurrent(paths))
+        assert sorted(result.path for result in results) == sorted(paths)
+        assert all(result.error is None and len(result.data) == 5 for result in results)
+        # Pool-ul limitează conexiunile deschise, indiferent de numărul cererilor
+        assert api.connections <= 4
+
+    def test_results_as_completed(self, api, client):
+        """Test că un rezultat se poate consuma înainte să se termine celelalte"""
+        api.delay = 0.05
+        results = client.fetch_concurrent(['/users'] * 8, max_workers=2)
+        first = next(results)
+        assert isinstance(first, FetchResult) and first.error is None
+        assert api.requests < 8
+        results.close()
+
+    def test_failed_request(self, client):
+        results = {result.path: result for result in client.fetch_concurrent(['/posts', '/nope'])}
+        assert results['/posts'].error is None
+        assert results['/nope'].data is None
+        assert results['/nope'].error is not None
+
+
+class TestFetchCommentsBulk:
+    """Teste pentru comentariile mai multor postări"""
+
+    def test_multi_filter(self, api, client):
+        """Test că ID-urile duplicate se cer o dată, într-o singură cerere"""
+        comments = client.fetch_comments_bulk([3, 1, 3, 7, 1])
+        assert list(comments) == [3, 1, 7]
+        assert all(len(items) == 5 and {c['postId'] for c in items} == {post_id}
+                   for post_id, items in comments.items())
+        assert api.requests == 1
+        assert client.multi_filter is True
+
+    def test_batches(self, api, client):
+        comments = client.fetch_comments_bulk(range(1, 26), batch_size=10)
+        assert api.requests == 3
+        assert sum(map(len, comments.values())) == 125
+
+    def test_fallback_per_post(self, api, client):
+        """Test că fără filtru multiplu se cere fiecare postare, o singură dată probat"""
+        api.multi_filter = False
+        comments = client.fetch_comments_bulk([1, 2, 3])
+        assert client.multi_filter is False
+        assert all(len(items) == 5 for items in comments.values())
+        assert api.requests == 4
+
+        api.paths.clear()
+        client.fetch_comments_bulk([4, 5])
+        assert sorted(api.paths) == ['/posts/4/comments', '/posts/5/comments']
+
+    @pytest.mark.parametrize('honored', ['first', 'last'])
+    def test_partial_multi_filter(self, api, client, honored):
+        """Test că un server care aplică o singură valoare a filtrului nu lasă
+        celelalte postări fără comentarii"""
+        api.multi_filter = honored
+        comments = client.fetch_comments_bulk([1, 2, 3])
+        assert all(len(items) == 5 for items in comments.values())
+        assert client.multi_filter is False
+
+        api.paths.clear()
+        client.fetch_comments_bulk([4, 5])
+        assert sorted(api.paths) == ['/posts/4/comments', '/posts/5/comments']
+
+    def test_unknown_posts(self, client):
+        assert client.fetch_comments_bulk([1000]) == {1000: []}
+
+    def test_ignored_filter_detected(self):
+        """Test că un răspuns cu postări din afara lotului nu este acceptat"""
+        batch = [1, 2]
+        assert APIClient._group_by_post([{'postId': 1}, {'postId': 3}], batch) is None
+        assert APIClient._group_by_post([{'postId': 2}], batch) == {2: [{'postId': 2}]}
+
+
+class TestJoinComments:
+    """Teste pentru etapa de pipeline care atașează comentariile"""
+
+    def test_join(self, api, client, tmp_path):
+        pipeline = DataPipeline(output_dir=str(tmp_path))
+        pipeline.api_client = client
+        posts = client.fetch_posts(limit=4)
+        joined = pipeline.join_comments(posts)
+        assert [post['id'] for post in joined] == [1, 2, 3, 4]
+        assert all(post['comment_count'] == 5 for post in joined)
+        assert joined[2]['comments'][0]['postId'] == 3
+        assert 'comments' not in posts[0]
+        assert api.requests == 2
+
+    def test_close(self, api, tmp_path):
+        """Test că pipeline-ul închide clientul API și conexiunea cache-ului"""
+        with DataPipeline(output_dir=str(tmp_path)) as pipeline:
+            pipeline.api_client.base_url = api.url
+            assert len(pipeline.api_client.fetch_users(limit=2)) == 2
+        assert pipeline.cache._local.conn is None
+        assert pipeline.api_client._hedge_pool._shutdown
+
+
+    def test_pipeline_exports_join(self, api, client, tmp_path):
+        """Test că pipeline-ul exportă postările cu numărul lor de comentarii"""
+        with DataPipeline(output_dir=str(tmp_path)) as pipeline:
+            pipeline.api_client.close()
+            pipeline.api_client = client
+            results = pipeline.run_full_pipeline()
+        with open(results['posts_comments_csv'], newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 10 and 'comments' not in rows[0]
+        assert {row['comment_count'] for row in rows} == {'5'}
+        with open(results['comments_csv'], newline='', encoding='utf-8') as f:
+            assert len(list(csv.DictReader(f))) == 50
+
+
+class TestIterPages:
+    """Teste pentru parcurgerea paginată a colecțiilor"""
+
+    @pytest.mark.parametrize('paging', ['page', 'cursor', None])
+    def test_all_records(self, api, client, paging):
+        """Test că fiecare stil de paginare produce toate înregistrările, o dată"""
+        api.paging = paging
+        ids = [post['id'] for post in client.iter_posts(page_size=30)]
+        assert ids == list(range(1, 101))
+        assert api.requests == 4
+
+    def test_exact_multiple(self, api, client):
+        """Test că fără antet Link ultima pagină goală oprește parcurgerea"""
+        api.paging = None
+        assert len(list(client.iter_users(page_size=5))) == 10
+        assert api.requests == 3
+
+    def test_without_prefetch(self, api, client):
+        assert len(list(client.iter_posts(page_size=40, prefetch=False))) == 100
+
+    def test_prefetch_next_page(self, api, client):
+        """Test că pagina următoare se cere înainte de consumarea celei curente"""
+        posts = client.iter_posts(page_size=10)
+        next(posts)
+        time.sleep(0.1)
+        assert api.requests == 2
+        posts.close()
+
+    def test_ignored_page_parameter(self, api, client):
+        api.paging = 'ignore'
+        assert len(list(client.iter_posts(page_size=10))) == 10
+
+    def test_error_raised(self, api):
+        with APIClient(f'{api.url}/missing') as client:
+            with pytest.raises(requests.exceptions.HTTPError):
+                list(client.iter_posts())
+
+    def test_truncation_not_silent(self, api):
+        """Test că o pagină eșuată la mijloc nu încheie parcurgerea ca și cum datele s-ar fi terminat"""
+        with APIClient(api.url, max_retries=0) as client:
+            posts = client.iter_posts(page_size=30, prefetch=False)
+            first_page = [next(posts) for _ in range(30)]
+            api.fail_next = 1
+            with pytest.raises(requests.exceptions.HTTPError):
+                list(posts)
+        assert [post['id'] for post in first_page] == list(range(1, 31))
+
+    def test_memory_bounded(self):
+        """Test că memoria folosită depinde de pagină, nu de dimensiunea colecției"""
+        with StubAPI(make_dataset(posts=20000, users=1, comments_per_post=0)) as api:
+            with APIClient(api.url) as client:
+                tracemalloc.start()
+                try:
+                    count = sum(1 for _ in client.iter_posts(page_size=200))
+                    _, paged_peak = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    everything = client.fetch_posts(limit=20000)
+                    _, full_peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+        assert count == len(everything) == 20000
+        assert paged_peak * 10 < full_peak, (paged_peak, full_peak)
@@ -0,0 +1,152 @@
+"""
+Teste pentru varianta ASGI a aplicației
+"""
+
+import asyncio
+import json
+
+import pytest  # type: ignore
+
+from src.hangman_3d.asgi import create_asgi_app
+from src.hangman_3d.dictionary import solver
+
+
+def _request(app, method, path, payload=None, query=b'', cookie=None, headers=()):
+    """Trimite o cerere HTTP direct aplicației ASGI"""
+    body = json.dumps(payload).encode() if payload is not None else b''
+    headers = [(b'content-type', b'application/json'), *headers]
+    if cookie:
+        headers.append((b'cookie', cookie.encode()))
+    scope = {'type': 'http', 'method': method, 'path': path,
+             'query_string': query, 'headers': headers}
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, body_message = sent
+    return start['status'], dict(start['headers']), body_message['body']
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Aplicație ASGI cu configurația de test"""
+    return create_asgi_app('testing')
+
+
+class TestGameEndpoints:
+    """Teste pentru endpoint-urile de joc"""
+
+    def test_index(self, app):
+        """Test pagina index"""
+        status, headers, body = _request(app, 'GET', '/')
+        assert status == 200
+        assert headers[b'content-type'].startswith(b'text/html')
+        assert b'<html' in body.lower()
+
+    def test_index_revalidation(self, app):
+        """Test că pagina are ETag și răspunde 304 la revalidare"""
+        _, headers, _ = _request(app, 'GET', '/', headers=[(b'accept-encoding', b'gzip')])
+        assert headers[b'content-encoding'] == b'gzip'
+        status, _, body = _request(app, 'GET', '/', headers=[
+            (b'accept-encoding', b'gzip'), (b'if-none-match', headers[b'etag'])])
+        assert (status, body) == (304, b'')
+
+    def test_static_file(self, app):
+        """Test că fișierele statice sunt servite și sub ASGI"""
+        status, headers, body = _request(app, 'GET', '/static/css/game.css')
+        assert status == 200
+        assert headers[b'content-type'].startswith(b'text/css')
+        assert _request(app, 'GET', '/static/../main.py')[0] == 404
+
+    def test_start_game_sets_cookie(self, app):
+        """Test că /start_game returnează game_id și setează cookie-ul"""
+        status, headers, body = _request(app, 'POST', '/start_game', {'difficulty': 'greu'})
+        data = json.loads(body)
+        assert status == 200
+        assert data['difficulty'] == 'greu'
+        assert headers[b'set-cookie'].startswith(f"game_id={data['game_id']}".encode())
+
+    def test_guess_with_cookie(self, app):
+        """Test ghicire folosind cookie-ul jocului"""
+        _, headers, _ = _request(app, 'POST', '/start_game', {})
+        cookie = headers[b'set-cookie'].decode().split(';')[0]
+
+        status, _, body = _request(app, 'POST', '/guess', {'letter': 'E'}, cookie=cookie)
+        assert status == 200
+        assert 'displayed_word' in json.loads(body)
+
+    def test_guess_without_game(self, app):
+        """Test ghicire fără joc inițiat"""
+        status, _, body = _request(app, 'POST', '/guess', {'letter': 'A'})
+        assert status == 400
+        assert json.loads(body) == {'error': 'Nu este inițiat niciun joc'}
+
+    def test_guess_batch_and_update_time(self, app):
+        """Test /guess_batch și /update_time cu game_id explicit"""
+        _, _, body = _request(app, 'POST', '/start_game', {})
+        game_id = json.loads(body)['game_id']
+
+        status, _, body = _request(app, 'POST', '/guess_batch',
+                                   {'game_id': game_id, 'letters': 'AE'})
+        assert status == 200
+        assert len(json.loads(body)['results']) >= 1
+
+        status, _, body = _request(app, 'GET', '/update_time',
+                                   query=f'game_id={game_id}'.encode())
+        assert status == 200
+        assert json.loads(body)['success']
+
+    def test_same_logic_as_flask(self, app):
+        """Test că erorile de validare sunt aceleași ca în varianta Flask"""
+        _, _, body = _request(app, 'POST', '/start_game', {})
+        game_id = json.loads(body)['game_id']
+
+        status, _, body = _request(app, 'POST', '/guess', {'game_id': game_id, 'letter': '7'})
+        assert status == 400
+        assert json.loads(body)['error'] == 'Literă invalidă'
+
+
+class TestProtocol:
+    """Teste pentru rutare și ciclul de viață"""
+
+    def test_not_found(self, app):
+        status, _, body = _request(app, 'GET', '/missing')
+        assert status == 404
+        assert 'error' in json.loads(body)
+
+    def test_method_not_allowed(self, app):
+        status, headers, _ = _request(app, 'GET', '/guess')
+        assert status == 405
+        assert headers[b'allow'] == b'POST'
+
+    def test_data_status(self, app):
+        status, _, body = _request(app, 'GET', '/api/data/status')
+        assert status == 200
+        assert json.loads(body)['status'] == 'ready'
+
+    def test_lifespan(self, monkeypatch):
+        """Test pornire și oprire; solver-ul indiciilor se construiește la pornire"""
+        monkeypatch.setattr(solver, '_solvers', {})
+        app = create_asgi_app('testing')
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message['type'])
+
+        asyncio.run(app({'type': 'lifespan'}, receive, send))
+        assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+        assert len(solver._solvers) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
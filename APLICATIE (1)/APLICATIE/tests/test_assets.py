@@ -0,0 +1,170 @@
+"""
+Teste pentru pipeline-ul de asset-uri și pagina precomprimată
+"""
+
+import gzip
+import json
+import os
+
+import pytest  # type: ignore
+
+from src.hangman_3d import create_app
+from src.hangman_3d.assets import (
+    IMMUTABLE_CACHE, AssetManifest, CompressedResource, StaticFiles,
+    build_assets, negotiate_encoding
+)
+
+CSS = b'body { color: red; }\n' * 50
+
+
+@pytest.fixture
+def static_folder(tmp_path):
+    """Folder static minimal, cu un fișier într-un subfolder și Three.js inclus"""
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'game.css').write_bytes(CSS)
+    (tmp_path / 'vendor').mkdir()
+    (tmp_path / 'vendor' / 'three.min.js').write_bytes(b'var THREE={};')
+    (tmp_path / 'logo.png').write_bytes(b'\x89PNG' + bytes(100))
+    return str(tmp_path)
+
+
+@pytest.fixture
+def client():
+    app = create_app('testing')
+    with app.test_client() as client:
+        yield client
+
+
+class TestBuild:
+    """Teste pentru pasul de build"""
+
+    def test_fingerprints_and_compresses(self, static_folder):
+        """Test că fișierele sunt copiate sub nume cu hash, cu variante comprimate"""
+        manifest = build_assets(static_folder)
+        hashed = manifest['css/game.css']
+        assert hashed.startswith('css/game.') and hashed.endswith('.css')
+
+        dist = os.path.join(static_folder, 'dist')
+        with open(os.path.join(dist, hashed), 'rb') as f:
+            assert f.read() == CSS
+        with open(os.path.join(dist, hashed + '.gz'), 'rb') as f:
+            assert gzip.decompress(f.read()) == CSS
+        assert not os.path.exists(os.path.join(dist, manifest['logo.png'] + '.gz'))
+
+        with open(os.path.join(dist, 'manifest.json')) as f:
+            assert json.load(f) == manifest
+
+    def test_rebuild_is_stable(self, static_folder):
+        """Test că un al doilea build nu amprentează dist/ și dă aceleași nume"""
+        first = build_assets(static_folder)
+        assert build_assets(static_folder) == first
+
+    def test_manifest_urls(self, static_folder):
+        """Test pentru rezolvarea URL-urilor, cu și fără build"""
+        assert AssetManifest(static_folder).url('css/game.css') == '/static/css/game.css'
+        manifest = build_assets(static_folder)
+        assert AssetManifest(static_folder).url('css/game.css') == \
+            f"/static/dist/{manifest['css/game.css']}"
+
+
+class TestCompressedResource:
+    """Teste pentru negociere și revalidare"""
+
+    def test_negotiation(self):
+        assert negotiate_encoding('gzip, deflate', {None, 'gzip', 'br'}) == 'gzip'
+        assert negotiate_encoding('gzip, br', {None, 'gzip', 'br'}) == 'br'
+        assert negotiate_encoding('br;q=0, gzip', {None, 'gzip', 'br'}) == 'gzip'
+        assert negotiate_encoding('identity', {None, 'gzip'}) is None
+        assert negotiate_encoding(None, {None, 'gzip'}) is None
+
+    def test_etag_per_variant(self):
+        resource = CompressedResource(CSS, 'text/css')
+        status, body, headers = resource.respond('gzip')
+        headers = dict(headers)
+        assert status == 200
+        assert gzip.decompress(body) == CSS
+        assert headers['Content-Encoding'] == 'gzip'
+        assert headers['ETag'] != dict(resource.respond(None)[2])['ETag']
+
+        status, body, _ = resource.respond('gzip', headers['ETag'])
+        assert (status, body) == (304, b'')
+
+    def test_static_files_reject_traversal(self, static_folder):
+        files = StaticFiles(static_folder)
+        assert files.get('../etc/passwd') is None
+        assert files.get('css/game.css').cache_control == 'no-cache'
+
+    def test_static_files_cache_only_existing(self, static_folder):
+        """Test că o cerere pentru o cale inexistentă nu rămâne în cache"""
+        files = StaticFiles(static_folder)
+        for n in range(100):
+            assert files.get(f'css/missing-{n}.css') is None
+        resource = files.get('css/game.css')
+        assert files.get('css/./game.css') is resource
+        assert list(files._cache) == ['css/game.css']
+
+    def test_static_files_see_edits(self, static_folder):
+        """Test că un fișier din afara dist/ editat sau șters nu este servit învechit"""
+        files = StaticFiles(static_folder)
+        path = os.path.join(static_folder, 'css', 'game.css')
+        first = files.get('css/game.css')
+        assert files.get('css/game.css') is first
+
+        with open(path, 'wb') as f:
+            f.write(b'body { color: blue; }\n')
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+        edited = files.get('css/game.css')
+        assert edited is not first
+        assert edited.respond(None)[1] == b'body { color: blue; }\n'
+
+        os.remove(path)
+        assert files.get('css/game.css') is None
+        assert 'css/game.css' not in files._cache
+
+    def test_dist_served_from_memory(self, static_folder):
+        """Test că fișierele amprentate nu mai sunt verificate pe disc"""
+        manifest = build_assets(static_folder)
+        files = StaticFiles(static_folder)
+        resource = files.get(f"dist/{manifest['css/game.css']}")
+        os.remove(os.path.join(static_folder, 'dist', manifest['css/game.css']))
+        assert files.get(f"dist/{manifest['css/game.css']}") is resource
+
+
+class TestRoutes:
+    """Teste pentru pagina principală și asset-urile servite de Flask"""
+
+    def test_index_compressed_with_etag(self, client):
+        """Test că pagina este servită comprimată, cu ETag"""
+        response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert b'<html' in gzip.decompress(response.data).lower()
+
+        etag = response.headers['ETag']
+        repeat = client.get('/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b''
+
+    def test_index_uncompressed(self, client):
+        response = client.get('/')
+        assert 'Content-Encoding' not in response.headers
+        assert b'asset_url' not in response.data
+        assert b'/static/' in response.data
+
+    def test_fingerprinted_asset(self, client, static_folder):
+        """Test că asset-urile amprentate au cache immutable"""
+        manifest = build_assets(static_folder)
+        client.application.extensions['static_files'] = StaticFiles(static_folder)
+
+        response = client.get(f"/static/dist/{manifest['css/game.css']}",
+                              headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == IMMUTABLE_CACHE
+        assert gzip.decompress(response.data) == CSS
+        assert response.headers['Content-Type'].startswith('text/css')
+
+        assert client.get('/static/dist/css/missing.css').status_code == 404
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,69 @@
+"""
+Teste pentru clasificatorul de dificultate
+"""
+
+import pytest  # type: ignore
+
+np = pytest.importorskip('numpy')
+
+from src.hangman_3d.dictionary import WordDictionary  # noqa: E402
+from src.hangman_3d.dictionary.classifier import (  # noqa: E402
+    classify, score_words, word_features, main
+)
+from src.hangman_3d.utils import WORDS  # noqa: E402
+
+
+class TestClassifier:
+    """Teste pentru scorul și împărțirea pe niveluri"""
+
+    def test_features(self):
+        """Test lungime, litere distincte și raritate"""
+        features = word_features(['BANANA', 'EAT', 'TEA', 'ZEQ'])
+
+        assert list(features['length']) == [6, 3, 3, 3]
+        assert list(features['distinct']) == [3, 3, 3, 3]
+        assert features['rarity'][3] > features['rarity'][1]
+
+    def test_longer_rarer_words_score_higher(self):
+        """Test cuvintele lungi, cu litere rare, sunt mai grele"""
+        scores = score_words(['CAT', 'DOG', 'JAZZY', 'SYNCHRONIZATION'])
+        assert scores[3] > scores[2] > scores[0]
+
+    def test_solve_rate_shifts_score(self):
+        """Test rata empirică de rezolvare influențează scorul"""
+        words = ['PYTHON', 'GARDEN', 'CASTLE', 'PLANET']
+        base = score_words(words)
+        rates = np.array([0.05, 0.95, np.nan, np.nan])
+        adjusted = score_words(words, rates)
+
+        assert adjusted[0] - base[0] > adjusted[1] - base[1]
+        assert adjusted[2] == base[2]
+
+    def test_classify_balanced_buckets(self):
+        """Test împărțire pe cuantile a listei WORDS"""
+        words = [w for bucket in WORDS.values() for w in bucket]
+        buckets = classify(words)
+
+        sizes = [len(buckets[d]) for d in ('usor', 'mediu', 'greu', 'expert')]
+        assert sum(sizes) == len(set(words))
+        assert max(sizes) - min(sizes) <= len(words) // 8
+        assert 'CAT' in buckets['usor']
+        assert 'CHARACTERIZATION' in buckets['expert']
+
+    def test_cli_writes_dictionary(self, tmp_path):
+        """Test CLI de reclasificare offline"""
+        source = tmp_path / 'words.txt'
+        source.write_text('\n'.join(w for bucket in WORDS.values() for w in bucket))
+        rates = tmp_path / 'rates.csv'
+        rates.write_text('word,solve_rate\nCAT,0.01\n')
+        output = tmp_path / 'words.dict'
+
+        assert main([str(source), str(output), '--solve-rates', str(rates)]) == 0
+
+        dictionary = WordDictionary.load(str(output))
+        assert len(dictionary) == len({w for bucket in WORDS.values() for w in bucket})
+        assert sum(dictionary.counts().values()) == len(dictionary)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
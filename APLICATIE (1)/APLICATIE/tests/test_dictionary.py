@@ -0,0 +1,102 @@
+"""
+Teste pentru dicționarul de cuvinte
+"""
+
+import random
+import pytest  # type: ignore
+from src.hangman_3d.dictionary import WordDictionary, get_dictionary, set_dictionary
+from src.hangman_3d.models import GameState
+from src.hangman_3d.utils import WORDS
+
+SAMPLE = {
+    "usor": ["cat", "DOG", "sun", "dog", "x-ray"],
+    "mediu": ["PYTHON", "GARDEN", "CAT"],
+    "greu": ["ALGORITHM"],
+    "expert": [],
+}
+
+
+@pytest.fixture
+def dictionary_file(tmp_path):
+    """Fișier de dicționar construit din SAMPLE"""
+    path = str(tmp_path / 'words.dict')
+    WordDictionary.write(path, SAMPLE)
+    return path
+
+
+class TestWordDictionary:
+    """Teste pentru WordDictionary"""
+
+    def test_build_filters_and_dedupes(self):
+        """Test normalizare, eliminare duplicate și cuvinte invalide"""
+        dictionary = WordDictionary.from_words(SAMPLE)
+
+        assert len(dictionary) == 6
+        assert [dictionary[i] for i in dictionary.word_ids('usor')] == ['CAT', 'DOG', 'SUN']
+        assert [dictionary[i] for i in dictionary.word_ids('mediu')] == ['PYTHON', 'GARDEN']
+        assert dictionary.counts() == {'usor': 3, 'mediu': 2, 'greu': 1, 'expert': 0}
+
+    def test_load_mmap(self, dictionary_file):
+        """Test încărcare din fișier prin mmap"""
+        dictionary = WordDictionary.load(dictionary_file)
+
+        assert dictionary.index_of('garden') == 4
+        assert dictionary.index_of('MISSING') is None
+        assert 'ALGORITHM' in dictionary
+        assert dictionary.difficulty_of(5) == 'greu'
+
+    def test_indexes(self):
+        """Test indexurile pe lungime și pe literă"""
+        dictionary = WordDictionary.from_words(SAMPLE)
+
+        by_length = sorted(dictionary[i] for i in dictionary.ids_by_length(6))
+        assert by_length == ['GARDEN', 'PYTHON']
+        assert list(dictionary.ids_by_length(40)) == []
+
+        with_o = [dictionary[i] for i in dictionary.ids_with_letter('o')]
+        assert with_o == ['DOG', 'PYTHON', 'ALGORITHM']
+
+    def test_random_id(self):
+        """Test alegere aleatoare în intervalul nivelului"""
+        dictionary = WordDictionary.from_words(SAMPLE)
+        rng = random.Random(0)
+        picks = {dictionary[dictionary.random_id('usor', rng)] for _ in range(50)}
+
+        assert picks == {'CAT', 'DOG', 'SUN'}
+        with pytest.raises(ValueError):
+            dictionary.random_id('expert')
+
+    def test_letter_index(self):
+        """Test index literă -> poziții"""
+        dictionary = WordDictionary.from_words({'mediu': ['GARDEN', 'BANANA']})
+        mask, positions = dictionary.letter_index(1)
+
+        assert positions[0] == (1, 3, 5)
+        assert positions[ord('N') - 65] == (2, 4)
+        assert mask == (1 << 0) | (1 << 1) | (1 << (ord('N') - 65))
+
+
+class TestActiveDictionary:
+    """Teste pentru integrarea cu GameState"""
+
+    def test_default_built_from_words(self):
+        """Test dicționarul implicit conține lista WORDS"""
+        dictionary = get_dictionary()
+        for difficulty, words in WORDS.items():
+            assert {dictionary[i] for i in dictionary.word_ids(difficulty)} <= set(words)
+
+    def test_game_uses_loaded_dictionary(self, dictionary_file):
+        """Test GameState alege cuvinte din dicționarul încărcat"""
+        previous = get_dictionary()
+        set_dictionary(WordDictionary.load(dictionary_file))
+        try:
+            game = GameState('mediu')
+            assert game.word in ('PYTHON', 'GARDEN')
+            restored = GameState.from_bytes(game.to_bytes())
+            assert restored.word == game.word
+        finally:
+            set_dictionary(previous)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
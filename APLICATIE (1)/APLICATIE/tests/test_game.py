@@ -2,8 +2,10 @@
 Teste pentru logica jocului
 """
 
+import time
 import pytest  # type: ignore
 from src.hangman_3d.models import GameState
+from src.hangman_3d.dictionary import get_dictionary
 
 
 class TestGameState:
@@ -76,6 +78,56 @@ class TestGameState:
         assert game.game_over
         assert game.wrong_guesses >= game.max_wrong
 
+    def test_invalid_letter(self):
+        """Test respingere caractere care nu sunt litere A-Z"""
+        game = GameState()
+        for value in ['1', 'AB', 'Ă', '-']:
+            result = game.guess_letter(value)
+            assert not result['success']
+        assert game.wrong_guesses == 0
+        assert game.guessed_mask == 0
+    
+    def test_display_updated_incrementally(self):
+        """Test dezvăluirea tuturor pozițiilor unei litere repetate"""
+        game = GameState('mediu', word_id=get_dictionary().index_of('DATABASE'))
+        
+        assert game.guess_letter('a')['displayed_word'] == '_A_A_A__'
+        for letter in 'DTBS':
+            game.guess_letter(letter)
+        assert game.get_display_word() == 'DATABAS_'
+        result = game.guess_letter('E')
+        assert result['displayed_word'] == 'DATABASE'
+        assert result['won']
+        assert game.remaining_mask == 0
+        assert game.guessed_letters == ['A', 'B', 'D', 'E', 'S', 'T']
+    
+    def test_compact_representation(self):
+        """Test starea nu are __dict__ și păstrează doar indexul cuvântului"""
+        game = GameState('expert')
+        game.game_over = True
+        
+        assert not hasattr(game, '__dict__')
+        assert game.difficulty == 'expert'
+        assert game.game_over and not game.won
+        assert game.word == get_dictionary()[game.word_id]
+    
+    def test_binary_roundtrip(self):
+        """Test serializare binară compactă"""
+        game = GameState('greu')
+        game.guess_letter(game.word[0])
+        game.guess_letter('Q' if 'Q' not in game.word else 'Z')
+
+        data = game.to_bytes()
+        restored = GameState.from_bytes(data)
+
+        assert len(data) < 64
+        assert restored.word == game.word
+        assert restored.difficulty == 'greu'
+        assert restored.guessed_letters == game.guessed_letters
+        assert restored.wrong_guesses == game.wrong_guesses
+        assert restored.get_display_word() == game.get_display_word()
+        assert abs(restored.deadline - game.deadline) < 0.01
+
 
 class TestGameFlow:
     """Teste pentru fluxul complet al jocului"""
@@ -83,28 +135,42 @@ class TestGameFlow:
     def test_winning_game(self):
         """Test finalizare joc câștigat"""
         game = GameState()
-        # Ghicește toate literele cuvântului
-        for letter in game.word:
+        # Ghicește toate literele distincte ale cuvântului
+        letters = list(dict.fromkeys(game.word))
+        for letter in letters:
             result = game.guess_letter(letter)
-            if letter == game.word[-1]:  # Ultima literă
+            if letter == letters[-1]:  # Ultima literă
                 assert result['won']
                 assert result['game_over']
     
     def test_time_update(self):
-        """Test actualizare timp"""
+        """Test timpul este calculat de server, nu preluat de la client"""
         game = GameState()
         result = game.update_time(100)
         
         assert result['success']
-        assert game.time_left == 100
+        assert 299 <= game.time_left <= 300
     
     def test_time_up(self):
         """Test Game Over pe timeout"""
         game = GameState()
-        result = game.update_time(0)
+        game.deadline = time.monotonic() - 1
+        result = game.status()
         
         assert result['time_up']
         assert game.game_over
+        assert game.time_left == 0
+    
+    def test_guess_after_deadline(self):
+        """Test expirarea este detectată leneș la ghicire"""
+        game = GameState()
+        game.deadline = time.monotonic() - 1
+        result = game.guess_letter(game.word[0])
+        
+        assert not result['success']
+        assert result['time_up']
+        assert result['word'] == game.word
+        assert len(game.guessed_letters) == 0
 
 
 if __name__ == '__main__':
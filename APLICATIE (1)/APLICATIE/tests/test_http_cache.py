@@ -0,0 +1,143 @@
+"""
+Teste pentru cache-ul HTTP al clientului API
+"""
+
+import json
+
+import pytest  # type: ignore
+
+from src.hangman_3d.api_client import APIClient
+from src.hangman_3d.http_cache import ResponseCache
+
+from .http_standin import StubAPI
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / 'http.sqlite3'), ttls={'/users': 60}, clock=clock)
+    yield cache
+    cache.close()
+
+
+def put(cache, url, payload, headers=None):
+    body = json.dumps(payload).encode()
+    return cache.put(url, headers or {'ETag': '"v1"'}, body, payload)
+
+
+class TestResponseCache:
+    """Teste pentru stocarea răspunsurilor"""
+
+    def test_roundtrip(self, cache):
+        headers = {'ETag': '"v1"', 'Link': '<http://x/posts?_page=2>; rel="next"'}
+        assert put(cache, 'http://x/posts', [{'id': 1}], headers)
+        entry = cache.get('http://x/posts')
+        assert entry.data() == [{'id': 1}]
+        assert entry.data() is not entry.data()
+        assert entry.validators() == {'If-None-Match': '"v1"'}
+        assert entry.links()['next']['url'] == 'http://x/posts?_page=2'
+        assert cache.get('http://x/users') is None
+
+    def test_body_compressed(self, cache):
+        payload = [{'id': n, 'body': 'lorem ipsum ' * 20} for n in range(50)]
+        put(cache, 'http://x/posts', payload)
+        entry = cache.get('http://x/posts')
+        assert len(entry.body) * 5 < len(json.dumps(payload))
+
+    def test_reparse_when_pickle_unreadable(self, cache):
+        put(cache, 'http://x/posts', [1, 2])
+        entry = cache.get('http://x/posts')._replace(parsed=b'not a pickle')
+        assert entry.data() == [1, 2]
+
+    def test_ttl_per_endpoint(self, cache, clock):
+        put(cache, 'http://x/users', [])
+        entry = cache.get('http://x/users')
+        assert cache.is_fresh(entry, '/users?_limit=5')
+        assert not cache.is_fresh(entry, '/posts')
+        clock.now += 61
+        assert not cache.is_fresh(entry, '/users')
+
+    def test_no_store(self, cache):
+        assert not put(cache, 'http://x/posts', [], {'Cache-Control': 'private, no-store'})
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, tmp_path, clock):
+        """Test că peste limită se elimină intrările folosite cel mai demult"""
+        cache = ResponseCache(str(tmp_path / 'small.sqlite3'), max_bytes=1000, clock=clock)
+        for n in range(4):
+            clock.now += 1
+            put(cache, f'http://x/{n}', list(range(n * 1000, n * 1000 + 40)))
+        clock.now += 1
+        cache.get('http://x/0')
+        clock.now += 1
+        put(cache, 'http://x/4', list(range(4000, 4040)))
+        assert cache.size() <= 1000
+        assert cache.get('http://x/0') is not None
+        assert cache.get('http://x/1') is None
+        assert cache.get('http://x/4') is not None
+        assert not put(cache, 'http://x/big', [str(n) for n in range(2000)])
+
+
+class TestClientCache:
+    """Teste pentru cererile condiționate ale clientului"""
+
+    @pytest.fixture
+    def api(self):
+        with StubAPI() as server:
+            yield server
+
+    @pytest.fixture
+    def client(self, api, cache):
+        with APIClient(api.url, cache=cache) as client:
+            yield client
+
+    def test_fresh_hit_skips_network(self, api, client):
+        first = client.fetch_users(limit=5)
+        assert client.fetch_users(limit=5) == first
+        assert api.requests == 1
+
+    def test_revalidation_with_etag(self, api, client):
+        """Test că un răspuns expirat se revalidează și 304 folosește corpul din cache"""
+        first = client.fetch_posts(limit=3)
+        assert client.fetch_posts(limit=3) == first
+        assert api.requests == 2 and api.not_modified == 1
+
+        api.data['posts'][0]['title'] = 'schimbat'
+        assert client.fetch_posts(limit=3)[0]['title'] == 'schimbat'
+        assert api.not_modified == 1
+
+    def test_revalidation_with_last_modified(self, api, client, cache):
+        client.fetch_posts(limit=3)
+        cache._conn().execute("UPDATE responses SET etag = NULL")
+        assert len(client.fetch_posts(limit=3)) == 3
+        assert api.not_modified == 1
+
+    def test_ttl_expiry(self, api, client, clock):
+        client.fetch_users()
+        clock.now += 120
+        client.fetch_users()
+        assert api.requests == 2 and api.not_modified == 1
+
+    def test_errors_not_cached(self, api, cache):
+        with APIClient(f'{api.url}/missing', cache=cache) as client:
+            assert client.fetch_posts() == []
+        assert len(cache) == 0
+
+    def test_pages_cached(self, api, client):
+        """Test că paginile revalidate păstrează antetul Link"""
+        first = [post['id'] for post in client.iter_posts(page_size=40)]
+        again = [post['id'] for post in client.iter_posts(page_size=40)]
+        assert first == again == list(range(1, 101))
+        assert api.not_modified == 3
@@ -0,0 +1,73 @@
+"""
+Buget pentru timpul de import al drumului de joc (pornirea la rece)
+
+Importurile se măsoară cu `python -X importtime` într-un proces nou; o
+rulare de încălzire scrie întâi fișierele .pyc, ca măsurătoarea să nu
+includă compilarea.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest  # type: ignore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Timpul propriu (fără dependențe) al modulelor pachetului, în microsecunde
+OWN_IMPORT_BUDGET_US = 100_000
+
+# Module grele care nu au ce căuta pe drumul de joc
+FORBIDDEN_ON_GAME_PATH = ("matplotlib", "pandas", "requests", "numpy", "urllib3")
+
+
+def _import_times(statement):
+    """Modulul -> (timp propriu, timp cumulat) în microsecunde"""
+    command = [sys.executable, '-X', 'importtime', '-c', statement]
+    subprocess.run(command, cwd=ROOT, capture_output=True, check=True)
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+@pytest.fixture(scope='module')
+def game_path():
+    return _import_times('from src.hangman_3d import create_app; create_app')
+
+
+class TestImportTime:
+    """Teste pentru costul importurilor"""
+
+    def test_no_heavy_modules(self, game_path):
+        """Test că aplicația de joc nu încarcă subsistemul de date"""
+        loaded = {name.split('.')[0] for name in game_path}
+        assert loaded.isdisjoint(FORBIDDEN_ON_GAME_PATH), \
+            sorted(loaded & set(FORBIDDEN_ON_GAME_PATH))
+        assert 'src.hangman_3d.data_pipeline' not in game_path
+        assert 'src.hangman_3d.visualizer' not in game_path
+
+    def test_own_modules_budget(self, game_path):
+        """Test că modulele pachetului nu fac muncă grea la import"""
+        own = {name: times[0] for name, times in game_path.items() if name.startswith('src.')}
+        total = sum(own.values())
+        slowest = sorted(own.items(), key=lambda item: -item[1])[:5]
+        assert total < OWN_IMPORT_BUDGET_US, f"{total} us; cele mai lente: {slowest}"
+
+    def test_submodules_without_flask(self):
+        """Test că modelele și simularea se pot importa fără Flask"""
+        times = _import_times('import src.hangman_3d.models, src.hangman_3d.simulation')
+        assert 'flask' not in times
+        assert 'src.hangman_3d.app' not in times
+
+    def test_lazy_exports(self):
+        """Test că exporturile pachetului rămân accesibile"""
+        import src.hangman_3d as package
+        assert callable(package.create_app)
+        assert 'DataPipeline' in dir(package)
+        with pytest.raises(AttributeError):
+            package.nu_exista
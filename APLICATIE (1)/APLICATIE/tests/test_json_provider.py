@@ -0,0 +1,89 @@
+"""
+Teste pentru serializarea JSON rapidă și corpurile constante
+"""
+
+import json
+
+import pytest  # type: ignore
+
+from src.hangman_3d import create_app, json_provider
+from src.hangman_3d.json_provider import ConstantPayload, FastJSONProvider
+from src.hangman_3d.routes import actions
+
+
+@pytest.fixture
+def app():
+    return create_app('testing')
+
+
+class TestConstantPayload:
+    """Teste pentru ConstantPayload"""
+
+    def test_pre_encoded(self):
+        """Test că dumps() returnează octeții calculați la definire"""
+        payload = ConstantPayload({"error": "Jocul s-a încheiat"})
+        assert json_provider.dumps(payload) is payload.encoded
+        assert json.loads(payload.encoded) == {"error": "Jocul s-a încheiat"}
+
+    def test_read_only(self):
+        """Test că un corp constant nu poate fi modificat"""
+        payload = ConstantPayload({"error": "x"})
+        with pytest.raises(TypeError):
+            payload["error"] = "y"
+        with pytest.raises(TypeError):
+            payload.update(extra=1)
+        with pytest.raises(TypeError):
+            payload |= {"extra": 1}
+        assert payload == {"error": "x"}
+
+    def test_nested(self):
+        """Test că un corp constant inclus în alt obiect se serializează normal"""
+        data = {"frames": [actions.NO_GAME]}
+        assert json.loads(json_provider.dumps(data)) == {
+            "frames": [{"error": actions.NO_GAME_ERROR}]
+        }
+
+
+class TestSerialization:
+    """Teste pentru dumps/loads"""
+
+    def test_stdlib_parity(self, monkeypatch):
+        """Test că orjson și fallback-ul pe json dau același rezultat"""
+        data = {"displayed_word": "Ă _ _", "wrong_letters": ["X", "Z"],
+                "time_left": 12.5, "game_over": False, "word": None}
+        fast = json_provider.dumps(data)
+        monkeypatch.setattr(json_provider, "orjson", None)
+        assert json_provider.dumps(data) == fast
+        assert json_provider.loads(fast) == data
+
+    def test_loads_invalid(self):
+        """Test că JSON-ul invalid ridică ValueError (ca json.loads)"""
+        with pytest.raises(ValueError):
+            json_provider.loads(b"{nu")
+
+
+class TestFlaskProvider:
+    """Teste pentru FastJSONProvider instalat în aplicație"""
+
+    def test_installed(self, app):
+        assert isinstance(app.json, FastJSONProvider)
+
+    def test_game_responses(self, app):
+        """Test că răspunsurile jocului rămân JSON valid"""
+        with app.test_client() as client:
+            response = client.post('/guess', json={'letter': 'A'})
+            assert response.status_code == 400
+            assert response.content_type == 'application/json'
+            assert response.data == actions.NO_GAME.encoded
+
+            client.post('/start_game', json={'difficulty': 'usor'})
+            response = client.post('/guess', json={'letter': 'A'})
+            assert response.status_code == 200
+            assert response.get_json()['success'] is True
+
+    def test_error_handler(self, app):
+        """Test că 404 folosește corpul precalculat"""
+        with app.test_client() as client:
+            response = client.get('/nu-exista')
+            assert response.status_code == 404
+            assert response.get_json() == {"error": "Nu a fost găsit"}
@@ -0,0 +1,132 @@
+"""
+Teste pentru generatorul de încărcare
+"""
+
+import csv
+import math
+import os
+import threading
+
+import pytest  # type: ignore
+from werkzeug.serving import make_server
+
+from src.hangman_3d import create_app
+from src.hangman_3d.loadtest import (
+    PACES, FlaskTransport, HTTPTransport, export_results, history_series, load_history,
+    parse_mix, run_load_test
+)
+from src.hangman_3d.utils.stats import percentile
+
+
+@pytest.fixture(scope='module')
+def app():
+    return create_app('testing')
+
+
+class TestStatistics:
+    """Teste pentru percentile și amestecul de dificultăți"""
+
+    def test_percentile_nearest_rank(self):
+        ordered = [float(value) for value in range(1, 101)]
+        assert percentile(ordered, 50) == 50
+        assert percentile(ordered, 99) == 99
+        assert percentile(ordered, 100) == 100
+        assert percentile([], 99) == 0.0
+
+    def test_parse_mix(self):
+        assert parse_mix('usor=3,expert') == {'usor': 3.0, 'expert': 1.0}
+
+
+class TestRunLoadTest:
+    """Teste pentru rularea sesiunilor de jucători"""
+
+    def test_in_process(self, app):
+        """Test că toate jocurile se joacă până la capăt, fără erori"""
+        result = run_load_test(FlaskTransport(app), games=12, players=4, pace='bot',
+                               mix={'usor': 1}, run_id='t')
+        rows = {row['endpoint']: row for row in result.summary()}
+        assert rows['/start_game']['requests'] == 12
+        assert rows['/guess']['requests'] >= 12
+        assert all(row['errors'] == 0 for row in rows.values())
+        assert rows['/guess']['p50_ms'] <= rows['/guess']['p99_ms']
+
+    def test_over_http(self, app):
+        """Test că transportul HTTP ajunge la un server real"""
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            result = run_load_test(HTTPTransport(f'http://127.0.0.1:{server.port}'),
+                                   games=3, players=3, pace='bot')
+        finally:
+            server.shutdown()
+        assert result.endpoints['/start_game'].errors == 0
+        assert len(result.endpoints['/start_game'].latencies) == 3
+
+    def test_timer_interval(self, app, monkeypatch):
+        """Test că /update_time se interoghează la intervalul cerut, sau deloc cu 0"""
+        monkeypatch.setitem(PACES, 'slow', (0.05, 0.05))
+        result = run_load_test(FlaskTransport(app), games=2, players=2, pace='slow',
+                               mix={'usor': 1}, timer_interval=0.01)
+        assert len(result.endpoints['/update_time'].latencies) >= 2
+        result = run_load_test(FlaskTransport(app), games=2, players=2, pace='slow',
+                               mix={'usor': 1}, timer_interval=0)
+        assert '/update_time' not in result.endpoints
+
+    def test_unknown_pace(self, app):
+        with pytest.raises(ValueError):
+            run_load_test(FlaskTransport(app), games=1, pace='snail')
+
+
+class TestExport:
+    """Teste pentru exportul rulărilor"""
+
+    def test_runs_comparable(self, app, tmp_path):
+        """Test că fiecare rulare are propriul CSV, iar istoricul le adună"""
+        for run_id in ('r1', 'r2'):
+            result = run_load_test(FlaskTransport(app), games=2, players=2, pace='bot',
+                                   run_id=run_id)
+            [path] = export_results(result, str(tmp_path), plots=False)
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            assert {row['run_id'] for row in rows} == {run_id}
+            assert {'p50_ms', 'p95_ms', 'p99_ms', 'requests_per_second'} <= set(rows[0])
+
+        history = load_history(str(tmp_path))
+        assert list(history) == ['r1', 'r2']
+        assert all('/guess' in run for run in history.values())
+
+    def test_history_by_start_time(self, tmp_path):
+        """Test că istoricul urmează started_at, iar un endpoint lipsă nu decalează seria"""
+        rows = {
+            'zeta': ('2026-01-01T10:00:00', {'/guess': 5.0, '/hint': 7.0}),
+            'alpha': ('2026-01-02T10:00:00', {'/guess': 6.0}),
+            'mid': ('2026-01-03T10:00:00', {'/guess': 8.0, '/hint': 9.0}),
+        }
+        for run_id, (started_at, endpoints) in rows.items():
+            with open(tmp_path / f'loadtest_{run_id}.csv', 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, ['run_id', 'started_at', 'endpoint', 'p99_ms'])
+                writer.writeheader()
+                for endpoint, p99 in endpoints.items():
+                    writer.writerow({'run_id': run_id, 'started_at': started_at,
+                                     'endpoint': endpoint, 'p99_ms': p99})
+
+        history = load_history(str(tmp_path))
+        assert list(history) == ['zeta', 'alpha', 'mid']
+        assert history['alpha'] == {'/guess': 6.0}
+
+        series = history_series(history)
+        assert series['/guess'] == [5.0, 6.0, 8.0]
+        assert series['/hint'][0] == 7.0 and math.isnan(series['/hint'][1])
+        assert series['/hint'][2] == 9.0
+
+    def test_plots(self, app, tmp_path):
+        """Test că graficele rulării și istoricul p99 sunt scrise ca PNG"""
+        for run_id in ('r1', 'r2'):
+            result = run_load_test(FlaskTransport(app), games=2, players=2, pace='bot',
+                                   run_id=run_id)
+            paths = export_results(result, str(tmp_path))
+        assert [os.path.basename(path) for path in paths] == [
+            'loadtest_r2.csv', 'loadtest_r2_p99.png', 'loadtest_r2_guess_histogram.png',
+            'loadtest_history_p99.png']
+        assert all(os.path.getsize(path) > 0 for path in paths)
@@ -0,0 +1,105 @@
+"""
+Teste pentru metricile Prometheus
+"""
+
+import threading
+
+import pytest  # type: ignore
+
+from src.hangman_3d import create_app
+from src.hangman_3d.metrics import Metrics
+
+
+def _samples(text):
+    """Valorile din formatul text Prometheus, indexate după numele complet"""
+    return {
+        line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+        for line in text.splitlines() if line and not line.startswith('#')
+    }
+
+
+@pytest.fixture
+def client():
+    app = create_app('testing')
+    with app.test_client() as client:
+        yield client
+
+
+class TestMetrics:
+    """Teste pentru registrul de metrici"""
+
+    def test_histogram_buckets(self):
+        """Test că intervalele sunt cumulative și includ limita superioară"""
+        metrics = Metrics(buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.01, 0.05, 3.0):
+            metrics.observe('/guess', 'POST', 200, seconds)
+        samples = _samples(metrics.render())
+        bucket = 'hangman_http_request_duration_seconds_bucket{route="/guess",le="%s"}'
+        assert samples[bucket % '0.01'] == 2
+        assert samples[bucket % '0.1'] == 3
+        assert samples[bucket % '+Inf'] == 4
+        assert samples['hangman_http_request_duration_seconds_count{route="/guess"}'] == 4
+        assert samples['hangman_http_request_duration_seconds_sum{route="/guess"}'] == \
+            pytest.approx(3.065)
+
+    def test_thread_safety(self):
+        """Test că nicio observație nu se pierde între fire"""
+        metrics = Metrics()
+
+        def work():
+            for _ in range(5000):
+                metrics.observe('/guess', 'POST', 200, 0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        samples = _samples(metrics.render())
+        assert samples['hangman_http_requests_total{route="/guess",method="POST",status="200"}'] \
+            == 40000
+
+    def test_failing_gauge_skipped(self):
+        metrics = Metrics()
+        metrics.gauge('broken', 'x', lambda: 1 / 0)
+        assert 'broken' not in metrics.render()
+
+
+class TestMetricsEndpoint:
+    """Teste pentru /metrics în aplicația Flask"""
+
+    def test_requests_and_sessions(self, client):
+        client.post('/start_game', json={})
+        client.post('/guess', json={'letter': 'A'})
+        client.get('/nu-exista')
+
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        samples = _samples(response.get_data(as_text=True))
+        assert samples['hangman_http_requests_total{route="/guess",method="POST",status="200"}'] == 1
+        assert samples['hangman_http_requests_total{route="<unmatched>",method="GET",status="404"}'] == 1
+        assert samples['hangman_active_sessions'] == 1
+
+    def test_exceptions_counted(self, client):
+        """Test că o excepție apare ca 500 și în contorul de excepții"""
+        app = client.application
+        app.view_functions['data_status'] = lambda: 1 / 0
+        app.config['PROPAGATE_EXCEPTIONS'] = False
+        assert client.get('/api/data/status').status_code == 500
+        samples = _samples(client.get('/metrics').get_data(as_text=True))
+        assert samples['hangman_http_exceptions_total{route="/api/data/status"}'] == 1
+        assert samples[
+            'hangman_http_requests_total{route="/api/data/status",method="GET",status="500"}'] == 1
+
+    def test_asgi_metrics(self):
+        from src.hangman_3d.asgi import create_asgi_app
+        from tests.test_asgi import _request
+
+        app = create_asgi_app('testing')
+        _request(app, 'POST', '/start_game', {})
+        status, headers, body = _request(app, 'GET', '/metrics')
+        assert status == 200
+        samples = _samples(body.decode())
+        assert samples[
+            'hangman_http_requests_total{route="/start_game",method="POST",status="200"}'] == 1
@@ -0,0 +1,120 @@
+"""
+Teste pentru limitarea ratei și plafonul de concurență
+"""
+
+import pytest  # type: ignore
+
+from src.hangman_3d import create_app
+from src.hangman_3d.config import TestingConfig
+from src.hangman_3d.ratelimit import RateLimiter, TokenBuckets
+
+
+class FakeClock:
+    """Ceas controlat manual"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limited_config(monkeypatch):
+    """Configurația de test cu limite mici activate"""
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_CLIENT', (100, 100))
+    monkeypatch.setattr(TestingConfig, 'RATE_LIMIT_ROUTES', {'/update_time': (1, 2)})
+
+
+class TestTokenBuckets:
+    """Teste pentru găleata de jetoane"""
+
+    def test_burst_then_refill(self, clock):
+        """Test rafala permisă și reumplerea în timp"""
+        buckets = TokenBuckets(rate=2, burst=3, clock=clock)
+        assert [buckets.take('a') for _ in range(3)] == [0, 0, 0]
+        assert buckets.take('a') == pytest.approx(0.5)
+        clock.now += 0.5
+        assert buckets.take('a') == 0
+        assert buckets.take('b') == 0  # alt client, altă găleată
+
+    def test_lru_bounded(self, clock):
+        """Test că numărul de clienți urmăriți este limitat"""
+        buckets = TokenBuckets(rate=1, burst=1, max_keys=4, stripes=1, clock=clock)
+        for client in range(10):
+            buckets.take(client)
+        assert len(buckets) == 4
+        # Clientul evacuat revine cu găleata plină
+        assert buckets.take(0) == 0
+
+
+class TestRateLimiter:
+    """Teste pentru RateLimiter"""
+
+    def test_route_limit(self, clock):
+        limiter = RateLimiter(client_limit=(100, 100), route_limits={'/update_time': (1, 1)},
+                              clock=clock)
+        assert limiter.check('a', '/update_time') is None
+        rejection = limiter.check('a', '/update_time')
+        assert rejection.status == 429
+        assert rejection.headers() == [('Retry-After', '1')]
+        assert limiter.check('a', '/guess') is None
+
+    def test_exempt(self, clock):
+        limiter = RateLimiter(client_limit=(1, 1), exempt=('/static/',), clock=clock)
+        assert all(limiter.check('a', '/static/css/game.css') is None for _ in range(5))
+
+    def test_concurrency_cap(self):
+        """Test că peste plafon se răspunde 503, fără așteptare"""
+        limiter = RateLimiter(max_concurrent=2)
+        assert limiter.admit('a', '/') is None
+        assert limiter.admit('b', '/') is None
+        assert limiter.admit('c', '/').status == 503
+        limiter.leave()
+        assert limiter.admit('c', '/') is None
+
+    def test_disabled_in_testing_config(self):
+        assert RateLimiter.from_config({'RATE_LIMIT_ENABLED': False}) is None
+
+
+class TestFlaskIntegration:
+    """Teste pentru limitarea înregistrată în create_app"""
+
+    def test_update_time_limited(self, limited_config):
+        app = create_app('testing')
+        with app.test_client() as client:
+            client.post('/start_game', json={})
+            assert client.get('/update_time').status_code == 200
+            assert client.get('/update_time').status_code == 200
+            response = client.get('/update_time')
+            assert response.status_code == 429
+            assert response.headers['Retry-After'] == '1'
+            assert response.get_json() == {"error": "Prea multe cereri"}
+
+    def test_slot_released(self, limited_config, monkeypatch):
+        """Test că locul de concurență se eliberează după fiecare cerere"""
+        monkeypatch.setattr(TestingConfig, 'MAX_CONCURRENT_REQUESTS', 1)
+        app = create_app('testing')
+        with app.test_client() as client:
+            for _ in range(5):
+                assert client.get('/api/data/status').status_code == 200
+        assert app.extensions['rate_limiter'].concurrency.in_flight == 0
+
+
+class TestASGIIntegration:
+    """Teste pentru limitarea în aplicația ASGI"""
+
+    def test_update_time_limited(self, limited_config):
+        from src.hangman_3d.asgi import create_asgi_app
+        from tests.test_asgi import _request
+
+        app = create_asgi_app('testing')
+        statuses = [_request(app, 'GET', '/update_time')[0] for _ in range(3)]
+        assert statuses[-1] == 429
+        assert app.limiter.concurrency.in_flight == 0
@@ -0,0 +1,242 @@
+"""
+Teste pentru canalul persistent per joc (WebSocket și SSE)
+"""
+
+import asyncio
+import json
+import time
+
+import pytest  # type: ignore
+
+from src.hangman_3d.asgi import create_asgi_app
+from src.hangman_3d.ratelimit import RateLimiter
+from src.hangman_3d.realtime import CLOSE_NO_GAME, CLOSE_POLICY_VIOLATION, GameEvent, StateTracker
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Aplicație ASGI cu configurația de test"""
+    return create_asgi_app('testing')
+
+
+async def _post(app, path, payload):
+    """Cerere POST completă; returnează corpul JSON"""
+    body = json.dumps(payload).encode()
+    scope = {'type': 'http', 'method': 'POST', 'path': path, 'query_string': b'',
+             'headers': [(b'content-type', b'application/json')]}
+    messages = [{'type': 'http.request', 'body': body}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return json.loads(sent[-1]['body'])
+
+
+class Connection:
+    """Conexiune simulată către aplicația ASGI (WebSocket sau flux HTTP)"""
+
+    def __init__(self, app, scope, first_message):
+        self.inbox = asyncio.Queue()
+        self.outbox = asyncio.Queue()
+        self.inbox.put_nowait(first_message)
+        self.task = asyncio.create_task(app(scope, self.inbox.get, self.outbox.put))
+
+    async def next(self, timeout=3.0):
+        return await asyncio.wait_for(self.outbox.get(), timeout)
+
+    async def frame(self, timeout=3.0):
+        """Următorul cadru JSON (WebSocket)"""
+        message = await self.next(timeout)
+        assert message['type'] == 'websocket.send', message
+        return json.loads(message['text'])
+
+    async def close(self, message):
+        self.inbox.put_nowait(message)
+        await asyncio.wait_for(self.task, 3.0)
+
+
+def _websocket(app, game_id):
+    scope = {'type': 'websocket', 'path': '/ws', 'headers': [],
+             'query_string': f'game_id={game_id}'.encode()}
+    return Connection(app, scope, {'type': 'websocket.connect'})
+
+
+class TestStateTracker:
+    """Teste pentru calculul diferențelor de stare"""
+
+    def test_only_changed_fields(self):
+        tracker = StateTracker()
+        first = tracker.frames(GameEvent('state', {}, {'wrong_guesses': 0, 'game_over': False}))
+        assert first == [{'type': 'state', 'wrong_guesses': 0, 'game_over': False}]
+
+        second = tracker.frames(GameEvent('guess', {'letter': 'A'},
+                                          {'wrong_guesses': 1, 'game_over': False}))
+        assert second == [{'type': 'guess', 'letter': 'A', 'wrong_guesses': 1}]
+
+    def test_game_over_frame(self):
+        tracker = StateTracker()
+        tracker.frames(GameEvent('state', {}, {'game_over': False}))
+        frames = tracker.frames(GameEvent('guess', {}, {'game_over': True, 'won': True,
+                                                         'word': 'CAT'}))
+        assert frames[-1] == {'type': 'game_over', 'won': True, 'word': 'CAT'}
+
+
+class TestWebSocket:
+    """Teste pentru canalul WebSocket"""
+
+    def test_guess_over_channel(self, app):
+        """Test că o ghicire trimisă pe canal primește un cadru delta"""
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {}))['game_id']
+            ws = _websocket(app, game_id)
+            assert (await ws.next())['type'] == 'websocket.accept'
+            state = await ws.frame()
+            assert state['type'] == 'state'
+            assert set(state['displayed_word']) == {'_'}
+
+            ws.inbox.put_nowait({'type': 'websocket.receive',
+                                 'text': json.dumps({'type': 'guess', 'letter': 'e'})})
+            frame = await ws.frame()
+            assert frame['type'] == 'guess'
+            assert frame['letter'] == 'E'
+            assert 'correct' in frame
+            assert ('displayed_word' in frame) == frame['correct']
+            assert ('wrong_guesses' in frame) != frame['correct']
+
+            ws.inbox.put_nowait({'type': 'websocket.receive',
+                                 'text': json.dumps({'type': 'guess', 'letter': 'E'})})
+            error = await ws.frame()
+            assert error == {'type': 'error', 'error': 'Litera a fost deja ghicită'}
+            await ws.close({'type': 'websocket.disconnect', 'code': 1000})
+            assert len(app.events) == 0
+
+        asyncio.run(scenario())
+
+    def test_hint_over_channel(self, app, monkeypatch):
+        """Test că indiciul trece prin hub, fără thread pool pentru backend-ul în memorie"""
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {}))['game_id']
+            ws = _websocket(app, game_id)
+            await ws.next()
+            await ws.frame()
+            monkeypatch.setattr(asyncio, 'to_thread', lambda *args: pytest.fail("to_thread"))
+            ws.inbox.put_nowait({'type': 'websocket.receive', 'text': json.dumps({'type': 'hint'})})
+            frame = await ws.frame()
+            assert frame['type'] == 'hint' and frame['letter'].isalpha()
+            await ws.close({'type': 'websocket.disconnect', 'code': 1000})
+
+        asyncio.run(scenario())
+
+    def test_messages_rate_limited(self, monkeypatch):
+        """Test că fiecare ghicire de pe canal consumă limita rutei /guess"""
+        app = create_asgi_app('testing')
+        monkeypatch.setattr(app, 'limiter', RateLimiter(route_limits={'/guess': (0.001, 2)}))
+
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {}))['game_id']
+            ws = _websocket(app, game_id)
+            assert (await ws.next())['type'] == 'websocket.accept'
+            await ws.frame()
+            for letter in 'QZ':
+                ws.inbox.put_nowait({'type': 'websocket.receive',
+                                     'text': json.dumps({'type': 'guess', 'letter': letter})})
+                assert (await ws.frame())['letter'] == letter
+            ws.inbox.put_nowait({'type': 'websocket.receive',
+                                 'text': json.dumps({'type': 'guess', 'letter': 'X'})})
+            assert await ws.next() == {'type': 'websocket.close', 'code': CLOSE_POLICY_VIOLATION}
+            await asyncio.wait_for(ws.task, 3.0)
+            assert len(app.events) == 0
+
+        asyncio.run(scenario())
+
+    def test_http_guess_is_pushed(self, app):
+        """Test că ghicirile prin POST ajung și pe canal"""
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {}))['game_id']
+            ws = _websocket(app, game_id)
+            await ws.next()
+            await ws.frame()
+            await _post(app, '/guess', {'game_id': game_id, 'letter': 'Q'})
+            frame = await ws.frame()
+            assert frame['type'] == 'guess' and frame['letter'] == 'Q'
+            await ws.close({'type': 'websocket.disconnect', 'code': 1000})
+
+        asyncio.run(scenario())
+
+    def test_timeout_is_pushed(self, app):
+        """Test că expirarea detectată pe server este împinsă imediat"""
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {}))['game_id']
+            app.store.update(game_id, lambda game: setattr(
+                game, 'deadline', time.monotonic() + 0.2))
+            ws = _websocket(app, game_id)
+            await ws.next()
+            await ws.frame()
+
+            start = time.monotonic()
+            time_up = await ws.frame()
+            assert time_up['type'] == 'time_up'
+            assert time_up['game_over'] is True
+            assert time_up['word']
+            assert (await ws.frame())['type'] == 'game_over'
+            assert time.monotonic() - start < 1.5
+            await ws.close({'type': 'websocket.disconnect', 'code': 1000})
+
+        asyncio.run(scenario())
+
+    def test_unknown_game(self, app):
+        """Test că un joc inexistent închide canalul"""
+        async def scenario():
+            ws = _websocket(app, 'missing')
+            assert (await ws.next())['type'] == 'websocket.accept'
+            assert (await ws.frame())['type'] == 'error'
+            assert (await ws.next()) == {'type': 'websocket.close', 'code': CLOSE_NO_GAME}
+
+        asyncio.run(scenario())
+
+
+class TestServerSentEvents:
+    """Teste pentru fluxul SSE"""
+
+    def test_stream_until_game_over(self, app):
+        """Test că fluxul primește ghicirile și se încheie la sfârșitul jocului"""
+        async def scenario():
+            game_id = (await _post(app, '/start_game', {'difficulty': 'usor'}))['game_id']
+            scope = {'type': 'http', 'method': 'GET', 'path': '/events', 'headers': [],
+                     'query_string': f'game_id={game_id}'.encode()}
+            sse = Connection(app, scope, {'type': 'http.request', 'body': b''})
+            start = await sse.next()
+            assert start['status'] == 200
+            assert dict(start['headers'])[b'content-type'] == b'text/event-stream'
+            assert (await sse.next())['body'].startswith(b'data: {"type":"state"')
+
+            frames = []
+            for letter in 'ETAOINSHRDLCUMWFGYPBVKJXQZ':
+                await _post(app, '/guess', {'game_id': game_id, 'letter': letter})
+                message = await sse.next()
+                frames += [json.loads(line[6:]) for line in message['body'].split(b'\n\n')
+                           if line.startswith(b'data: ')]
+                if not message['more_body']:
+                    break
+            assert frames[-1]['type'] == 'game_over'
+            await asyncio.wait_for(sse.task, 3.0)
+
+        asyncio.run(scenario())
+
+    def test_unknown_game(self, app):
+        async def scenario():
+            scope = {'type': 'http', 'method': 'GET', 'path': '/events', 'headers': [],
+                     'query_string': b'game_id=missing'}
+            sse = Connection(app, scope, {'type': 'http.request', 'body': b''})
+            assert (await sse.next())['status'] == 400
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,186 @@
+"""
+Teste pentru bugetele de latență, cererile dublate și circuit breaker
+"""
+
+import itertools
+import time
+
+import pytest  # type: ignore
+
+from src.hangman_3d.api_client import HEDGE_MAX_RATIO, HEDGE_MIN_SAMPLES, APIClient
+from src.hangman_3d.resilience import CircuitBreaker, LatencyTracker, endpoint_of
+
+from .http_standin import StubAPI
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def stats_of(client, endpoint):
+    return {row['endpoint']: row for row in client.latency_stats()}[endpoint]
+
+
+class TestEndpoint:
+    """Teste pentru etichetele endpoint-urilor"""
+
+    @pytest.mark.parametrize('path,expected', [
+        ('/posts?_limit=10', '/posts'),
+        ('/posts/12/comments', '/posts/{id}/comments'),
+        ('/users/3', '/users/{id}'),
+        ('/comments?postId=1&postId=2', '/comments'),
+        ('', '/'),
+    ])
+    def test_endpoint_of(self, path, expected):
+        assert endpoint_of(path) == expected
+
+
+class TestCircuitBreaker:
+    """Teste pentru stările circuit breaker-ului"""
+
+    def test_opens_and_recovers(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+        clock.now += 10
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()  # o singură probă
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    def test_success_resets_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestLatencyTracker:
+    """Teste pentru percentilele latențelor recente"""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker(window=100)
+        for ms in range(1, 201):
+            tracker.observe('/posts', ms / 1000)
+        assert tracker.percentile('/posts', 95) == pytest.approx(0.195)
+        assert tracker.percentile('/posts', 95, min_samples=101) is None
+        assert tracker.percentile('/users', 95) is None
+        tracker.count('/posts', 'hedged', 2)
+        [row] = tracker.summary()
+        assert row['hedged'] == 2 and row['p50_ms'] == 150.0 and row['max_ms'] == 200.0
+
+
+class TestClient:
+    """Teste pe serverul stub cu întârzieri și erori injectate"""
+
+    @pytest.fixture
+    def api(self):
+        with StubAPI() as server:
+            yield server
+
+    def test_retry_on_server_error(self, api):
+        api.fail_next = 1
+        with APIClient(api.url) as client:
+            assert len(client.fetch_users()) == 10
+            assert stats_of(client, '/users')['retries'] == 1
+            assert api.requests == 2
+
+    def test_client_errors_not_retried(self, api):
+        with APIClient(f'{api.url}/missing') as client:
+            assert client.fetch_users() == []
+        assert api.requests == 1
+
+    def test_budget_bounds_slow_call(self, api):
+        """Test că un răspuns lent nu depășește bugetul endpoint-ului"""
+        api.delay = 0.5
+        with APIClient(api.url, budgets={'/users': 0.15}, hedge=False) as client:
+            start = time.perf_counter()
+            assert client.fetch_users() == []
+            assert time.perf_counter() - start < 0.4
+            row = stats_of(client, '/users')
+            assert row['budget_exceeded'] == 1 and row['errors'] == 1
+
+    def test_hedged_request_wins(self, api):
+        """Test că o cerere lentă este dublată după p95 și câștigă dublura"""
+        with APIClient(api.url) as client:
+            for _ in range(HEDGE_MIN_SAMPLES):
+                client.fetch_comments(1)
+            calls = itertools.count()
+            api.delay = lambda path: 0.5 if next(calls) == 0 else 0.0
+            start = time.perf_counter()
+            assert len(client.fetch_comments(2)) == 5
+            assert time.perf_counter() - start < 0.3
+            row = stats_of(client, '/posts/{id}/comments')
+            assert row['hedged'] == 1 and row['hedge_wins'] == 1
+            assert row['requests'] == HEDGE_MIN_SAMPLES + 1
+
+    def test_hedge_rate_capped(self, api):
+        """Test că un server încetinit uniform nu primește dubluri pentru fiecare cerere"""
+        with APIClient(api.url, budgets={'/users': 2}) as client:
+            for _ in range(HEDGE_MIN_SAMPLES):
+                client.fetch_users()
+            api.delay = 0.02
+            for _ in range(20):
+                client.fetch_users()
+            row = stats_of(client, '/users')
+            assert 1 <= row['hedged'] <= HEDGE_MAX_RATIO * row['requests']
+
+    def test_no_hedge_without_history(self, api):
+        api.delay = 0.05
+        with APIClient(api.url) as client:
+            client.fetch_users()
+            assert stats_of(client, '/users')['hedged'] == 0
+        assert api.requests == 1
+
+    def test_circuit_breaker_fails_fast(self, api):
+        """Test că serverul căzut nu mai primește cereri cât circuitul este deschis"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+        api.fail_next = 100
+        with APIClient(api.url, max_retries=0, breaker=breaker) as client:
+            assert client.fetch_posts() == [] and client.fetch_users() == []
+            assert breaker.state == CircuitBreaker.OPEN
+            assert client.fetch_posts() == []
+            assert api.requests == 2
+            assert stats_of(client, '/posts')['rejected'] == 1
+
+            api.fail_next = 0
+            clock.now += 30
+            assert len(client.fetch_posts(limit=3)) == 3
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_probe_crash_reopens(self, api, monkeypatch):
+        """Test că o probă încheiată cu o excepție neașteptată nu blochează circuitul"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        with APIClient(api.url, breaker=breaker) as client:
+            with monkeypatch.context() as patch:
+                patch.setattr(client, '_attempt', lambda *args: 1 / 0)
+                with pytest.raises(ZeroDivisionError):
+                    client.fetch_posts()
+            assert breaker.state == CircuitBreaker.OPEN
+            clock.now += 30
+            assert len(client.fetch_posts(limit=3)) == 3
+            assert breaker.state == CircuitBreaker.CLOSED
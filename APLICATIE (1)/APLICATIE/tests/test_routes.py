@@ -65,5 +65,101 @@ def test_guess_after_start(client):
     assert 'correct' in data
 
 
+def test_games_are_isolated_per_client():
+    """Test jocuri independente pentru clienți diferiți"""
+    app = create_app('testing')
+    first = app.test_client()
+    second = app.test_client()
+
+    first.post('/start_game', json={})
+    second.post('/start_game', json={'difficulty': 'usor'})
+
+    # Primul client își termină jocul
+    for letter in 'ZYXWVUTSRQPONMLKJIHGFEDCB':
+        data = first.post('/guess', json={'letter': letter}).get_json()
+        if data.get('game_over'):
+            break
+    assert data['game_over']
+
+    # Jocul celui de-al doilea client nu este afectat
+    response = second.post('/guess', json={'letter': 'A'})
+    assert response.status_code == 200
+    assert not response.get_json()['game_over']
+
+
+def test_guess_with_explicit_game_id(client):
+    """Test ghicire folosind game_id din corpul cererii"""
+    game_id = client.post('/start_game', json={}).get_json()['game_id']
+    client.delete_cookie('game_id')
+
+    response = client.post('/guess', json={'letter': 'E'})
+    assert response.status_code == 400
+
+    response = client.post('/guess', json={'letter': 'E', 'game_id': game_id})
+    assert response.status_code == 200
+
+
+def test_update_time_is_read_only(client):
+    """Test /update_time ignoră timpul trimis de client"""
+    client.post('/start_game', json={'difficulty': 'expert'})
+
+    response = client.post('/update_time', json={'time_left': 0})
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['success']
+    assert data['time_left'] > 140
+
+    response = client.get('/update_time')
+    assert response.get_json()['time_left'] <= 150
+
+
+def test_guess_batch(client):
+    """Test ghicire în lot: rezultate per literă și stare finală"""
+    client.post('/start_game', json={'difficulty': 'usor'})
+
+    response = client.post('/guess_batch', json={'letters': ['E', 'e', 'T']})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [r['letter'] for r in data['results']] == ['E', 'E', 'T']
+    assert data['results'][0]['success']
+    assert not data['results'][1]['success']
+    assert 'displayed_word' in data
+
+
+def test_guess_batch_stops_at_game_over(client):
+    """Test lotul se oprește când jocul s-a încheiat"""
+    client.post('/start_game', json={})
+
+    response = client.post('/guess_batch', json={'letters': 'ZYXWVUTSRQPONMLKJIHGFEDCBA'})
+    data = response.get_json()
+    assert data['game_over']
+    assert len(data['results']) < 26
+    assert data['word']
+
+
+def test_guess_batch_validation(client):
+    """Test validare lot"""
+    client.post('/start_game', json={})
+
+    assert client.post('/guess_batch', json={'letters': []}).status_code == 400
+    assert client.post('/guess_batch', json={'letters': 5}).status_code == 400
+    assert client.post('/guess_batch', json={'letters': ['A'] * 27}).status_code == 400
+
+
+def test_hint(client):
+    """Test recomandare literă pentru jocul curent"""
+    pytest.importorskip('numpy')
+    assert client.get('/hint').status_code == 400
+
+    client.post('/start_game', json={'difficulty': 'usor'})
+    response = client.get('/hint')
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert len(data['letter']) == 1
+    assert data['candidates'] >= 1
+    assert 0 < data['probability'] <= 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,149 @@
+"""
+Teste pentru serverul preforkat
+"""
+
+import gc
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest  # type: ignore
+
+from src.hangman_3d.config import ProductionConfig, TestingConfig
+from src.hangman_3d.server import PreforkServer, server_options, worker_count
+from flask import Config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Aplicație WSGI minimală care răspunde cu PID-ul worker-ului
+SERVER_SCRIPT = """
+import os, sys
+sys.path.insert(0, {root!r})
+from src.hangman_3d.server import PreforkServer
+
+def load_app():
+    def app(environ, start_response):
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [str(os.getpid()).encode()]
+    return app
+
+PreforkServer(load_app, host='127.0.0.1', port={port}, workers=2,
+              max_requests={max_requests}, graceful_timeout=5).run()
+"""
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason="necesită os.fork")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _get(port: int) -> int:
+    with urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=5) as response:
+        return int(response.read())
+
+
+def _wait_ready(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _get(port)
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError("serverul nu a pornit")
+
+
+@pytest.fixture
+def server(request):
+    port = _free_port()
+    script = SERVER_SCRIPT.format(root=ROOT, port=port,
+                                  max_requests=getattr(request, 'param', 3))
+    process = subprocess.Popen([sys.executable, '-c', script])
+    try:
+        _wait_ready(port)
+        yield process, port
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+class TestOptions:
+    """Teste pentru configurație"""
+
+    def test_worker_count(self):
+        assert worker_count(3) == 3
+        assert worker_count(0) == (os.cpu_count() or 1)
+
+    def test_production_config_drives_server(self):
+        """Test că ProductionConfig pornește un worker per nucleu, cu reciclare"""
+        app_config = Config('')
+        app_config.from_object(ProductionConfig)
+        options = server_options(app_config)
+        assert options['workers'] == worker_count(ProductionConfig.SERVER_WORKERS)
+        assert options['max_requests'] > 0
+
+        app_config.from_object(TestingConfig)
+        assert server_options(app_config)['workers'] == 1
+
+
+class TestReload:
+    """Teste pentru reîncărcarea aplicației în master"""
+
+    def test_failed_reload_keeps_workers(self, monkeypatch):
+        """Test că o aplicație nouă care nu pornește nu oprește worker-ii vechi"""
+        def broken_factory():
+            raise RuntimeError("configurație invalidă")
+
+        monkeypatch.setattr(gc, 'freeze', lambda: None)  # nu îngheța procesul de test
+        server = PreforkServer(lambda: 'vechea aplicație', workers=2)
+        server.preload()
+        server.children = {101: 0.0, 102: 0.0}
+        killed = []
+        monkeypatch.setattr(server, '_spawn', lambda: pytest.fail("worker nou pornit"))
+        monkeypatch.setattr(server, '_kill', lambda pid, signum: killed.append(pid))
+        server.app_factory = broken_factory
+        server.reload()
+        assert server.app == 'vechea aplicație'
+        assert killed == [] and set(server.children) == {101, 102}
+
+
+class TestPreforkServer:
+    """Teste de integrare (master în subproces)"""
+
+    def test_workers_recycled(self, server):
+        """Test că worker-ii sunt înlocuiți după max_requests cereri"""
+        process, port = server
+        pids = {_get(port) for _ in range(20)}
+        assert len(pids) > 2
+        assert process.pid not in pids
+
+    @pytest.mark.parametrize('server', [0], indirect=True)
+    def test_graceful_reload(self, server):
+        """Test că SIGHUP înlocuiește worker-ii fără să refuze cereri"""
+        process, port = server
+        before = {_get(port) for _ in range(10)}
+        assert len(before) <= 2
+        process.send_signal(signal.SIGHUP)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            # Fiecare cerere trebuie să primească răspuns în timpul reîncărcării
+            if _get(port) not in before:
+                break
+        else:
+            pytest.fail("worker-ii nu au fost înlocuiți")
+
+    def test_graceful_stop(self, server):
+        """Test că SIGTERM oprește master-ul și worker-ii"""
+        process, port = server
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=10) == 0
+        with pytest.raises(OSError):
+            _get(port)
@@ -0,0 +1,245 @@
+"""
+Teste pentru registrul de sesiuni de joc
+"""
+
+import threading
+import time
+import pytest  # type: ignore
+from src.hangman_3d.models import GameState
+from src.hangman_3d.sessions import (
+    MemorySessionStore, SQLiteSessionStore, RedisSessionStore, SessionConflictError
+)
+from src.hangman_3d.routes import actions
+from .resp_standin import RespStandIn
+
+
+class FakeClock:
+    """Ceas controlat manual pentru testele de expirare"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemorySessionStore:
+    """Teste pentru MemorySessionStore"""
+
+    def test_create_and_get(self):
+        """Test înregistrare și regăsire joc"""
+        registry = MemorySessionStore()
+        game = GameState()
+        game_id = registry.create(game)
+
+        assert registry.get(game_id) is game
+        assert registry.get('inexistent') is None
+        assert len(registry) == 1
+
+    def test_ttl_expiry(self):
+        """Test eliminare joc abandonat după TTL"""
+        clock = FakeClock()
+        registry = MemorySessionStore(ttl=10, clock=clock)
+        game_id = registry.create(GameState())
+
+        clock.now = 5
+        assert registry.get(game_id) is not None
+        clock.now = 14
+        assert registry.get(game_id) is not None
+        clock.now = 25
+        assert registry.get(game_id) is None
+
+    def test_purge_expired(self):
+        """Test curățare globală a jocurilor expirate"""
+        clock = FakeClock()
+        registry = MemorySessionStore(ttl=10, stripes=4, clock=clock)
+        for _ in range(20):
+            registry.create(GameState())
+
+        clock.now = 11
+        assert registry.purge_expired() == 20
+        assert len(registry) == 0
+
+    def test_lru_eviction(self):
+        """Test limitarea memoriei prin eliminarea celui mai vechi joc"""
+        registry = MemorySessionStore(max_sessions=2, stripes=1)
+        first = registry.create(GameState())
+        second = registry.create(GameState())
+        registry.get(first)
+        third = registry.create(GameState())
+
+        assert registry.get(second) is None
+        assert registry.get(first) is not None
+        assert registry.get(third) is not None
+
+    def test_locked_is_exclusive(self):
+        """Test ghiciri concurente pe același joc rămân consistente"""
+        registry = MemorySessionStore(stripes=1)
+        game = GameState()
+        game.max_wrong = 100
+        game_id = registry.create(game)
+        wrong = [l for l in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' if l not in game.word]
+
+        def worker():
+            for letter in wrong:
+                with registry.locked(game_id) as state:
+                    state.guess_letter(letter)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert game.wrong_guesses == len(wrong)
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'redis'])
+def store(request, tmp_path):
+    """Fiecare backend de sesiuni, pe rând"""
+    if request.param == 'memory':
+        yield MemorySessionStore()
+    elif request.param == 'sqlite':
+        backend = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        yield backend
+        backend.close()
+    else:
+        server = RespStandIn().start()
+        backend = RedisSessionStore(server.url)
+        yield backend
+        backend.close()
+        server.stop()
+
+
+class TestSessionStoreBackends:
+    """Teste comune pentru toate backend-urile SessionStore"""
+
+    def test_create_get_update(self, store):
+        """Test ciclu complet: creare, citire, actualizare"""
+        game = GameState('usor')
+        game_id = store.create(game)
+
+        loaded = store.get(game_id)
+        assert loaded.word == game.word
+        assert loaded.difficulty == 'usor'
+
+        result = store.update(game_id, lambda g: g.guess_letter(game.word[0]))
+        assert result['success']
+        assert result['correct']
+        assert game.word[0] in store.get(game_id).guessed_letters
+
+    def test_missing_game(self, store):
+        """Test joc inexistent"""
+        assert store.get('lipsa') is None
+        assert store.update('lipsa', lambda g: g.guess_letter('A')) is None
+
+    def test_delete(self, store):
+        """Test eliminare joc"""
+        game_id = store.create(GameState())
+        assert store.delete(game_id)
+        assert store.get(game_id) is None
+        assert len(store) == 0
+
+
+class TestReadOnlyActions:
+    """Teste pentru citirile de timp/stare fără scrieri în backend"""
+
+    def test_status_does_not_write(self, tmp_path):
+        """Test că /update_time și snapshot nu incrementează versiunea"""
+        backend = SQLiteSessionStore(str(tmp_path / 'reads.db'))
+        game_id = backend.create(GameState())
+        version = backend._load(game_id)[0]
+
+        assert actions.status(backend, game_id)[0]['success']
+        assert actions.snapshot(backend, game_id)[0]['game_over'] is False
+        assert backend._load(game_id)[0] == version
+
+    def test_expiry_written_once(self, store):
+        """Test că expirarea timpului se salvează o singură dată"""
+        game = GameState()
+        game.deadline = time.monotonic() - 1
+        game_id = store.create(game)
+
+        assert actions.status(store, game_id)[0]['time_up']
+        assert store.get(game_id).game_over
+        if isinstance(store, SQLiteSessionStore):
+            version = store._load(game_id)[0]
+            assert actions.snapshot(store, game_id)[0]['game_over']
+            assert store._load(game_id)[0] == version
+
+    def test_hint_checks_expiry(self, store):
+        """Test că indiciul cerut după termen încheie jocul și raportează time_up"""
+        game = GameState()
+        game.deadline = time.monotonic() - 1
+        game_id = store.create(game)
+
+        result, status = actions.hint(store, game_id)
+        assert status == 400
+        assert result['time_up'] and result['word'] == game.word
+        assert store.get(game_id).game_over
+        assert actions.hint(store, game_id)[1] == 400
+
+
+class TestCompareAndSet:
+    """Teste pentru compare-and-set în backend-urile serializate"""
+
+    def test_stale_version_rejected(self, tmp_path):
+        """Test scriere cu versiune veche respinsă"""
+        backend = SQLiteSessionStore(str(tmp_path / 'cas.db'))
+        game_id = backend.create(GameState())
+        version, data = backend._load(game_id)
+
+        assert backend._compare_and_set(game_id, version, data)
+        assert not backend._compare_and_set(game_id, version, data)
+
+    def test_redis_stale_version_rejected(self):
+        """Test CAS prin script Lua pe serverul RESP"""
+        server = RespStandIn().start()
+        try:
+            backend = RedisSessionStore(server.url)
+            game_id = backend.create(GameState())
+            version, data = backend._load(game_id)
+
+            assert backend._compare_and_set(game_id, version, data)
+            assert not backend._compare_and_set(game_id, version, data)
+            backend.close()
+        finally:
+            server.stop()
+
+    def test_redis_reconnects_after_timeout(self):
+        """Test că un răspuns întârziat nu ajunge la comanda următoare"""
+        server = RespStandIn().start()
+        try:
+            backend = RedisSessionStore(server.url, timeout=0.2)
+            first = GameState('usor')
+            second = GameState('expert')
+            first_id, second_id = backend.create(first), backend.create(second)
+
+            server.stall_next = 0.5
+            with pytest.raises(OSError):
+                backend.get(first_id)
+            # Restul primului răspuns sosește pe vechea conexiune, nu pe cea nouă
+            time.sleep(0.4)
+            assert backend.get(second_id).word == second.word
+            assert backend.get(first_id).word == first.word
+            backend.close()
+        finally:
+            server.stop()
+
+    def test_conflict_exhausts_retries(self, tmp_path):
+        """Test eroare după conflicte repetate"""
+        backend = SQLiteSessionStore(str(tmp_path / 'conflict.db'))
+        other = SQLiteSessionStore(str(tmp_path / 'conflict.db'))
+        game_id = backend.create(GameState())
+
+        def interfering(game):
+            # Un alt worker scrie între citire și CAS
+            other.update(game_id, lambda g: None)
+            return {}
+
+        with pytest.raises(SessionConflictError):
+            backend.update(game_id, interfering)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,90 @@
+"""
+Teste pentru simularea self-play
+"""
+
+import csv
+
+import pytest  # type: ignore
+
+from src.hangman_3d.csv_exporter import CSVExporter
+from src.hangman_3d.dictionary import DIFFICULTIES
+from src.hangman_3d.simulation import (
+    STRATEGIES, export_results, play_game, run_simulation
+)
+
+
+class TestStrategies:
+    """Teste pentru strategiile de ghicire"""
+
+    @pytest.mark.parametrize('name', ['random', 'frequency'])
+    def test_game_always_finishes(self, name):
+        """Test că fiecare joc se termină fără litere repetate"""
+        import random
+        strategy = STRATEGIES[name]()
+        rng = random.Random(1)
+        for difficulty in DIFFICULTIES:
+            won, guesses, wrong = play_game(difficulty, strategy, rng)
+            assert wrong <= 6
+            assert guesses <= 26
+            assert won or wrong == 6
+
+    def test_solver_strategy(self):
+        """Test că solver-ul câștigă pe dicționarul implicit"""
+        pytest.importorskip('numpy')
+        result = run_simulation(40, 'solver', workers=1, chunk_size=10)
+        assert all(stats.win_rate == 1.0 for stats in result.stats.values())
+
+
+class TestRunSimulation:
+    """Teste pentru distribuirea pe loturi și agregare"""
+
+    def test_counts_per_difficulty(self):
+        """Test că jocurile sunt împărțite egal pe niveluri"""
+        result = run_simulation(200, 'frequency', workers=1, chunk_size=30)
+        assert result.games == 200
+        assert sum(s.games for s in result.stats.values()) == 200
+        assert all(s.games == 50 for s in result.stats.values())
+        assert all(sum(s.guesses.values()) == s.games for s in result.stats.values())
+        assert result.games_per_second > 0
+
+    def test_reproducible(self):
+        """Test că aceeași sămânță dă aceleași rezultate"""
+        first = run_simulation(100, 'random', workers=1, chunk_size=25, seed=7)
+        second = run_simulation(100, 'random', workers=1, chunk_size=25, seed=7)
+        assert {d: s.guesses for d, s in first.stats.items()} == \
+            {d: s.guesses for d, s in second.stats.items()}
+
+    def test_process_pool_matches_in_process(self):
+        """Test că rezultatele din pool coincid cu rularea în proces"""
+        local = run_simulation(120, 'frequency', workers=1, chunk_size=20, seed=3)
+        pooled = run_simulation(120, 'frequency', workers=2, chunk_size=20, seed=3)
+        assert {d: s.guesses for d, s in local.stats.items()} == \
+            {d: s.guesses for d, s in pooled.stats.items()}
+
+    def test_unknown_strategy(self):
+        """Test pentru strategie necunoscută"""
+        with pytest.raises(ValueError):
+            run_simulation(10, 'oracle')
+
+    def test_export(self, tmp_path):
+        """Test pentru exportul CSV"""
+        result = run_simulation(40, 'frequency', workers=1)
+        summary, distribution, wrong = export_results(result, CSVExporter(str(tmp_path)))
+
+        with open(summary, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['difficulty'] for row in rows] == list(DIFFICULTIES)
+        assert sum(int(row['games']) for row in rows) == 40
+
+        with open(distribution, newline='', encoding='utf-8') as f:
+            assert sum(int(row['games']) for row in csv.DictReader(f)) == 40
+
+        with open(wrong, newline='', encoding='utf-8') as f:
+            wrong_rows = list(csv.DictReader(f))
+        assert sum(int(row['games']) for row in wrong_rows) == 40
+        assert all(0 <= int(row['wrong']) <= 6 for row in wrong_rows)
+        assert all(0 <= float(row['mean_wrong']) <= 6 for row in rows)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,84 @@
+"""
+Teste pentru solver-ul pe bitset-uri
+"""
+
+import pytest  # type: ignore
+
+pytest.importorskip('numpy')
+
+from src.hangman_3d.dictionary import WordDictionary  # noqa: E402
+from src.hangman_3d.dictionary.solver import HangmanSolver  # noqa: E402
+
+WORDS = {
+    'usor': ['CAT', 'COT', 'CUT', 'DOG', 'HAT'],
+    'mediu': ['PYTHON', 'GARDEN', 'BANANA', 'CASTLE'],
+}
+
+
+@pytest.fixture(scope='module')
+def solver():
+    """Solver peste un dicționar mic"""
+    return HangmanSolver(WordDictionary.from_words(WORDS))
+
+
+def _brute_force(pattern, wrong):
+    """Filtrare naivă, pentru comparație"""
+    revealed = set(pattern) - {'_'}
+    result = []
+    for words in WORDS.values():
+        for word in words:
+            if len(word) != len(pattern) or set(wrong) & set(word):
+                continue
+            if all((p == '_' and c not in revealed) or p == c for p, c in zip(pattern, word)):
+                result.append(word)
+    return sorted(result)
+
+
+class TestHangmanSolver:
+    """Teste pentru HangmanSolver"""
+
+    @pytest.mark.parametrize('pattern,wrong', [
+        ('___', ''),
+        ('C_T', ''),
+        ('C_T', 'A'),
+        ('_AT', 'C'),
+        ('_A_A_A', ''),
+        ('______', 'N'),
+        ('____', ''),
+    ])
+    def test_matches_brute_force(self, solver, pattern, wrong):
+        """Test candidații coincid cu filtrarea naivă"""
+        assert sorted(solver.candidates(pattern, wrong)) == _brute_force(pattern, wrong)
+
+    def test_revealed_letter_excluded_from_hidden_positions(self, solver):
+        """Test o literă dezvăluită nu poate apărea pe o poziție ascunsă"""
+        assert list(solver.candidates('_A____', '')) == ['GARDEN', 'CASTLE']
+
+    def test_suggest(self, solver):
+        """Test recomandarea literei cu cea mai mare probabilitate"""
+        hint = solver.suggest('C_T', '')
+
+        assert hint.candidates == 3
+        assert hint.letter in ('A', 'O', 'U')
+        assert hint.probability == pytest.approx(1 / 3)
+        assert 'C' not in hint.letter_counts
+
+    def test_tie_broken_by_information(self):
+        """Test că la aceeași probabilitate câștigă litera care separă candidații"""
+        solver = HangmanSolver(WordDictionary.from_words({'usor': ['BAB', 'BAC', 'CAB']}))
+        hint = solver.suggest('___', '')
+
+        # A și B apar în toți candidații, dar A e mereu pe poziția din mijloc
+        assert hint.letter_counts['A'] == hint.letter_counts['B'] == 3
+        assert hint.letter == 'B'
+        assert hint.probability == 1.0
+
+    def test_no_candidates(self, solver):
+        """Test stare imposibilă"""
+        hint = solver.suggest('Z__', '')
+        assert hint.letter is None
+        assert hint.candidates == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,129 @@
+"""
+Teste pentru includerea Three.js în folderul static
+"""
+
+import io
+import os
+import re
+import sys
+import tarfile
+
+import pytest  # type: ignore
+
+from src.hangman_3d import vendor
+from src.hangman_3d import create_app
+from src.hangman_3d.assets import CDN_FALLBACKS, AssetManifest, MissingAssetError, build_assets
+from src.hangman_3d.config import ProductionConfig
+
+STATIC = os.path.join(os.path.dirname(__file__), '..', 'static')
+GAME_JS = os.path.join(STATIC, 'js', 'game.js')
+
+FAKE_ESBUILD = '''
+import sys
+args = sys.argv[1:]
+out = next(a.split("=", 1)[1] for a in args if a.startswith("--outfile="))
+with open(args[0]) as entry, open(out, "w") as f:
+    f.write("/* " + " ".join(args[1:]) + " */" + entry.read())
+'''
+
+
+def _package(*extra):
+    """Arhivă .tgz cu structura pachetului npm three (plus intrările extra)"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for name, data in [('package/build/three.min.js', b'var THREE={};'),
+                           ('package/build/three.module.js', b'export class Scene {}'),
+                           *extra]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class TestThreeBundle:
+    """Teste pentru bundle-ul Three.js"""
+
+    def test_exports_cover_scene(self):
+        """Test că bundle-ul redus conține toate clasele folosite de scenă"""
+        with open(GAME_JS, encoding='utf-8') as f:
+            used = set(re.findall(r'THREE\.(\w+)', f.read()))
+        assert used <= set(vendor.THREE_EXPORTS)
+
+    def test_full_build_without_esbuild(self, tmp_path, monkeypatch):
+        """Test că fără esbuild se copiază build-ul complet"""
+        monkeypatch.setattr(vendor, '_esbuild', lambda: None)
+        output = tmp_path / 'vendor' / 'three.min.js'
+        assert vendor.build_three(_package(), str(output)) is False
+        assert output.read_bytes() == b'var THREE={};'
+
+    @pytest.mark.parametrize('data_filter', [True, False])
+    def test_rejects_paths_outside_workdir(self, tmp_path, monkeypatch, data_filter):
+        """Test că o arhivă cu ../ nu scrie în afara directorului temporar,
+        și pe Python-urile fără tarfile.data_filter (sub 3.11.4)"""
+        if not data_filter:
+            monkeypatch.delattr(tarfile, 'data_filter', raising=False)
+        monkeypatch.setattr(vendor, '_esbuild', lambda: None)
+        output = tmp_path / 'vendor' / 'three.min.js'
+        with pytest.raises((ValueError, tarfile.TarError)):
+            vendor.build_three(_package(('../../evil.js', b'x')), str(output))
+        assert not output.exists()
+        assert vendor.build_three(_package(), str(output)) is False
+
+    def test_trimmed_build(self, tmp_path, monkeypatch):
+        """Test că esbuild primește modulul de intrare redus, ca IIFE global THREE"""
+        script = tmp_path / 'esbuild.py'
+        script.write_text(FAKE_ESBUILD)
+        monkeypatch.setattr(vendor, '_esbuild', lambda: [sys.executable, str(script)])
+        output = tmp_path / 'vendor' / 'three.min.js'
+
+        assert vendor.build_three(_package(), str(output)) is True
+        bundle = output.read_text()
+        assert '--global-name=THREE' in bundle
+        assert 'export { Scene, PerspectiveCamera' in bundle
+
+
+class TestAssetUrl:
+    """Teste pentru URL-ul Three.js injectat în pagină"""
+
+    def test_cdn_only_on_request(self, tmp_path):
+        """Test că CDN-ul se folosește doar cu fallback-uri explicite"""
+        assert vendor.THREE_ASSET in CDN_FALLBACKS
+        assert AssetManifest(str(tmp_path)).url(vendor.THREE_ASSET) == '/static/vendor/three.min.js'
+        manifest = AssetManifest(str(tmp_path), fallbacks=CDN_FALLBACKS)
+        assert manifest.url(vendor.THREE_ASSET) == CDN_FALLBACKS[vendor.THREE_ASSET]
+
+    def test_missing_bundle_fails(self, tmp_path):
+        """Test că build-ul și pornirea în producție refuză o instalare fără Three.js"""
+        with pytest.raises(MissingAssetError):
+            build_assets(str(tmp_path))
+        assert not (tmp_path / 'dist').exists()
+        assert vendor.THREE_ASSET not in build_assets(str(tmp_path), cdn_fallback=True)
+
+        with pytest.raises(MissingAssetError):
+            AssetManifest(str(tmp_path)).check_vendored(production=True)
+        AssetManifest(str(tmp_path)).check_vendored(production=False)
+        AssetManifest(str(tmp_path), fallbacks=CDN_FALLBACKS).check_vendored(production=True)
+
+    @pytest.mark.skipif(os.path.isfile(os.path.join(STATIC, *vendor.THREE_ASSET.split('/'))),
+                        reason="Three.js este deja inclus")
+    def test_production_app_requires_bundle(self, monkeypatch):
+        monkeypatch.setattr(ProductionConfig, 'ASSET_CDN_FALLBACK', False)
+        with pytest.raises(MissingAssetError):
+            create_app('production')
+        monkeypatch.setattr(ProductionConfig, 'ASSET_CDN_FALLBACK', True)
+        monkeypatch.setattr(ProductionConfig, 'SESSION_BACKEND', 'memory')
+        with create_app('production').test_client() as client:
+            assert CDN_FALLBACKS[vendor.THREE_ASSET].encode() in client.get('/').data
+
+    def test_self_hosted_and_fingerprinted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vendor, '_esbuild', lambda: None)
+        vendor.build_three(_package(), str(tmp_path / 'vendor' / 'three.min.js'))
+        assert AssetManifest(str(tmp_path)).url(vendor.THREE_ASSET) == '/static/vendor/three.min.js'
+
+        hashed = build_assets(str(tmp_path))[vendor.THREE_ASSET]
+        assert re.fullmatch(r'vendor/three\.min\.[0-9a-f]{12}\.js', hashed)
+        assert AssetManifest(str(tmp_path)).url(vendor.THREE_ASSET) == f'/static/dist/{hashed}'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])